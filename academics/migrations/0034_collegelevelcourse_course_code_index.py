@@ -0,0 +1,18 @@
+# Generated manually to index CollegeLevelCourse.course_code (courses are looked up and joined by code)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0033_add_collegelevelcourse_admission_year'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='collegelevelcourse',
+            name='course_code',
+            field=models.CharField(max_length=50, db_index=True),
+        ),
+    ]
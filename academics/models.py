@@ -17,7 +17,7 @@ class Branch(models.Model):
 class CollegeLevelCourse(models.Model):
     department = models.CharField(max_length=100, default="All Branches")
     course_category = models.CharField(max_length=100)
-    course_code = models.CharField(max_length=50)
+    course_code = models.CharField(max_length=50, db_index=True)
     course_title = models.CharField(max_length=200)
     
     # NEW: semester field (nullable for safe migration)
@@ -990,10 +990,9 @@ def generate_faculty_syllabus_pdf(request, course, syllabus, course_alloc=None,
                 fpdf.approved = True
                 fpdf.rejected = False
 
-                # Save file content
+                # Save file content; this also INSERTs the unsaved row (with the approval flags) in one save()
                 filename = f"{getattr(course, 'course_code', 'syllabus')}_syllabus_{timezone.now().strftime('%Y%m%d%H%M%S')}.pdf"
-                fpdf.pdf_file.save(filename, ContentFile(pdf_bytes))
-                fpdf.save()
+                fpdf.pdf_file.save(filename, ContentFile(pdf_bytes), save=True)
                 # simple success message (no inline links shown on faculty dashboard)
                 messages.success(request, "Generated PDF saved and will be included in combined syllabi.")
         except Exception as e:
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class HodConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'hod'
+
+    def ready(self):
+        # Register cache invalidation for the faculty list used by the scheme forms
+        import hod.signals  # noqa: F401
@@ -0,0 +1,18 @@
+# Generated manually to index SchemeDocument.created_at (activity history orders by it)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hod', '0004_add_rejected_fields_to_facultysyllabuspdf'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='schemedocument',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated manually to index FacultySyllabusPDF by branch/year/semester/course, newest first
+# (the latest PDF per course is read with that filter and order)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hod', '0005_schemedocument_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='facultysyllabuspdf',
+            index=models.Index(fields=['branch', 'year', 'semester', 'course', '-created_at'], name='fsp_branch_yr_sem_crs_idx'),
+        ),
+    ]
@@ -190,7 +190,7 @@ class SchemeDocument(models.Model):
     title = models.CharField(max_length=255, default='Scheme PDF')
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
     pdf_file = models.FileField(upload_to='hod/schemes/%Y/%m/%d/', null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
@@ -248,6 +248,10 @@ class FacultySyllabusPDF(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # latest PDF per course for a branch/year/semester: filter on the prefix, read in index order
+            models.Index(fields=['branch', 'year', 'semester', 'course', '-created_at'], name='fsp_branch_yr_sem_crs_idx'),
+        ]
 
     def __str__(self):
         branch_name = self.branch.name if self.branch else "NoBranch"
@@ -0,0 +1,19 @@
+# hod/signals.py
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from users.models import CustomUser
+
+# Cache key for the active faculty list shown in the scheme forms (see hod.views._active_faculty_list)
+FACULTY_LIST_CACHE_KEY = "hod:faculty_list_active"
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_faculty_list(sender, instance, **kwargs):
+    """
+    Drop the cached faculty list whenever a user is saved or deleted.
+    A role or is_active change can move a user in or out of the list, so any save invalidates it.
+    """
+    cache.delete(FACULTY_LIST_CACHE_KEY)
@@ -1,9 +1,18 @@
-from django.test import TestCase, Client
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from PyPDF2 import PdfReader
+from reportlab.pdfgen import canvas
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.core.files.base import ContentFile
 from django.contrib.auth import get_user_model
 from django.apps import apps
 
+from hod import views
+
 
 class CombinedPDFTest(TestCase):
     def setUp(self):
@@ -139,3 +148,80 @@ class CombinedPDFTest(TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertIn('application/pdf', resp['Content-Type'])
         self.assertIn('attachment; filename', resp.get('Content-Disposition', ''))
+
+
+def _text_pdf(text):
+    buf = BytesIO()
+    c = canvas.Canvas(buf)
+    c.drawString(50, 800, text)
+    c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+class CombinedPDFMergeOrderTest(TestCase):
+    """Selected faculty PDFs are merged in the posted order, with a placeholder page for any that fail."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        media_override = override_settings(MEDIA_ROOT=self.media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        User = get_user_model()
+        self.user = User.objects.create_user(email='hod@example.com', password='pass')
+        Branch = apps.get_model('academics', 'Branch')
+        self.branch = Branch.objects.create(code='CSE', name='Computer Science')
+        HODAssignment = apps.get_model('hod', 'HODAssignment')
+        HODAssignment.objects.create(hod_user=self.user, branch=self.branch)
+
+        FacultySyllabusPDF = apps.get_model('hod', 'FacultySyllabusPDF')
+        self.subs = {}
+        for key, content in [('a', _text_pdf('Faculty A')), ('broken', b'not a pdf'),
+                             ('unopenable', _text_pdf('Faculty U')), ('c', _text_pdf('Faculty C'))]:
+            sub = FacultySyllabusPDF.objects.create(branch=self.branch, year='2025', semester='1', approved=True)
+            sub.pdf_file.save(f'{key}.pdf', ContentFile(content))
+            self.subs[key] = sub
+
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _merged_page_texts(self):
+        unopenable_name = self.subs['unopenable'].pdf_file.name
+        open_stored_pdf = views._open_stored_pdf
+
+        def failing_open(fieldfile, open_files):
+            if fieldfile.name == unopenable_name:
+                raise OSError('storage unavailable')
+            return open_stored_pdf(fieldfile, open_files)
+
+        order = ['c', 'unopenable', 'broken', 'a']
+        url = reverse('hod:generate_combined_syllabus', args=[self.branch.pk])
+        data = {'year': '2025', 'semester': '1', 'latest_submissions': [str(self.subs[k].pk) for k in order]}
+        with mock.patch.object(views, '_open_stored_pdf', side_effect=failing_open):
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 200)
+        merged = PdfReader(BytesIO(b''.join(response.streaming_content)))
+        return [page.extract_text() for page in merged.pages]
+
+    def _assert_merged_in_order(self, texts):
+        self.assertEqual(len(texts), 4)
+        self.assertIn('Faculty C', texts[0])
+        self.assertIn(f"unreadable faculty PDF (id={self.subs['unopenable'].pk})", texts[1])
+        self.assertIn(f"unreadable faculty PDF (id={self.subs['broken'].pk})", texts[2])
+        self.assertIn('Faculty A', texts[3])
+
+    def test_merge_order_and_placeholders_without_reader_pool(self):
+        with override_settings(HOD_PDF_READ_THREADS=0):
+            self._assert_merged_in_order(self._merged_page_texts())
+
+    def test_merge_order_and_placeholders_with_reader_pool(self):
+        def reset_pool():
+            if views._PDF_READ_EXECUTOR is not None:
+                views._PDF_READ_EXECUTOR.shutdown()
+            views._PDF_READ_EXECUTOR = None
+        reset_pool()
+        self.addCleanup(reset_pool)
+        with override_settings(HOD_PDF_READ_THREADS=2):
+            self._assert_merged_in_order(self._merged_page_texts())
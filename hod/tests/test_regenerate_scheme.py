@@ -0,0 +1,78 @@
+"""
+Tests for regenerate_scheme: in the request by default, on the regen thread pool when
+HOD_PDF_REGEN_THREADS is set.
+"""
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from academics.models import Branch
+from hod import views
+from hod.models import SchemeDocument
+
+
+class _InlineExecutor:
+    """Runs submitted jobs immediately and records them."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args):
+        self.calls.append((fn, args))
+        fn(*args)
+
+
+class RegenerateSchemeTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        media_override = override_settings(MEDIA_ROOT=self.media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        user = get_user_model().objects.create_user(email='hod@example.com', password='pass')
+        self.client.force_login(user)
+        self.branch = Branch.objects.create(name='Information Science', code='IS')
+        self.scheme = SchemeDocument.objects.create(branch=self.branch, branch_name=self.branch.name,
+                                                    year=2025, semester=3)
+        self.scheme.pdf_file.save('old.pdf', ContentFile(b'%PDF-1.4 old'), save=True)
+        self.url = reverse('hod:regenerate_scheme', args=[self.scheme.pk])
+
+    @override_settings(HOD_PDF_REGEN_THREADS=0)
+    def test_regenerates_in_request_when_pool_disabled(self):
+        with mock.patch.object(views, '_build_complete_scheme_pdf', return_value=b'%PDF-1.4 rebuilt'):
+            with self.captureOnCommitCallbacks() as callbacks:
+                response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(callbacks, [])
+        self.scheme.refresh_from_db()
+        with self.scheme.pdf_file.open('rb') as f:
+            self.assertEqual(f.read(), b'%PDF-1.4 rebuilt')
+
+    @override_settings(HOD_PDF_REGEN_THREADS=1)
+    def test_background_job_keeps_concurrent_trash(self):
+        executor = _InlineExecutor()
+
+        def build_while_trashed(*args, **kwargs):
+            # the scheme is trashed while the job is building, after it loaded the row
+            SchemeDocument.objects.filter(pk=self.scheme.pk).update(is_deleted=True)
+            return b'%PDF-1.4 rebuilt'
+
+        with mock.patch.object(views, '_regen_executor', return_value=executor), \
+                mock.patch.object(views, '_build_complete_scheme_pdf', side_effect=build_while_trashed), \
+                mock.patch.object(views.connections, 'close_all'):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(executor.calls, [(views._regenerate_scheme_pdf, (self.scheme.pk, True))])
+        self.scheme.refresh_from_db()
+        self.assertTrue(self.scheme.is_deleted)
+        with self.scheme.pdf_file.open('rb') as f:
+            self.assertEqual(f.read(), b'%PDF-1.4 rebuilt')
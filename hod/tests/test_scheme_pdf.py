@@ -0,0 +1,45 @@
+"""
+Tests for the complete scheme PDF builder used by generate_pdf_view / create_scheme_quick.
+"""
+from io import BytesIO
+
+from django.test import TestCase
+
+from academics.models import Branch
+from hod import views
+
+
+class CompleteSchemePDFTest(TestCase):
+    """The constant front matter is rendered once and spliced in front of the scheme table."""
+
+    def setUp(self):
+        views._scheme_front_matter_pdf.cache_clear()
+        self.branch = Branch.objects.create(name="Information Science", code="IS")
+        self.main_rows = [{
+            'category': 'PCC', 'code': 'IS301', 'title': 'Data Structures',
+            'l': 3, 't': 0, 'p': 0, 'cie': 50, 'see': 50, 'credits': '3', 'faculty_name': '',
+        }]
+
+    def test_front_matter_rendered_once_per_branch_and_year(self):
+        first = views._build_complete_scheme_pdf(self.branch, 2025, 3, main_rows=self.main_rows, elective_rows=[])
+        second = views._build_complete_scheme_pdf(self.branch, 2025, 4, main_rows=self.main_rows, elective_rows=[])
+
+        self.assertTrue(first.startswith(b'%PDF'))
+        self.assertTrue(second.startswith(b'%PDF'))
+        info = views._scheme_front_matter_pdf.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_front_matter_keyed_on_year(self):
+        views._build_complete_scheme_pdf(self.branch, 2024, 3, main_rows=self.main_rows, elective_rows=[])
+        views._build_complete_scheme_pdf(self.branch, 2025, 3, main_rows=self.main_rows, elective_rows=[])
+
+        self.assertEqual(views._scheme_front_matter_pdf.cache_info().misses, 2)
+
+    def test_writes_into_given_output_stream(self):
+        buffer = BytesIO()
+        result = views._build_complete_scheme_pdf(self.branch, 2025, 3, main_rows=self.main_rows,
+                                                  elective_rows=[], output=buffer)
+
+        self.assertIs(result, buffer)
+        self.assertTrue(buffer.getvalue().startswith(b'%PDF'))
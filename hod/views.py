@@ -1,21 +1,33 @@
 import os
+import re
+import copy
+import hashlib
 import logging
+import tempfile
+import threading
+from types import SimpleNamespace
 from io import BytesIO
 from datetime import datetime
+from functools import lru_cache
+from collections import defaultdict
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from decimal import Decimal
 from urllib.parse import urlencode
 
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
 from django.core.files.base import ContentFile
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q, Prefetch
-from django.db import transaction
-from django.core.exceptions import FieldError
+from django.db.models import F, Q, Max, Count, OuterRef, Subquery
+from django.db import connections, transaction
+from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
-from django.http import HttpResponse, FileResponse
+from django.http import Http404, HttpResponse, FileResponse
 from django.utils import timezone
 from django.views.decorators.http import require_POST, require_http_methods
 
@@ -23,17 +35,29 @@ from django.views.decorators.http import require_POST, require_http_methods
 # ReportLab imports
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image as RLImage
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-import os
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from reportlab.pdfgen import canvas
 
 # local user model
 from users.models import CustomUser
+from hod.signals import FACULTY_LIST_CACHE_KEY
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _dashboard_redirect_url():
+    """URL of hod:dashboard_redirect, the fallback target of most error paths; reversed once per process."""
+    return reverse('hod:dashboard_redirect')
+
+
+# College logo used in scheme PDF headers; checked once at import rather than on every render
+LOGO_PATH = os.path.join(settings.BASE_DIR, "users", "static", "images", "malnad_college_of_engineering_logo.jpeg")
+LOGO_EXISTS = os.path.exists(LOGO_PATH)
+
 # ---------- robust model imports ----------
 # Try the most likely module paths for each model (Academics / Hod / Users).
 # If a model truly isn't present, raise an explicit ImportError so you fix the app naming / INSTALLED_APPS.
@@ -78,6 +102,9 @@ except Exception:
     except Exception:
         FacultyAssignment = None
 
+# Scheme documents are read by most scheme views; resolve the model once here instead of per request
+SchemeDocument = _import_model('hod.models', 'SchemeDocument')
+
 # Faculty model — could live in users, faculty app or hod app. Try in order.
 Faculty = None
 for path, name in (('users.models', 'Faculty'), ('faculty.models', 'Faculty'), ('hod.models', 'Faculty')):
@@ -109,6 +136,35 @@ if _missing:
     raise ImportError("Missing required models: " + ', '.join(_missing) +
                       ". Check app names, model names and INSTALLED_APPS.")
 
+# Field names probed by the scheme and combined-syllabus views, computed once instead of hasattr() checks per request and row
+_COURSE_FIELDS = frozenset(f.name for f in Course._meta.get_fields())
+_SCHEME_COURSE_FIELDS = frozenset(f.name for f in apps.get_model('hod', 'SchemeCourse')._meta.get_fields())
+
+
+def _has_field(model, name):
+    """True if `model` has a field called `name`; get_field() is a dict lookup, unlike listing get_fields()."""
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+# Single-field probes of the academics models used by the HOD dashboard, resolved once at import
+_SYLLABUS_CREATED_FIELD = 'created_on' if Syllabus is not None and _has_field(Syllabus, 'created_on') else 'created_at'
+try:
+    _SemesterCredit = apps.get_model('academics', 'SemesterCredit')
+except LookupError:
+    _SEMESTER_CREDIT_NOT_DELETED = {}
+else:
+    # "not deleted" filter kwarg: SemesterCredit names its flag `deleted` rather than `is_deleted`
+    if _has_field(_SemesterCredit, 'is_deleted'):
+        _SEMESTER_CREDIT_NOT_DELETED = {'is_deleted': False}
+    elif _has_field(_SemesterCredit, 'deleted'):
+        _SEMESTER_CREDIT_NOT_DELETED = {'deleted': False}
+    else:
+        _SEMESTER_CREDIT_NOT_DELETED = {}
+
 
 
 # ===== HELPER FUNCTION: BUILD SCHEME PDF BYTES =====
@@ -119,12 +175,10 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
     Returns bytes.
     """
     SCHEME_BASE_FONT = 14
-    HEADING_FONT_SIZE = SCHEME_BASE_FONT
-    BODY_FONT_SIZE = SCHEME_BASE_FONT - 2
     # if branch is an id -> load object
     if isinstance(branch, int):
         try:
-            branch = apps.get_model('academics', 'Branch').objects.get(pk=branch)
+            branch = Branch.objects.get(pk=branch)
         except Exception:
             branch = None
 
@@ -215,7 +269,6 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
     buffer = BytesIO()
 
     # Small BorderedCanvas so single-page scheme also has a border
-    from reportlab.pdfgen import canvas
     class BorderedPageCanvas(canvas.Canvas):
         def __init__(self, *args, **kwargs):
             canvas.Canvas.__init__(self, *args, **kwargs)
@@ -229,9 +282,8 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
             canvas.Canvas.showPage(self)
 
     doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.35*inch, bottomMargin=0.35*inch,
-                            leftMargin=0.35*inch, rightMargin=0.35*inch)
+                            leftMargin=0.35*inch, rightMargin=0.35*inch, pageCompression=1)
     elements = []
-    styles = getSampleStyleSheet()
 
     # If there is no table content, add a larger top spacer so the header block sits approximately mid-page
     if not main_rows and not elective_rows:
@@ -241,14 +293,13 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
 
     # Header area (logo + department)
     try:
-        logo_path = os.path.join(settings.BASE_DIR, "users", "static", "images", "malnad_college_of_engineering_logo.jpeg")
-        if branch and os.path.exists(logo_path):
+        if branch and LOGO_EXISTS:
             # slightly larger header logo for better balance
-            logo = RLImage(logo_path, width=1.0*inch, height=1.0*inch)
+            logo = RLImage(LOGO_PATH, width=1.0*inch, height=1.0*inch)
             header_content = Paragraph(
                 "<b>MALNAD COLLEGE OF ENGINEERING, HASSAN</b><br/>(An Autonomous Institution Affiliated to VTU, Belagavi)<br/>"
                 f"<b>DEPARTMENT OF {branch.name.upper()}</b>",
-                ParagraphStyle('Header', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold')
+                _HEADING_STYLE
             )
             header_table = Table([[logo, header_content]], colWidths=[1.2*inch, 4.8*inch])
             header_table.setStyle(TableStyle([('ALIGN',(0,0),(-1,-1),'CENTER'), ('VALIGN',(0,0),(-1,-1),'MIDDLE')]))
@@ -256,7 +307,7 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
         else:
             dept = branch.name.upper() if branch else "DEPARTMENT"
             elements.append(Paragraph(f"<b>MALNAD COLLEGE OF ENGINEERING, HASSAN</b><br/><b>DEPARTMENT OF {dept}</b>",
-                                      ParagraphStyle('Header', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold')))
+                                      _HEADING_STYLE))
     except Exception:
         logger.exception("Error while adding header to PDF")
 
@@ -264,7 +315,7 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
     sem_name = ['','FIRST','SECOND','THIRD','FOURTH','FIFTH','SIXTH','SEVENTH','EIGHTH']
     sem_idx = int(semester) if isinstance(semester, (int, str)) else 0
     elements.append(Paragraph(f"<b>{sem_name[sem_idx] if sem_idx < len(sem_name) else 'SEM'} SEMESTER — {year}</b>",
-                              ParagraphStyle('Semester', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold', textColor=colors.HexColor('#008000'))))
+                              _GREEN_HEADING_STYLE))
     elements.append(Spacer(1, 0.08*inch))
 
     # If there is no table content, add extra vertical space so the page looks balanced rather than empty
@@ -275,9 +326,9 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
 
     # Main table
     if main_rows:
-        header_style = ParagraphStyle('Header', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold', leading=HEADING_FONT_SIZE+2)
-        data_style = ParagraphStyle('Data', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_CENTER, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')
-        title_style = ParagraphStyle('Title', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_LEFT, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')
+        header_style = _HEADING_STYLE
+        data_style = _BODY_CENTER_STYLE
+        title_style = _BODY_LEFT_STYLE
 
         table_data = [[
             Paragraph('Sl.<br/>No', header_style),
@@ -327,7 +378,7 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
             row_num += 1
 
         col_widths = [0.35*inch, 0.75*inch, 0.75*inch, 2.1*inch, 0.45*inch, 0.45*inch, 0.45*inch, 0.45*inch, 0.45*inch, 0.35*inch, 0.35*inch, 0.4*inch, 0.4*inch, 0.7*inch]
-        table = Table(table_data, colWidths=col_widths)
+        table = Table(table_data, colWidths=col_widths, repeatRows=1, splitByRow=1)
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#8ADBE9")),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
@@ -357,35 +408,55 @@ def _build_scheme_pdf_bytes(branch, year, semester, main_rows=None, elective_row
         for row in elective_rows:
             elective_sections.setdefault(row.get('section','ESC'), []).append(row)
 
-        elements.append(Paragraph("<b>Elective/Enhancement Courses</b>", ParagraphStyle('ET', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_LEFT, fontName='Times-Bold'))) 
+        elements.append(Paragraph("<b>Elective/Enhancement Courses</b>", _PAGE_TITLE_LEFT_STYLE)) 
         elements.append(Spacer(1, 0.08*inch))
 
-        for section in ['PEC','OEC','ESC','AEC']:
+        for section, section_name in ELECTIVE_SECTION_NAMES.items():
             if section in elective_sections:
                 section_courses = elective_sections[section]
-                section_name = {'PEC':'Professional Elective Course (PEC)',
-                                'OEC':'Open Elective Course (OEC)',
-                                'ESC':'Engineering Science Course (ESC)',
-                                'AEC':'Ability Enhancement Course (AEC)'}[section]
-                elements.append(Paragraph(f"<b>{section_name}</b>", ParagraphStyle('SH', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_LEFT, fontName='Times-Bold', textColor=colors.HexColor('#4472C4'))))
+                elements.append(Paragraph(f"<b>{section_name}</b>", _BLUE_SECTION_STYLE))
                 elements.append(Spacer(1, 0.05*inch))
-                elective_header_style = ParagraphStyle('EH', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
-                elective_data_style = ParagraphStyle('ED', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_LEFT, fontName='Times-Roman')
+                elective_header_style = _PAGE_TITLE_STYLE
+                elective_data_style = _BODY_PLAIN_LEFT_STYLE
                 elective_table_data = [[Paragraph('Course Code', elective_header_style), Paragraph('Course Title', elective_header_style), Paragraph('Assign Faculty', elective_header_style)]]
                 for course in section_courses:
                     elective_table_data.append([Paragraph(course.get('code',''), elective_data_style), Paragraph(course.get('title',''), elective_data_style), Paragraph(course.get('faculty_name',''), elective_data_style)])
-                elective_table = Table(elective_table_data, colWidths=[1.0*inch, 3.5*inch, 1.5*inch])
+                elective_table = Table(elective_table_data, colWidths=[1.0*inch, 3.5*inch, 1.5*inch], repeatRows=1, splitByRow=1)
                 elective_table.setStyle(TableStyle([('BACKGROUND', (0,0), (-1,0), colors.HexColor('#D9E1F2')), ('GRID',(0,0),(-1,-1),0.5,colors.grey), ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#F9F9F9')])]))
                 elements.append(elective_table)
                 elements.append(Spacer(1, 0.1*inch))
 
     elements.append(Spacer(1, 0.05*inch))
-    elements.append(Paragraph(f"Generated on {datetime.now().strftime('%d-%m-%Y %H:%M:%S')}", ParagraphStyle('Footer', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Italic')))
+    elements.append(Paragraph(f"Generated on {datetime.now():%d-%m-%Y %H:%M:%S}", _SCHEME_FOOTER_STYLE))
     doc.build(elements, canvasmaker=BorderedPageCanvas)
     buffer.seek(0)
     return buffer.getvalue()
 
-def _fetch_db_rows_for_scheme(branch, year, semester):
+# Faculty user columns fetched alongside SchemeCourse .values() rows
+SCHEME_FACULTY_VALUES = ('faculty_id', 'faculty__first_name', 'faculty__last_name', 'faculty__username', 'faculty__email')
+
+
+def _scheme_faculty_name(values_row):
+    """Display name for the faculty of a SchemeCourse `.values()` row (mirrors get_full_name() or username)."""
+    if not values_row['faculty_id']:
+        return ''
+    full_name = f"{values_row['faculty__first_name']} {values_row['faculty__last_name']}".strip()
+    return full_name or values_row['faculty__username'] or values_row['faculty__email']
+
+
+def _normalize_scheme_row(row):
+    """
+    Coerce a main-row dict's L/T/P/CIE/SEE to ints and add total_hours/total_marks, in place.
+    Rows produced here are already normalized, so the PDF table loop does no per-cell coercion.
+    """
+    if 'total_hours' in row and 'total_marks' in row:
+        return row
+    l, t, p, cie, see = (int(row.get(k) or 0) for k in ('l', 't', 'p', 'cie', 'see'))
+    row.update(l=l, t=t, p=p, cie=cie, see=see, total_hours=l + t + p, total_marks=cie + see)
+    return row
+
+
+def _query_db_rows_for_scheme(branch, year, semester):
     """
     Fetch main and elective rows from database for PDF generation.
     Returns (main_rows, elective_rows) tuples.
@@ -418,22 +489,22 @@ def _fetch_db_rows_for_scheme(branch, year, semester):
                         pass
                 break
 
-        for c in dean_qs:
-            faculty_name = ''
-            if getattr(c, 'faculty', None):
-                faculty_name = c.faculty.get_full_name() or c.faculty.username
-            
+        # totals are computed by the database; dean courses carry no faculty relation
+        dean_rows_qs = dean_qs.annotate(**DEAN_COURSE_TOTALS).values(*DEAN_COURSE_VALUES, *DEAN_COURSE_TOTALS)
+        for d in dean_rows_qs.iterator(chunk_size=DEAN_ROWS_CHUNK_SIZE):
             main_rows.append({
-                'category': getattr(c, 'course_category', '') or '',
-                'code': getattr(c, 'course_code', '') or '',
-                'title': getattr(c, 'course_title', '') or '',
-                'l': int(getattr(c, 'teaching_hours_L', 0) or 0),
-                't': int(getattr(c, 'teaching_hours_T', 0) or 0),
-                'p': int(getattr(c, 'teaching_hours_P', 0) or 0),
-                'cie': int(getattr(c, 'cie_marks', 0) or 0),
-                'see': int(getattr(c, 'see_marks', 0) or 0),
-                'credits': str(getattr(c, 'credits', 0) or 0),
-                'faculty_name': faculty_name,
+                'category': d['course_category'] or '',
+                'code': d['course_code'] or '',
+                'title': d['course_title'] or '',
+                'l': d['teaching_hours_L'],
+                't': d['teaching_hours_T'],
+                'p': d['teaching_hours_P'],
+                'cie': d['cie_marks'],
+                'see': d['see_marks'],
+                'total_hours': d['row_total_hours'],
+                'total_marks': d['row_total_marks'],
+                'credits': str(d['credits'] or 0),
+                'faculty_name': '',
             })
     except LookupError:
         logger.debug("CollegeLevelCourse model not found")
@@ -448,23 +519,25 @@ def _fetch_db_rows_for_scheme(branch, year, semester):
             year=year,
             semester=semester,
             is_elective=False
-        ).select_related('faculty')
-        for sc in sc_qs:
-            faculty_name = ''
-            if getattr(sc, 'faculty', None):
-                faculty_name = sc.faculty.get_full_name() or sc.faculty.username
-            
+        ).annotate(
+            row_total_hours=F('l') + F('t') + F('p'),
+            row_total_marks=F('cie') + F('see'),
+        )
+        for sc in sc_qs.values('category', 'course_code', 'course_title', 'l', 't', 'p', 'cie', 'see', 'credits',
+                               'row_total_hours', 'row_total_marks', *SCHEME_FACULTY_VALUES):
             main_rows.append({
-                'category': getattr(sc, 'category', '') or '',
-                'code': sc.course_code,
-                'title': getattr(sc, 'course_title', '') or '',
-                'l': int(getattr(sc, 'l', 0) or 0),
-                't': int(getattr(sc, 't', 0) or 0),
-                'p': int(getattr(sc, 'p', 0) or 0),
-                'cie': int(getattr(sc, 'cie', 0) or 0),
-                'see': int(getattr(sc, 'see', 0) or 0),
-                'credits': str(getattr(sc, 'credits', 0) or 0),
-                'faculty_name': faculty_name,
+                'category': sc['category'] or '',
+                'code': sc['course_code'],
+                'title': sc['course_title'] or '',
+                'l': sc['l'],
+                't': sc['t'],
+                'p': sc['p'],
+                'cie': sc['cie'],
+                'see': sc['see'],
+                'total_hours': sc['row_total_hours'],
+                'total_marks': sc['row_total_marks'],
+                'credits': str(sc['credits'] or 0),
+                'faculty_name': _scheme_faculty_name(sc),
             })
     except LookupError:
         logger.debug("SchemeCourse model not found")
@@ -499,6 +572,124 @@ def _fetch_db_rows_for_scheme(branch, year, semester):
     return main_rows, elective_rows
 
 
+# Dean courses have no updated_at column, so their edits are only picked up once the entry expires
+SCHEME_ROWS_CACHE_TIMEOUT = 300
+
+
+def _fetch_db_rows_for_scheme(branch, year, semester):
+    """
+    Cached wrapper around `_query_db_rows_for_scheme`.
+    The key includes the latest SchemeCourse.updated_at and row count for the branch/year/semester
+    (plus the newest dean course and the dean course count), so adding, saving or deleting rows
+    invalidates it automatically.
+    """
+    branch_pk = getattr(branch, 'pk', branch)
+    try:
+        SchemeCourse = apps.get_model('hod', 'SchemeCourse')
+        CollegeLevelCourse = apps.get_model('academics', 'CollegeLevelCourse')
+    except LookupError:
+        return _query_db_rows_for_scheme(branch, year, semester)
+
+    hod_stamp = SchemeCourse.objects.filter(branch=branch_pk, year=year, semester=semester).aggregate(
+        max_updated=Max('updated_at'), row_count=Count('id')
+    )
+    dean_stamp = CollegeLevelCourse.objects.filter(is_deleted=False).aggregate(
+        max_created=Max('created_on'), row_count=Count('id')
+    )
+    key = "hod:scheme_rows:{}:{}:{}:{}:{}:{}:{}".format(
+        branch_pk, year, semester,
+        hod_stamp['max_updated'].isoformat() if hod_stamp['max_updated'] else 'none', hod_stamp['row_count'],
+        dean_stamp['max_created'].isoformat() if dean_stamp['max_created'] else 'none', dean_stamp['row_count'],
+    )
+    rows = cache.get(key)
+    if rows is None:
+        rows = _query_db_rows_for_scheme(branch, year, semester)
+        cache.set(key, rows, SCHEME_ROWS_CACHE_TIMEOUT)
+    return rows
+
+
+# Short TTL as a backstop; hod.signals also drops the entry whenever a user is saved or deleted
+FACULTY_LIST_CACHE_TIMEOUT = 60
+
+
+def _active_faculty_list():
+    """Active faculty users for the scheme form dropdowns, cached as a materialized list."""
+    faculty_list = cache.get(FACULTY_LIST_CACHE_KEY)
+    if faculty_list is None:
+        faculty_list = list(CustomUser.objects.filter(role='faculty', is_active=True).only(
+            'id', 'username', 'first_name', 'last_name', 'email'
+        ))
+        cache.set(FACULTY_LIST_CACHE_KEY, faculty_list, FACULTY_LIST_CACHE_TIMEOUT)
+    return faculty_list
+
+
+# Stored PDFs are streamed in 64 KiB blocks instead of FileResponse's 4 KiB default. The block size is
+# also handed to the server's wsgi.file_wrapper, which can use sendfile() for real files.
+STORED_PDF_BLOCK_SIZE = 64 * 1024
+
+
+def _stored_pdf_response(fieldfile, filename, as_attachment=False):
+    """FileResponse for a stored PDF FileField, streamed with STORED_PDF_BLOCK_SIZE blocks."""
+    response = FileResponse(fieldfile.open('rb'), content_type='application/pdf',
+                            as_attachment=as_attachment, filename=filename)
+    response.block_size = STORED_PDF_BLOCK_SIZE
+    return response
+
+
+def _open_stored_pdf(fieldfile, open_files):
+    """Open a stored PDF through its storage for merging, or return None when it is missing.
+
+    The handle is registered on ``open_files`` (an ExitStack) so it stays open until the merger has
+    written its output and is then closed with the rest.
+    """
+    if not fieldfile or not fieldfile.storage.exists(fieldfile.name):
+        return None
+    return open_files.enter_context(fieldfile.storage.open(fieldfile.name, 'rb'))
+
+
+# Threads used to parse the faculty PDFs merged into a combined syllabus (settings.HOD_PDF_READ_THREADS;
+# 0 = parse them in turn). Parsing is mostly file/storage reads, so the threads overlap that I/O.
+_PDF_READ_EXECUTOR = None
+
+
+def _pdf_read_executor():
+    global _PDF_READ_EXECUTOR
+    workers = getattr(settings, 'HOD_PDF_READ_THREADS', 0)
+    if not workers:
+        return None
+    if _PDF_READ_EXECUTOR is None:
+        _PDF_READ_EXECUTOR = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdf-read')
+    return _PDF_READ_EXECUTOR
+
+
+def _read_source_pdf(handle):
+    """Parse one source PDF for merging; returns the PdfReader, or the exception opening or parsing raised.
+
+    ``handle`` may already be the exception raised while opening the file; it is passed through.
+    """
+    from PyPDF2 import PdfReader
+    if isinstance(handle, Exception):
+        return handle
+    try:
+        return PdfReader(handle, strict=False)
+    except Exception as e:
+        return e
+
+
+def _request_hod_assignment(request):
+    """
+    The user's HODAssignment with its branch joined (one query instead of the reverse
+    one-to-one lookup plus a branch fetch), memoized on the request.
+    """
+    if not hasattr(request, '_hod_assignment'):
+        HODAssignment = apps.get_model('hod', 'HODAssignment')
+        request._hod_assignment = (
+            HODAssignment.objects.select_related('branch').filter(hod_user=request.user).first()
+            if request.user.is_authenticated else None
+        )
+    return request._hod_assignment
+
+
 # ===== REST OF YOUR VIEWS CONTINUE BELOW =====
 @login_required
 def dashboard_redirect(request):
@@ -549,13 +740,8 @@ def dashboard(request, branch_pk=None):
             try:
                 SemesterCredit = apps.get_model('academics', 'SemesterCredit')
 
-                # choose proper "not deleted" kwarg depending on model field name
-                deleted_kw = {}
-                field_names = [f.name for f in SemesterCredit._meta.get_fields()]
-                if 'is_deleted' in field_names:
-                    deleted_kw['is_deleted'] = False
-                elif 'deleted' in field_names:
-                    deleted_kw['deleted'] = False
+                # proper "not deleted" kwarg for the model's field name (resolved at import)
+                deleted_kw = _SEMESTER_CREDIT_NOT_DELETED
 
                 semester_credit_obj = SemesterCredit.objects.filter(branch=branch, admission_year=selected_year, **deleted_kw).first()
                 if not semester_credit_obj:
@@ -582,12 +768,8 @@ def dashboard(request, branch_pk=None):
                     semester_rows.append((f"Semester {i}", val or 0))
 
                 # if a semester was selected, pick its credit value
-                if selected_semester:
-                    try:
-                        idx = int(selected_semester) - 1
-                        selected_sem_credit = semester_rows[idx][1]
-                    except Exception:
-                        selected_sem_credit = None
+                if selected_semester.isdigit() and 1 <= int(selected_semester) <= len(semester_rows):
+                    selected_sem_credit = semester_rows[int(selected_semester) - 1][1]
 
     # Only display dean-provided courses after both year AND semester are selected
     if selected_year and selected_semester:
@@ -634,7 +816,7 @@ def dashboard(request, branch_pk=None):
             for c in dean_qs:
                 # safely get faculty id as int if present
                 f_id = None
-                if hasattr(c, 'faculty_id') and getattr(c, 'faculty_id') not in (None, ''):
+                if 'faculty' in _COURSE_FIELDS and getattr(c, 'faculty_id') not in (None, ''):
                     try:
                         f_id = int(getattr(c, 'faculty_id'))
                     except Exception:
@@ -662,21 +844,25 @@ def dashboard(request, branch_pk=None):
                                     + int(getattr(c, 'see_marks', 0) or 0)),
                     'credits': getattr(c, 'credits', 0) or 0,
                     'faculty_id': f_id,
-                    'faculty_username': getattr(getattr(c, 'faculty', None), 'username', '') if hasattr(c, 'faculty') else '',
+                    'faculty_username': getattr(getattr(c, 'faculty', None), 'username', '') if 'faculty' in _COURSE_FIELDS else '',
                 })
 
             # Attach latest syllabus pk per course (safe lookup)
             try:
                 Syllabus = apps.get_model('academics', 'Syllabus')
                 syllabus_map = {}
-                created_field = 'created_on' if 'created_on' in [f.name for f in Syllabus._meta.get_fields()] else 'created_at'
-                for s in Syllabus.objects.all().order_by(f'-{created_field}'):
-                    course_obj = getattr(s, 'course', None)
-                    if not course_obj:
-                        continue
-                    course_pk = getattr(course_obj, 'pk', None)
+                created_field = _SYLLABUS_CREATED_FIELD
+                # only the (pk, course_id) pairs of the listed courses are needed, not the syllabus text columns
+                course_ids = [c['id'] for c in courses_dean if c.get('id')]
+                syllabus_pairs = (
+                    Syllabus.objects.filter(course_id__in=course_ids)
+                    .order_by(f'-{created_field}')
+                    .values_list('pk', 'course_id')
+                    .iterator(chunk_size=100)
+                )
+                for s_pk, course_pk in syllabus_pairs:
                     if course_pk and course_pk not in syllabus_map:
-                        syllabus_map[course_pk] = s.pk
+                        syllabus_map[course_pk] = s_pk
                 for c in courses_dean:
                     c['syllabus_pk'] = syllabus_map.get(c.get('id'))
             except LookupError:
@@ -698,36 +884,22 @@ def dashboard(request, branch_pk=None):
         except Exception:
             pass
 
-    # robustly compute total credits (works for model instances *or* dicts)
+    # compute total credits (works for model instances *or* dicts)
     total_credits_dean = 0
-    if courses_dean:
-        for c in courses_dean:
-            try:
-                # model instance path
-                val = getattr(c, 'credits', None)
-                if val is None and isinstance(c, dict):
-                    # dict fallback
-                    val = c.get('credits', 0)
-                total_credits_dean += int(val or 0)
-            except Exception:
-                # last resort: try dict get or treat as 0
-                try:
-                    total_credits_dean += int(c.get('credits', 0))
-                except Exception:
-                    pass
+    for c in courses_dean:
+        val = c.get('credits', 0) if isinstance(c, dict) else getattr(c, 'credits', 0)
+        total_credits_dean += int(val or 0)
 
     # If you have your own schema model, fetch credits for the selected sem
     total_credits_schema = 0
     if selected_year and selected_semester:
         try:
             SemesterCredit = apps.get_model('academics', 'SemesterCredit')
-            obj = SemesterCredit.objects.filter(
+            sem_field = f"sem{selected_semester}"
+            total_credits_schema = SemesterCredit.objects.filter(
                 branch=branch,
                 admission_year=selected_year
-            ).first()
-            if obj:
-                sem_field = f"sem{selected_semester}"
-                total_credits_schema = getattr(obj, sem_field, 0) or 0
+            ).values_list(sem_field, flat=True).first() or 0
         except Exception:
             total_credits_schema = 0
 
@@ -802,7 +974,7 @@ def view_submission_pdf(request, submission_pk):
         hod_assignment = getattr(request.user, 'hod_assignment', None)
         if hod_assignment and pdf_obj.branch and pdf_obj.branch != hod_assignment.branch:
             messages.error(request, "You don't have permission to view this submission.")
-            return redirect('hod:dashboard_redirect')
+            return redirect(_dashboard_redirect_url())
         
         # Serve the PDF file (return HttpResponse with content so tests can inspect `response.content`)
         if pdf_obj.pdf_file:
@@ -817,20 +989,20 @@ def view_submission_pdf(request, submission_pk):
                 except Exception as e:
                     logger.exception("Failed reading PDF file for response: %s", e)
                     messages.error(request, "Failed to read PDF file.")
-                    return redirect('hod:dashboard_redirect')
+                    return redirect(_dashboard_redirect_url())
             else:
                 messages.error(request, "PDF file not found.")
-                return redirect('hod:dashboard_redirect')
+                return redirect(_dashboard_redirect_url())
         else:
             messages.error(request, "No PDF file available for this submission.")
-            return redirect('hod:dashboard_redirect')
+            return redirect(_dashboard_redirect_url())
     except LookupError:
         messages.error(request, "FacultySyllabusPDF model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error viewing submission PDF: %s", e)
         messages.error(request, f"Failed to view PDF: {e}")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 @require_http_methods(["POST"])
 @login_required
@@ -838,11 +1010,11 @@ def approve_syllabus(request, submission_pk):
     """Approval flow disabled — HODs no longer approve/reject faculty PDFs. All faculty PDFs are included automatically."""
     try:
         messages.info(request, "Approval flow is disabled: faculty-generated PDFs are included automatically.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error redirecting from disabled approve_syllabus endpoint: %s", e)
         messages.error(request, "Unable to perform operation.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 @require_POST
 @login_required
@@ -850,21 +1022,21 @@ def select_semester(request, branch_pk):
     """Receive year+semester from dashboard and redirect to edit_semester_schema.
     Additionally generate starting pages PDF (1..7) for the branch+year.
     """
+    dashboard_url = reverse('hod:dashboard_self', args=[branch_pk])
     year = request.POST.get('academic_year') or request.POST.get('year') or request.GET.get('year','').strip()
     sem = request.POST.get('semester')
     if not year or not sem:
         messages.error(request, 'Please provide an admission year and select a semester.')
-        return redirect(reverse('hod:dashboard_self', args=[branch_pk]))
+        return redirect(dashboard_url)
     try:
         y = int(year)
         s = int(sem)
     except Exception:
         messages.error(request, 'Invalid year or semester.')
-        return redirect(reverse('hod:dashboard_self', args=[branch_pk]))
+        return redirect(dashboard_url)
 
     # Try to generate starting pages PDF for this branch+admission year.
     try:
-        Branch = apps.get_model('academics', 'Branch')
         branch = get_object_or_404(Branch, pk=branch_pk)
         try:
             from . import pdf_generator
@@ -948,6 +1120,44 @@ def edit_semester_schema(request, branch_pk, year, sem):
         context['edit_mode'] = True
         return render(request, 'hod/create_scheme.html', context)
 
+# CollegeLevelCourse columns needed to display/print a dean course row
+DEAN_COURSE_VALUES = (
+    'id', 'course_category', 'course_code', 'course_title',
+    'teaching_hours_L', 'teaching_hours_T', 'teaching_hours_P',
+    'cie_marks', 'see_marks', 'credits',
+)
+
+# Dean course totals computed in SQL; use as .annotate(**DEAN_COURSE_TOTALS).values(*DEAN_COURSE_VALUES, *DEAN_COURSE_TOTALS)
+DEAN_COURSE_TOTALS = {
+    'row_total_hours': F('teaching_hours_L') + F('teaching_hours_T') + F('teaching_hours_P'),
+    'row_total_marks': F('cie_marks') + F('see_marks'),
+}
+
+# Dean rows are streamed from the cursor in chunks of this size rather than cached on the queryset
+DEAN_ROWS_CHUNK_SIZE = 200
+
+
+def _dean_course_display_row(d):
+    """Build the dean course dict used by the scheme form templates from an annotated `.values()` row."""
+    return {
+        'id': d['id'],
+        'category': d['course_category'] or '',
+        'course_code': d['course_code'] or '',
+        'course_title': d['course_title'] or '',
+        'l': d['teaching_hours_L'],
+        't': d['teaching_hours_T'],
+        'p': d['teaching_hours_P'],
+        'total_hours': d['row_total_hours'],
+        'cie': d['cie_marks'],
+        'see': d['see_marks'],
+        'total_marks': d['row_total_marks'],
+        'credits': d['credits'] or 0,
+        # CollegeLevelCourse has no faculty relation; keys kept for the template
+        'faculty_id': None,
+        'faculty_username': '',
+    }
+
+
 @login_required
 def create_scheme_form(request, branch_pk, year, semester):
     """GET-only form for creating a scheme (no POST handling here)."""
@@ -960,7 +1170,7 @@ def create_scheme_form(request, branch_pk, year, semester):
             Q(branch__isnull=True) | Q(branch=branch)
         )
         # if model has semester field, filter by sem
-        if hasattr(Course, 'semester'):
+        if 'semester' in _COURSE_FIELDS:
             try:
                 dean_qs = dean_qs.filter(semester=semester)
             except Exception:
@@ -968,7 +1178,7 @@ def create_scheme_form(request, branch_pk, year, semester):
                 pass
         # if model has admission_year (or similar), filter by provided year (STRICT match when provided)
         for year_field in ['admission_year', 'year', 'academic_year']:
-            if hasattr(Course, year_field) and year not in (None, '', 0):
+            if year_field in _COURSE_FIELDS and year not in (None, '', 0):
                 try:
                     dean_qs = dean_qs.filter(**{year_field: year})
                 except Exception:
@@ -980,43 +1190,11 @@ def create_scheme_form(request, branch_pk, year, semester):
     except Exception:
         dean_qs = Course.objects.none()
 
-    # Convert to simple dicts (make faculty_id an int or None)
-    dean_courses = []
-    for c in dean_qs:
-        # safely get faculty id as int if present
-        f_id = None
-        if hasattr(c, 'faculty_id') and getattr(c, 'faculty_id') not in (None, ''):
-            try:
-                f_id = int(getattr(c, 'faculty_id'))
-            except Exception:
-                try:
-                    # if c.faculty is a relation
-                    f_obj = getattr(c, 'faculty', None)
-                    f_id = int(getattr(f_obj, 'id')) if f_obj else None
-                except Exception:
-                    f_id = None
-
-        dean_courses.append({
-            'id': getattr(c, 'id', None),
-            'category': getattr(c, 'course_category', '') or '',
-            'course_code': getattr(c, 'course_code', '') or '',
-            'course_title': getattr(c, 'course_title', '') or '',
-            'l': int(getattr(c, 'teaching_hours_L', 0) or 0),
-            't': int(getattr(c, 'teaching_hours_T', 0) or 0),
-            'p': int(getattr(c, 'teaching_hours_P', 0) or 0),
-            'total_hours': (int(getattr(c, 'teaching_hours_L', 0) or 0)
-                            + int(getattr(c, 'teaching_hours_T', 0) or 0)
-                            + int(getattr(c, 'teaching_hours_P', 0) or 0)),
-            'cie': int(getattr(c, 'cie_marks', 0) or 0),
-            'see': int(getattr(c, 'see_marks', 0) or 0),
-            'total_marks': (int(getattr(c, 'cie_marks', 0) or 0)
-                            + int(getattr(c, 'see_marks', 0) or 0)),
-            'credits': getattr(c, 'credits', 0) or 0,
-            'faculty_id': f_id,
-            'faculty_username': getattr(getattr(c, 'faculty', None), 'username', '') if hasattr(c, 'faculty') else '',
-        })
+    # Convert to simple dicts straight from .values() (no model instances needed)
+    dean_rows_qs = dean_qs.annotate(**DEAN_COURSE_TOTALS).values(*DEAN_COURSE_VALUES, *DEAN_COURSE_TOTALS)
+    dean_courses = [_dean_course_display_row(d) for d in dean_rows_qs.iterator(chunk_size=DEAN_ROWS_CHUNK_SIZE)]
     
-    faculty_list = CustomUser.objects.filter(role='faculty', is_active=True)
+    faculty_list = _active_faculty_list()
     
     context = {
         'branch': branch,
@@ -1028,6 +1206,70 @@ def create_scheme_form(request, branch_pk, year, semester):
     return render(request, 'hod/create_scheme.html', context)
 
 
+def _iter_scheme_main_rows(dean_values, posted_rows):
+    """Yield PDF main rows for dean courses (`.values()` dicts) followed by the posted rows."""
+    # dean courses carry no faculty relation, so the faculty column stays empty
+    for d in dean_values:
+        yield _normalize_scheme_row({
+            'category': d['course_category'] or '',
+            'code': d['course_code'] or '',
+            'title': d['course_title'] or '',
+            'l': d['teaching_hours_L'] or 0,
+            't': d['teaching_hours_T'] or 0,
+            'p': d['teaching_hours_P'] or 0,
+            'cie': d['cie_marks'] or 0,
+            'see': d['see_marks'] or 0,
+            'credits': str(d['credits'] or 0),
+            'faculty_name': '',
+        })
+    yield from posted_rows
+
+
+# Row keys posted by the scheme form: code_new_1 / title_new_1 for main rows and
+# pec_code_1 / additional_pec_title_2 (etc.) for elective rows
+_SCHEME_KEY_RE = re.compile(r'^(?:code|title)_new_(?P<i>\d+)$')
+_ELECTIVE_KEY_RE = re.compile(r'^(?P<prefix>(?:additional_)?(?:pec|oec|esc|aec))_(?:code|title)_(?P<i>\d+)$')
+# faculty pickers of the same rows: faculty_new_1, pec_faculty_1, additional_pec_faculty_2, ...
+_FACULTY_KEY_RE = re.compile(r'^(?:faculty_new|(?:additional_)?(?:pec|oec|esc|aec)_faculty)_\d+$')
+
+
+def _posted_row_indices(post):
+    """
+    Scan the POST keys once and return the submitted row indices of the scheme form as
+    (main_indices, elective_indices); elective_indices maps a field prefix such as
+    'pec' or 'additional_pec' to its sorted indices.
+    """
+    main_indices = set()
+    elective_indices = {}
+    for key in post.keys():
+        m = _SCHEME_KEY_RE.match(key)
+        if m:
+            main_indices.add(int(m.group('i')))
+            continue
+        m = _ELECTIVE_KEY_RE.match(key)
+        if m:
+            elective_indices.setdefault(m.group('prefix'), set()).add(int(m.group('i')))
+    return sorted(main_indices), {prefix: sorted(idx) for prefix, idx in elective_indices.items()}
+
+
+def _posted_faculty_users(post):
+    """Load every faculty user picked on the scheme form in one query: {user id: user}."""
+    user_ids = {int(v) for k, v in post.items() if _FACULTY_KEY_RE.match(k) and v.isdigit()}
+    return CustomUser.objects.in_bulk(user_ids) if user_ids else {}
+
+
+def _faculty_profiles(users, department):
+    """
+    Return {user id: Faculty profile} for `users`, creating the missing profiles in one batch
+    with `department`.
+    """
+    if not users:
+        return {}
+    Faculty.objects.bulk_create([Faculty(user=u, department=department) for u in users],
+                                ignore_conflicts=True)
+    return {fp.user_id: fp for fp in Faculty.objects.filter(user__in=users)}
+
+
 @login_required
 def generate_pdf_view(request, branch_pk, year, semester):
     """
@@ -1038,354 +1280,287 @@ def generate_pdf_view(request, branch_pk, year, semester):
     - Saves to SchemeDocument
     """
     try:
-        branch = get_object_or_404(apps.get_model('academics', 'Branch'), pk=branch_pk)
+        branch = get_object_or_404(Branch, pk=branch_pk)
     except Exception:
         messages.error(request, "Branch not found.")
         return redirect('hod:hod_dashboard')
 
-    # --- FETCH DEAN COURSES FIRST (ALWAYS) ---
-    dean_rows = []
+    # --- DEAN COURSES (lazy: only evaluated if the DB row fetch below is unavailable) ---
+    dean_values = ()
     try:
         CollegeLevelCourse = apps.get_model('academics', 'CollegeLevelCourse')
         # Fetch dean courses for this branch/year/semester (college-wide or branch-specific)
         dean_qs = CollegeLevelCourse.objects.filter(department="All Branches", is_deleted=False).filter(
             Q(branch__isnull=True) | Q(branch=branch)
         )
-        # filter by semester only if model has that field
+        # year/semester come from int URL converters, so no casting fallbacks are needed
         if hasattr(CollegeLevelCourse, 'semester'):
-            try:
-                dean_qs = dean_qs.filter(semester=int(semester))
-            except Exception:
-                dean_qs = dean_qs.filter(semester=semester)
+            dean_qs = dean_qs.filter(semester=semester)
         # filter by admission_year if model supports it (STRICT when 'year' provided)
         for year_field in ['admission_year', 'year', 'academic_year']:
             if hasattr(CollegeLevelCourse, year_field) and year not in (None, '', 0):
-                try:
-                    dean_qs = dean_qs.filter(**{year_field: int(year)})
-                except Exception:
-                    try:
-                        dean_qs = dean_qs.filter(**{year_field: year})
-                    except Exception:
-                        pass
+                dean_qs = dean_qs.filter(**{year_field: year})
                 break
 
-        for dc in dean_qs:
-            # safe numeric field extraction
-            l = int(getattr(dc, 'teaching_hours_L', 0) or 0)
-            t = int(getattr(dc, 'teaching_hours_T', 0) or 0)
-            p = int(getattr(dc, 'teaching_hours_P', 0) or 0)
-            cie = int(getattr(dc, 'cie_marks', 0) or 0)
-            see = int(getattr(dc, 'see_marks', 0) or 0)
-            credits = getattr(dc, 'credits', 0) or 0
-
-            # Faculty detection: prefer relation, fallback to faculty_id
-            faculty_name = ''
-            if hasattr(dc, 'faculty') and getattr(dc, 'faculty'):
-                f = getattr(dc, 'faculty')
-                if callable(getattr(f, 'get_full_name', None)):
-                    faculty_name = f.get_full_name() or getattr(f, 'username', str(f))
-                else:
-                    faculty_name = getattr(f, 'username', str(f))
-            else:
-                fid = getattr(dc, 'faculty_id', None)
-                if fid:
-                    try:
-                        fu = CustomUser.objects.get(pk=fid)
-                        faculty_name = fu.get_full_name() or fu.username
-                    except Exception:
-                        faculty_name = ''
-
-            dean_rows.append({
-                'category': getattr(dc, 'course_category', '') or '',
-                'code': getattr(dc, 'course_code', '') or '',
-                'title': getattr(dc, 'course_title', '') or '',
-                'l': l,
-                't': t,
-                'p': p,
-                'cie': cie,
-                'see': see,
-                'credits': str(credits),
-                'faculty_name': faculty_name,
-            })
+        dean_values = dean_qs.values(*DEAN_COURSE_VALUES)
     except LookupError:
         logger.debug("CollegeLevelCourse model not found")
-        dean_rows = []
     except Exception as e:
         logger.exception("Error fetching dean courses: %s", e)
-        dean_rows = []
 
     # Collect posted main_rows with faculty names AND save them to DB before PDF generation
     # This ensures all rows are persisted and included in PDF
     posted_main_rows = []
     posted_elective_rows = []
-    found_post = False
-    hod_assignment = getattr(request.user, 'hod_assignment', None)
+    hod_assignment = _request_hod_assignment(request)
     
-    i = 1
-    while True:
-        code = request.POST.get(f'code_new_{i}', '').strip()
-        title = request.POST.get(f'title_new_{i}', '').strip()
-        if not code and not title:
-            break
-        found_post = True
-        
-        faculty_name = ''
-        faculty_id = request.POST.get(f'faculty_new_{i}')
-        faculty_user = None
-        if faculty_id:
-            try:
-                faculty_user = CustomUser.objects.get(pk=int(faculty_id))
-                faculty_name = faculty_user.get_full_name() or faculty_user.username
-            except Exception:
-                faculty_name = ''
-        
-        # Save main row to DB before PDF generation
-        try:
-            SchemeCourse = apps.get_model('hod', 'SchemeCourse')
-            with transaction.atomic():
-                l = int(request.POST.get(f'l_new_{i}', 0) or 0)
-                t = int(request.POST.get(f't_new_{i}', 0) or 0)
-                p = int(request.POST.get(f'p_new_{i}', 0) or 0)
-                total_hours = l + t + p
-                cie = int(request.POST.get(f'cie_new_{i}', 0) or 0)
-                see = int(request.POST.get(f'see_new_{i}', 0) or 0)
-                total_marks = cie + see
-                credits = float(request.POST.get(f'credits_new_{i}', 0) or 0)
-                category = request.POST.get(f'category_new_{i}', '') or ''
-                
-                sc, _ = SchemeCourse.objects.update_or_create(
-                    branch=branch,
-                    year=int(year),
-                    semester=int(semester),
-                    course_code=code,
-                    defaults={
-                        'course_title': title or '',
-                        'l': l,
-                        't': t,
-                        'p': p,
-                        'total_hours': total_hours,
-                        'cie': cie,
-                        'see': see,
-                        'total_marks': total_marks,
-                        'credits': Decimal(str(credits)) if credits else Decimal('0.0'),
-                        'category': category,
-                        'is_elective': False,
-                        'faculty': faculty_user,
-                    }
-                )
-        except Exception as e:
-            logger.exception("Error saving main row %s in generate_pdf_view: %s", code, e)
-        
-        posted_main_rows.append({
-            'category': request.POST.get(f'category_new_{i}', '') or '',
-            'code': code,
-            'title': title,
-            'l': int(request.POST.get(f'l_new_{i}', 0) or 0),
-            't': int(request.POST.get(f't_new_{i}', 0) or 0),
-            'p': int(request.POST.get(f'p_new_{i}', 0) or 0),
-            'cie': int(request.POST.get(f'cie_new_{i}', 0) or 0),
-            'see': int(request.POST.get(f'see_new_{i}', 0) or 0),
-            'credits': request.POST.get(f'credits_new_{i}', '0') or '0',
-            'faculty_name': faculty_name,
-        })
-        i += 1
-
-    # Collect posted elective rows with faculty names AND save them to DB before PDF generation
-    # This ensures electives are persisted and included in PDF
-    # Handle both regular and additional elective rows
-    for section in ['pec', 'oec', 'esc', 'aec']:
-        # Process regular elective rows
-        j = 1
-        while True:
-            code = request.POST.get(f'{section}_code_{j}', '').strip()
-            title = request.POST.get(f'{section}_title_{j}', '').strip()
+    post = request.POST
+    pg = post.get  # bound once; read for every field of every posted row
+    main_indices, elective_indices = _posted_row_indices(post)
+    # one transaction for all posted rows; the per-row atomic blocks below become savepoints, so a
+    # failing row is still rolled back on its own without committing after every row
+    with transaction.atomic():
+        for i in main_indices:
+            code = pg(f'code_new_{i}', '').strip()
+            title = pg(f'title_new_{i}', '').strip()
             if not code and not title:
-                break
-            found_post = True
-            
+                continue
+        
             faculty_name = ''
-            faculty_id = request.POST.get(f'{section}_faculty_{j}')
+            faculty_id = pg(f'faculty_new_{i}')
+            faculty_user = None
             if faculty_id:
                 try:
-                    u = CustomUser.objects.get(pk=int(faculty_id))
-                    faculty_name = u.get_full_name() or u.username
+                    faculty_user = CustomUser.objects.get(pk=int(faculty_id))
+                    faculty_name = faculty_user.get_full_name() or faculty_user.username
                 except Exception:
                     faculty_name = ''
-            
-            # Save elective to DB before PDF generation to ensure it's included
+        
+            # Save main row to DB before PDF generation
             try:
                 SchemeCourse = apps.get_model('hod', 'SchemeCourse')
                 with transaction.atomic():
-                    faculty_user = None
-                    if faculty_id:
-                        try:
-                            faculty_user = CustomUser.objects.get(pk=int(faculty_id))
-                        except Exception:
-                            pass
-                    
-                    sc, created = SchemeCourse.objects.update_or_create(
+                    l = int(pg(f'l_new_{i}', 0) or 0)
+                    t = int(pg(f't_new_{i}', 0) or 0)
+                    p = int(pg(f'p_new_{i}', 0) or 0)
+                    total_hours = l + t + p
+                    cie = int(pg(f'cie_new_{i}', 0) or 0)
+                    see = int(pg(f'see_new_{i}', 0) or 0)
+                    total_marks = cie + see
+                    credits = float(pg(f'credits_new_{i}', 0) or 0)
+                    category = pg(f'category_new_{i}', '') or ''
+                
+                    sc, _ = SchemeCourse.objects.update_or_create(
                         branch=branch,
                         year=int(year),
                         semester=int(semester),
                         course_code=code,
                         defaults={
                             'course_title': title or '',
-                            'category': section.upper(),
-                            'is_elective': True,
+                            'l': l,
+                            't': t,
+                            'p': p,
+                            'total_hours': total_hours,
+                            'cie': cie,
+                            'see': see,
+                            'total_marks': total_marks,
+                            'credits': Decimal(str(credits)) if credits else Decimal('0.0'),
+                            'category': category,
+                            'is_elective': False,
                             'faculty': faculty_user,
                         }
                     )
-                    
-                    # Create/update CourseAllocation and FacultyAssignment
-                    if hod_assignment:
-                        CourseAllocation = apps.get_model('hod', 'CourseAllocation')
-                        FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
-                        course_alloc, _ = CourseAllocation.objects.get_or_create(
-                            hod_assignment=hod_assignment,
-                            course_code=code,
-                            defaults={
-                                'course_title': title or '',
-                                'course_category': section.upper(),
-                                'teaching_hours_L': 0,
-                                'teaching_hours_T': 0,
-                                'teaching_hours_P': 0,
-                                'credits': 0
-                            }
-                        )
-                        if faculty_id:
-                            try:
-                                faculty_profile, _ = Faculty.objects.get_or_create(
-                                    user=u,
-                                    defaults={'department': getattr(hod_assignment.branch, 'name', '') if hod_assignment else ''}
-                                )
-                                FacultyAssignment.objects.update_or_create(
-                                    course_allocation=course_alloc,
-                                    defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
-                                )
-                            except Exception:
-                                pass
             except Exception as e:
-                logger.exception("Error saving elective %s: %s", code, e)
-            
-            posted_elective_rows.append({
-                'section': section.upper(),
+                logger.exception("Error saving main row %s in generate_pdf_view: %s", code, e)
+        
+            posted_main_rows.append(_normalize_scheme_row({
+                'category': pg(f'category_new_{i}', '') or '',
                 'code': code,
                 'title': title,
+                'l': int(pg(f'l_new_{i}', 0) or 0),
+                't': int(pg(f't_new_{i}', 0) or 0),
+                'p': int(pg(f'p_new_{i}', 0) or 0),
+                'cie': int(pg(f'cie_new_{i}', 0) or 0),
+                'see': int(pg(f'see_new_{i}', 0) or 0),
+                'credits': pg(f'credits_new_{i}', '0') or '0',
                 'faculty_name': faculty_name,
-            })
-            j += 1
-        
-        # Process additional elective rows (additional_pec_code_1, etc.)
-        j_add = 1
-        while True:
-            code = request.POST.get(f'additional_{section}_code_{j_add}', '').strip()
-            title = request.POST.get(f'additional_{section}_title_{j_add}', '').strip()
-            if not code and not title:
-                break
-            found_post = True
+            }))
+
+        # Collect posted elective rows with faculty names AND save them to DB before PDF generation
+        # This ensures electives are persisted and included in PDF
+        # Handle both regular and additional elective rows
+        for section in ['pec', 'oec', 'esc', 'aec']:
+            # Process regular elective rows
+            for j in elective_indices.get(section, ()):
+                code = pg(f'{section}_code_{j}', '').strip()
+                title = pg(f'{section}_title_{j}', '').strip()
+                if not code and not title:
+                    continue
             
-            faculty_name = ''
-            faculty_id = request.POST.get(f'additional_{section}_faculty_{j_add}')
-            if faculty_id:
-                try:
-                    u = CustomUser.objects.get(pk=int(faculty_id))
-                    faculty_name = u.get_full_name() or u.username
-                except Exception:
-                    faculty_name = ''
+                faculty_name = ''
+                faculty_id = pg(f'{section}_faculty_{j}')
+                if faculty_id:
+                    try:
+                        u = CustomUser.objects.get(pk=int(faculty_id))
+                        faculty_name = u.get_full_name() or u.username
+                    except Exception:
+                        faculty_name = ''
             
-            # Save additional elective to DB before PDF generation
-            try:
-                SchemeCourse = apps.get_model('hod', 'SchemeCourse')
-                with transaction.atomic():
-                    faculty_user = None
-                    if faculty_id:
-                        try:
-                            faculty_user = CustomUser.objects.get(pk=int(faculty_id))
-                        except Exception:
-                            pass
-                    
-                    sc, created = SchemeCourse.objects.update_or_create(
-                        branch=branch,
-                        year=int(year),
-                        semester=int(semester),
-                        course_code=code,
-                        defaults={
-                            'course_title': title or '',
-                            'category': section.upper(),
-                            'is_elective': True,
-                            'faculty': faculty_user,
-                        }
-                    )
+                # Save elective to DB before PDF generation to ensure it's included
+                try:
+                    SchemeCourse = apps.get_model('hod', 'SchemeCourse')
+                    with transaction.atomic():
+                        faculty_user = None
+                        if faculty_id:
+                            try:
+                                faculty_user = CustomUser.objects.get(pk=int(faculty_id))
+                            except Exception:
+                                pass
                     
-                    # Create/update CourseAllocation and FacultyAssignment
-                    if hod_assignment:
-                        CourseAllocation = apps.get_model('hod', 'CourseAllocation')
-                        FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
-                        course_alloc, _ = CourseAllocation.objects.get_or_create(
-                            hod_assignment=hod_assignment,
+                        sc, created = SchemeCourse.objects.update_or_create(
+                            branch=branch,
+                            year=int(year),
+                            semester=int(semester),
                             course_code=code,
                             defaults={
                                 'course_title': title or '',
-                                'course_category': section.upper(),
-                                'teaching_hours_L': 0,
-                                'teaching_hours_T': 0,
-                                'teaching_hours_P': 0,
-                                'credits': 0
+                                'category': section.upper(),
+                                'is_elective': True,
+                                'faculty': faculty_user,
                             }
                         )
-                        if faculty_id:
-                            try:
-                                faculty_profile, _ = Faculty.objects.get_or_create(
-                                    user=u,
-                                    defaults={'department': getattr(hod_assignment.branch, 'name', '') if hod_assignment else ''}
-                                )
-                                FacultyAssignment.objects.update_or_create(
-                                    course_allocation=course_alloc,
-                                    defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
-                                )
-                            except Exception:
-                                pass
-            except Exception as e:
-                logger.exception("Error saving additional elective %s: %s", code, e)
+                    
+                        # Create/update CourseAllocation and FacultyAssignment
+                        if hod_assignment:
+                            CourseAllocation = apps.get_model('hod', 'CourseAllocation')
+                            FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
+                            course_alloc, _ = CourseAllocation.objects.get_or_create(
+                                hod_assignment=hod_assignment,
+                                course_code=code,
+                                defaults={
+                                    'course_title': title or '',
+                                    'course_category': section.upper(),
+                                    'teaching_hours_L': 0,
+                                    'teaching_hours_T': 0,
+                                    'teaching_hours_P': 0,
+                                    'credits': 0
+                                }
+                            )
+                            if faculty_id:
+                                try:
+                                    faculty_profile, _ = Faculty.objects.get_or_create(
+                                        user=u,
+                                        defaults={'department': getattr(hod_assignment.branch, 'name', '') if hod_assignment else ''}
+                                    )
+                                    FacultyAssignment.objects.update_or_create(
+                                        course_allocation=course_alloc,
+                                        defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
+                                    )
+                                except Exception:
+                                    pass
+                except Exception as e:
+                    logger.exception("Error saving elective %s: %s", code, e)
             
-            posted_elective_rows.append({
-                'section': section.upper(),
-                'code': code,
-                'title': title,
-                'faculty_name': faculty_name,
-            })
-            j_add += 1
-
-    # After saving POST data, always fetch from DB to ensure all saved rows are included
+                posted_elective_rows.append({
+                    'section': section.upper(),
+                    'code': code,
+                    'title': title,
+                    'faculty_name': faculty_name,
+                })
+        
+            # Process additional elective rows (additional_pec_code_1, etc.)
+            for j_add in elective_indices.get(f'additional_{section}', ()):
+                code = pg(f'additional_{section}_code_{j_add}', '').strip()
+                title = pg(f'additional_{section}_title_{j_add}', '').strip()
+                if not code and not title:
+                    continue
+            
+                faculty_name = ''
+                faculty_id = pg(f'additional_{section}_faculty_{j_add}')
+                if faculty_id:
+                    try:
+                        u = CustomUser.objects.get(pk=int(faculty_id))
+                        faculty_name = u.get_full_name() or u.username
+                    except Exception:
+                        faculty_name = ''
+            
+                # Save additional elective to DB before PDF generation
+                try:
+                    SchemeCourse = apps.get_model('hod', 'SchemeCourse')
+                    with transaction.atomic():
+                        faculty_user = None
+                        if faculty_id:
+                            try:
+                                faculty_user = CustomUser.objects.get(pk=int(faculty_id))
+                            except Exception:
+                                pass
+                    
+                        sc, created = SchemeCourse.objects.update_or_create(
+                            branch=branch,
+                            year=int(year),
+                            semester=int(semester),
+                            course_code=code,
+                            defaults={
+                                'course_title': title or '',
+                                'category': section.upper(),
+                                'is_elective': True,
+                                'faculty': faculty_user,
+                            }
+                        )
+                    
+                        # Create/update CourseAllocation and FacultyAssignment
+                        if hod_assignment:
+                            CourseAllocation = apps.get_model('hod', 'CourseAllocation')
+                            FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
+                            course_alloc, _ = CourseAllocation.objects.get_or_create(
+                                hod_assignment=hod_assignment,
+                                course_code=code,
+                                defaults={
+                                    'course_title': title or '',
+                                    'course_category': section.upper(),
+                                    'teaching_hours_L': 0,
+                                    'teaching_hours_T': 0,
+                                    'teaching_hours_P': 0,
+                                    'credits': 0
+                                }
+                            )
+                            if faculty_id:
+                                try:
+                                    faculty_profile, _ = Faculty.objects.get_or_create(
+                                        user=u,
+                                        defaults={'department': getattr(hod_assignment.branch, 'name', '') if hod_assignment else ''}
+                                    )
+                                    FacultyAssignment.objects.update_or_create(
+                                        course_allocation=course_alloc,
+                                        defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
+                                    )
+                                except Exception:
+                                    pass
+                except Exception as e:
+                    logger.exception("Error saving additional elective %s: %s", code, e)
+            
+                posted_elective_rows.append({
+                    'section': section.upper(),
+                    'code': code,
+                    'title': title,
+                    'faculty_name': faculty_name,
+                })
+
+    # After saving POST data, always fetch from DB to ensure all saved rows are included
     # This ensures that even if POST data is incomplete, all persisted rows appear in PDF
     # _fetch_db_rows_for_scheme already includes dean courses, so use it as the source of truth
     hod_scheme_rows = _fetch_db_rows_for_scheme(branch, int(year), int(semester))
     if isinstance(hod_scheme_rows, tuple):
         hod_main, hod_elec = hod_scheme_rows
-        # Use DB-fetched rows as base (includes dean courses + HOD scheme courses)
-        main_rows = hod_main[:]
-        
-        # If POST had main rows that aren't in DB yet (edge case), merge them
-        if found_post and posted_main_rows:
-            db_codes = {r.get('code') for r in main_rows}
-            for posted_row in posted_main_rows:
-                if posted_row.get('code') not in db_codes:
-                    main_rows.append(posted_row)
-        
-        # Use DB-fetched elective rows as base
-        elective_rows = hod_elec[:]
-        
-        # If POST had elective rows that aren't in DB yet, merge them (avoid duplicates by code)
-        if found_post and posted_elective_rows:
-            db_elec_codes = {e.get('code') for e in elective_rows}
-            for posted_elec in posted_elective_rows:
-                if posted_elec.get('code') not in db_elec_codes:
-                    elective_rows.append(posted_elec)
+        # DB-fetched rows are the base (dean courses + HOD scheme courses); POSTed rows that
+        # aren't in the DB yet (edge case) are appended, avoiding duplicates by code
+        db_codes = {r.get('code') for r in hod_main}
+        main_rows = hod_main + [r for r in posted_main_rows if r.get('code') not in db_codes]
+        db_elec_codes = {e.get('code') for e in hod_elec}
+        elective_rows = hod_elec + [e for e in posted_elective_rows if e.get('code') not in db_elec_codes]
     else:
-        # Fallback: use dean_rows + posted data if DB fetch fails
-        main_rows = dean_rows[:]
-        if found_post:
-            main_rows.extend(posted_main_rows)
+        # Fallback: dean courses followed by the posted data if the DB fetch fails
+        main_rows = list(_iter_scheme_main_rows(dean_values, posted_main_rows))
         elective_rows = posted_elective_rows[:]
 
     # Build PDF bytes
@@ -1399,9 +1574,9 @@ def generate_pdf_view(request, branch_pk, year, semester):
 
     # Save to SchemeDocument
     filename = f"Scheme_{branch.name.replace(' ','_')}_{year}_Sem{semester}_{datetime.now().strftime('%Y%m%d%H%M%S')}.pdf"
+    sd = None
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        sd = SchemeDocument.objects.create(
+        sd = SchemeDocument(
             branch=branch,  # ← Make sure this is the branch OBJECT, not pk
             branch_name=branch.name, 
             year=int(year), 
@@ -1410,105 +1585,273 @@ def generate_pdf_view(request, branch_pk, year, semester):
             created_by=request.user,
             is_deleted=False  # ← Ensure this is set to False
         )
-        sd.pdf_file.save(filename, ContentFile(pdf_bytes))
-        sd.save()
+        # Writes the file through upload_to and INSERTs the unsaved row in one save()
+        sd.pdf_file.save(filename, ContentFile(pdf_bytes), save=True)
         messages.success(request, "Scheme PDF generated and saved successfully.")
         logger.info("SchemeDocument created: %s (branch=%s, year=%s, sem=%s, user=%s)", 
                     sd.pk, branch.name, year, semester, request.user.username)
     except Exception as e:
         logger.exception("Failed to save SchemeDocument: %s", e)
         messages.warning(request, f"PDF generated but failed to store in history: {e}")
+        sd = None
 
-    # Return download response
+    # Stream the stored copy back in chunks; fall back to the in-memory bytes if storing failed
+    if sd is not None and sd.pk and sd.pdf_file:
+        return _stored_pdf_response(sd.pdf_file, filename, as_attachment=True)
     response = HttpResponse(pdf_bytes, content_type='application/pdf')
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     return response
 
-# Add this complete helper function to build the full scheme PDF
-
-def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_rows=None):
-    """
-    Build a complete scheme PDF with:
-    1. Cover page with border
-    2. Vision & Mission page with border
-    3. PEOs & POs page with border
-    4. POs & PSOs page with border
-    5. Scheme of Evaluation page with border
-    6. Course Types page with border
-    7. Scheme table page with border
-    """
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-    from reportlab.pdfgen import canvas
-
-    buffer = BytesIO()
-    
-    # Base font size for scheme pages (use Times family)
-    SCHEME_BASE_FONT = 14  # user preference: 12 or 14; using 14 to make content larger
-    HEADING_FONT_SIZE = SCHEME_BASE_FONT
-    BODY_FONT_SIZE = SCHEME_BASE_FONT - 2
-    # Spacing constants for consistent layout
-    HEADING_SPACING = 0.12*inch
-    PARAGRAPH_SPACING = 0.08*inch
-    # Table & border appearance constants
-    TABLE_HEADER_BG = colors.HexColor('#D5D1D1')  # subtle grey header
-    TABLE_ROW_ALTERNATE = [colors.white, colors.HexColor('#F7F7F7')]
-    TABLE_CELL_PADDING = (6, 4)
-    BORDER_STROKE_WIDTH = 1.2
-    BORDER_RADIUS = 8
-    PAGE_MARGIN = 0.25*inch
-
-    # ===== CUSTOM CANVAS CLASS FOR BORDERS ON EVERY PAGE =====
-    class BorderedPageCanvas(canvas.Canvas):
-        """Canvas that draws black borders on every page for scheme PDFs"""
-        def __init__(self, *args, **kwargs):
-            canvas.Canvas.__init__(self, *args, **kwargs)
-            self._pagesize = A4
+# ===== COMPLETE SCHEME PDF =====
+# Base font size for scheme pages (use Times family)
+SCHEME_BASE_FONT = 14  # user preference: 12 or 14; using 14 to make content larger
+HEADING_FONT_SIZE = SCHEME_BASE_FONT
+BODY_FONT_SIZE = SCHEME_BASE_FONT - 2
+# Spacing constants for consistent layout
+HEADING_SPACING = 0.12*inch
+PARAGRAPH_SPACING = 0.08*inch
+# Table & border appearance constants
+TABLE_HEADER_BG = colors.HexColor('#D5D1D1')  # subtle grey header
+TABLE_ROW_ALTERNATE = [colors.white, colors.HexColor('#F7F7F7')]
+TABLE_CELL_PADDING = (6, 4)
+BORDER_STROKE_WIDTH = 1.2
+BORDER_RADIUS = 8
+PAGE_MARGIN = 0.25*inch
+
+# Paragraph styles and static text of the scheme PDF, built once at import. Paragraph
+# flowables are not shared because reportlab mutates them during wrap/split.
+_SCHEME_STYLES = getSampleStyleSheet()
+_BULLET_POINT_STYLE = ParagraphStyle('MissionPoint', parent=_SCHEME_STYLES['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+4, fontName='Times-Roman')
+_PO_PAGE3_STYLE = ParagraphStyle('POPoint', parent=_SCHEME_STYLES['Normal'], fontSize=SCHEME_BASE_FONT-1, alignment=TA_JUSTIFY, leading=SCHEME_BASE_FONT+1, fontName='Times-Roman')
+_PO_PAGE4_STYLE = ParagraphStyle('POPoint', parent=_SCHEME_STYLES['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')
+# List point variants carry the gap below each point themselves instead of a Spacer per point
+_POINT_STYLE = ParagraphStyle('Point', parent=_BULLET_POINT_STYLE, spaceAfter=PARAGRAPH_SPACING)
+_PO_PAGE3_POINT_STYLE = ParagraphStyle('POPage3Point', parent=_PO_PAGE3_STYLE, spaceAfter=PARAGRAPH_SPACING)
+_PO_PAGE4_POINT_STYLE = ParagraphStyle('POPage4Point', parent=_PO_PAGE4_STYLE, spaceAfter=PARAGRAPH_SPACING)
+_SCHEME_TABLE_TITLE_STYLE = ParagraphStyle('SchemeTableTitle', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+4, alignment=TA_CENTER, fontName='Times-Bold', textColor=colors.HexColor('#008000'))
+_SCHEME_HEADER_STYLE = ParagraphStyle('Header', parent=_SCHEME_STYLES['Normal'], fontSize=11, alignment=TA_CENTER, fontName='Times-Bold', leading=12)
+_SCHEME_DATA_STYLE = ParagraphStyle('Data', parent=_SCHEME_STYLES['Normal'], fontSize=10, alignment=TA_CENTER, leading=11, fontName='Times-Roman')
+_SCHEME_TITLE_STYLE = ParagraphStyle('Title', parent=_SCHEME_STYLES['Normal'], fontSize=10, alignment=TA_LEFT, leading=11, fontName='Times-Roman')
+_ELECTIVE_TITLE_STYLE = ParagraphStyle('ElectiveTitle', parent=_SCHEME_STYLES['Normal'], fontSize=9, alignment=TA_CENTER, fontName='Times-Bold')
+_ELECTIVE_SECTION_STYLE = ParagraphStyle('ElectiveSection', parent=_SCHEME_STYLES['Normal'], fontSize=SCHEME_BASE_FONT, alignment=TA_LEFT, fontName='Times-Bold')
+_ELECTIVE_HEADER_STYLE = ParagraphStyle('EH', parent=_SCHEME_STYLES['Normal'], fontSize=9, alignment=TA_CENTER, fontName='Times-Bold')
+_ELECTIVE_DATA_STYLE = ParagraphStyle('ED', parent=_SCHEME_STYLES['Normal'], fontSize=9, alignment=TA_LEFT, fontName='Times-Roman')
+_HEADING_STYLE = ParagraphStyle('Heading', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold')
+_LEFT_HEADING_STYLE = ParagraphStyle('LeftHeading', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_LEFT, fontName='Times-Bold')
+_GREEN_HEADING_STYLE = ParagraphStyle('GreenHeading', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold', textColor=colors.HexColor('#008000'))
+_SECTION_TITLE_STYLE = ParagraphStyle('SectionTitle', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+4, alignment=TA_CENTER, fontName='Times-Bold')
+_PAGE_TITLE_STYLE = ParagraphStyle('PageTitle', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
+_PAGE_TITLE_LEFT_STYLE = ParagraphStyle('PageTitleLeft', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_LEFT, fontName='Times-Bold')
+_BLUE_SECTION_STYLE = ParagraphStyle('BlueSection', parent=_SCHEME_STYLES['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_LEFT, fontName='Times-Bold', textColor=colors.HexColor('#4472C4'))
+_BODY_CENTER_STYLE = ParagraphStyle('BodyCenter', parent=_SCHEME_STYLES['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_CENTER, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')
+_BODY_LEFT_STYLE = ParagraphStyle('BodyLeft', parent=_SCHEME_STYLES['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_LEFT, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')
+_BODY_PLAIN_LEFT_STYLE = ParagraphStyle('BodyPlainLeft', parent=_SCHEME_STYLES['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_LEFT, fontName='Times-Roman')
+_SCHEME_FOOTER_STYLE = ParagraphStyle('Footer', parent=_SCHEME_STYLES['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Italic')
+
+# Header rows of the scheme tables, parsed once. Each table gets shallow copies because
+# wrap() stores layout state on the Paragraph; the parsed fragments are shared.
+_SCHEME_HEADER_CELLS = tuple(Paragraph(text, _SCHEME_HEADER_STYLE) for text in (
+    'Sl. No', 'Course<br/>Category', 'Course<br/>Code', 'Course Title', 'L', 'T', 'P',
+    'Total', 'CIE', 'SEE', 'Total', 'Credits', 'Assign<br/>Faculty',
+))
+_ELECTIVE_HEADER_CELLS = tuple(Paragraph(text, _ELECTIVE_HEADER_STYLE) for text in (
+    'Course Code', 'Course Title', 'Assign Faculty',
+))
+
+# Table styles shared by every scheme PDF (TableStyle is only read by Table.setStyle)
+_EVAL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), TABLE_HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), HEADING_FONT_SIZE),
+    ('GRID', (0, 0), (-1, -1), 0.6, colors.black),
+    ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+    ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT_SIZE),
+    ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), TABLE_ROW_ALTERNATE),
+    ('LEFTPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[0]),
+    ('RIGHTPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[0]),
+    ('TOPPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[1]),
+    ('BOTTOMPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[1]),
+])
+_EXAM_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#D3D3D3")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), HEADING_FONT_SIZE),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+    ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT_SIZE),
+    ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
+])
+_COURSE_TYPES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), TABLE_HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), HEADING_FONT_SIZE),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')]),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT_SIZE),
+    ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+])
+_SCHEME_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#D3D3D3")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')]),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('LEADING', (0, 1), (-1, -1), 11),
+    ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+    ('TOPPADDING', (0, 0), (-1, 0), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+])
+_ELECTIVE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#D9DBDE")),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F9F9F9')]),
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('FONTNAME', (0, 0), (-1, -1), 'Times-Roman'),
+    # plain-string code column matches the 9pt elective data style
+    ('FONTSIZE', (0, 1), (0, -1), 9),
+    ('VALIGN', (0, 1), (0, -1), 'TOP'),
+])
+
+ELECTIVE_SECTION_NAMES = {
+    'PEC': 'Professional Elective Course (PEC)',
+    'OEC': 'Open Elective Course (OEC)',
+    'ESC': 'Engineering Science Course (ESC)',
+    'AEC': 'Ability Enhancement Course (AEC)',
+}
+
+MISSION_POINTS = (
+    "Create conducive environment for learning and research",
+    "Establish industry and academia collaborations",
+    "Ensure professional and ethical values in all institutional endeavors",
+)
+DEPT_MISSION_POINTS = (
+    "1. To make students competent to contribute towards the development of IT field.",
+    "2. Promote learning and practice of latest tools and technologies among students and prepare them for diverse career options.",
+    "3. Collaborate with industry and institutes of higher learning for Research and Development, innovations and continuing education.",
+    "4. Developing capacity of teachers in terms of their teaching and research abilities.",
+    "5. Develop software applications to solve engineering and societal problems.",
+)
+PEO_POINTS = (
+    "<b>PEO1:</b> Be successful professionals in IT industry with good design, coding and testing skills, capable of assimilating new information and solve new problems.",
+    "<b>PEO2:</b> Communicate proficiently and collaborate successfully with peers, colleagues and organizations.",
+    "<b>PEO3:</b> Be ethical and responsible members of the computing profession and society.",
+    "<b>PEO4:</b> Acquire necessary skills for research, higher studies, entrepreneurship and continued learning to adopt and create new applications.",
+)
+PO_POINTS_PAGE3 = (
+    "<b>1. Engineering knowledge:</b> Apply knowledge of mathematics, natural science, computing, engineering fundamentals and an engineering specialization as specified in WK1 to WK4 respectively to develop to the solution of complex engineering problems.",
+    "<b>2. Problem analysis:</b> Identify, formulate, review research literature, and analyze complex engineering problems reaching substantiated conclusions with consideration for sustainable development. (WK1 to WK4)",
+    "<b>3. Design/Development of solutions:</b> Design creative solutions for complex engineering problems and design/develop systems/components/processes to meet identified needs with consideration for the public health and safety, whole-life cost, net zero carbon, culture, society and environment as required. (WK5)",
+    "<b>4. Conduct investigations of complex problems:</b> Conduct investigations of complex engineering problems using research-based knowledge including design of experiments, modelling, analysis & interpretation of data to provide valid conclusions. (WK8).",
+    "<b>5. Modern tool usage:</b> Create, select and apply appropriate techniques, resources and modern engineering & IT tools, including prediction and modelling recognizing their limitations to solve complex engineering problems. (WK2 and WK6)",
+    "<b>6. The engineer and the world:</b> Analyze and evaluate societal and environmental aspects while solving complex engineering problems for its impact on sustainability with reference to economy, health, safety, legal framework, culture and environment. (WK1, WK5, and WK7).",
+)
+PO_POINTS_PAGE4 = (
+    "<b>7. Environment and sustainability:</b> Understand the impact of the professional engineering solutions in societal and environmental contexts, and demonstrate the knowledge of, and need for sustainable development.",
+    "<b>8. Ethics:</b> Apply ethical principles and commit to professional ethics, human values, diversity and inclusion; adhere to national & international laws. (WK9)",
+    "<b>9. Individual and collaborative team work:</b> Function effectively as an individual, and as a member or leader in diverse/multi-disciplinary settings.",
+    "<b>10. Communication:</b> Communicate effectively and inclusively within the community and society at large, such as being able to comprehend and write effective reports and design documentation, make effective presentations considering cultural, language, and learning differences.",
+    "<b>11. Project management and finance:</b> Apply knowledge and understanding of engineering management principles and economic decision-making and apply these to one's own work, as a member and leader in a team, and to manage projects and in multidisciplinary environments.",
+    "<b>12. Life-long learning:</b> Recognize the need for, and have the preparation and ability for i) independent and life-long learning ii) adaptability to new and emerging technologies and iii) critical thinking in the broadest context of technological change. (WK8)",
+)
+# Page 6 course-type table (header row first); plain strings, no Paragraph wrapping needed
+COURSE_TYPES_TABLE_DATA = (
+    ('Course Type', 'Abbreviation'),
+    ('Basic Science Course', 'BSC'),
+    ('Engineering Science Course', 'ESC'),
+    ('Emerging Technology Course', 'ETC'),
+    ('Programming Language Course', 'PLC'),
+    ('Professional Core Course', 'PCC'),
+    ('Integrated Professional Core Course', 'IPCC'),
+    ('Professional Core Course Laboratory', 'PCCL'),
+    ('Professional Elective Course', 'PEC'),
+    ('Open Elective Course', 'OEC'),
+    ('Project/Mini Project/Internship', 'PI'),
+    ('Humanities and Social Sciences, Management Course', 'HSMC'),
+    ('Ability Enhancement Course', 'AEC'),
+    ('Skill Enhancement Course', 'SEC'),
+    ('Universal Human Value Course', 'UHV'),
+    ('Non-credit Mandatory Course', 'MC'),
+)
+PSO_POINTS = (
+    "Design and Develop efficient information systems for organizational needs.",
+    "Ability to adopt software engineering principles and work with various standards of Computing Systems.",
+)
+
+
+# ===== CUSTOM CANVAS CLASS FOR BORDERS ON EVERY PAGE =====
+class BorderedPageCanvas(canvas.Canvas):
+    """Canvas that draws black borders on every page for scheme PDFs"""
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self._pagesize = A4
+
+    def showPage(self):
+        """Draw rounded border before showing page"""
+        border_margin = 0.06 * inch  # slightly smaller margin for more usable space
+        page_width, page_height = self._pagesize
+
+        self.setLineWidth(3)
+        self.setStrokeColor(colors.black)
+        # draw rounded rectangle for a refined look
+        radius = 14
+        self.roundRect(
+            border_margin,
+            border_margin,
+            page_width - (2 * border_margin),
+            page_height - (2 * border_margin),
+            radius,
+            stroke=1,
+            fill=0
+        )
+        canvas.Canvas.showPage(self)
 
-        def showPage(self):
-            """Draw rounded border before showing page"""
-            border_margin = 0.06 * inch  # slightly smaller margin for more usable space
-            page_width, page_height = self._pagesize
-            
-            self.setLineWidth(3)
-            self.setStrokeColor(colors.black)
-            # draw rounded rectangle for a refined look
-            radius = 14
-            self.roundRect(
-                border_margin,
-                border_margin,
-                page_width - (2 * border_margin),
-                page_height - (2 * border_margin),
-                radius,
-                stroke=1,
-                fill=0
-            )
-            canvas.Canvas.showPage(self)
 
-    doc = SimpleDocTemplate(
+def _new_scheme_doc(buffer):
+    """A4 document template shared by every part of the complete scheme PDF."""
+    return SimpleDocTemplate(
         buffer,
         pagesize=A4,
         topMargin=PAGE_MARGIN,
         bottomMargin=PAGE_MARGIN,
         leftMargin=PAGE_MARGIN,
-        rightMargin=PAGE_MARGIN
+        rightMargin=PAGE_MARGIN,
+        # always deflate page streams, whatever the installation's rl_config default is
+        pageCompression=1
     )
+
+
+def _scheme_front_matter_elements(branch_name, year):
+    """
+    Flowables for the front matter of the scheme PDF (pages 1-6): cover, vision & mission,
+    PEOs, POs & PSOs, scheme of evaluation and course types.
+    """
     # compute usable width for tables
     available_width = A4[0] - 2 * PAGE_MARGIN - 0.2*inch
     elements = []
-    styles = getSampleStyleSheet()
 
     # ===== PAGE 1: COVER PAGE =====
     try:
-        from reportlab.platypus import Image as RLImage
-        logo_path = os.path.join(settings.BASE_DIR, "users", "static", "images", "malnad_college_of_engineering_logo.jpeg")
-        if os.path.exists(logo_path):
+        if LOGO_EXISTS:
             # Use a larger logo on the cover and push it lower so the content block centers
-            logo = RLImage(logo_path, width=1.6*inch, height=1.6*inch)
+            logo = RLImage(LOGO_PATH, width=1.6*inch, height=1.6*inch)
             # raise top offset so the heading block centers more precisely
             elements.append(Spacer(1, 1.05*inch))
             logo_table = Table([[logo]], colWidths=[1.6*inch])
@@ -1521,24 +1864,24 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     elements.append(Paragraph(
         "<b>MALNAD COLLEGE OF ENGINEERING, HASSAN</b><br/>"
         "(An Autonomous Institution Affiliated to VTU, Belagavi)",
-        ParagraphStyle('CoverTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold')
+        _HEADING_STYLE
     ))
     # add a little extra vertical gap so the title doesn't crowd the logo
     elements.append(Spacer(1, 0.12*inch))
 
     elements.append(Paragraph(
         "<b>Autonomous Programme</b><br/><b>Bachelor of Engineering</b>",
-        ParagraphStyle('Program', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold')
+        _HEADING_STYLE
     ))
     elements.append(Spacer(1, 0.14*inch))
     # ADDITIONAL GAP: separate Program and Department lines to avoid crowding
     elements.append(Spacer(1, 0.28*inch))
 
-    if branch:
+    if branch_name:
         elements.append(Paragraph(
-            f"<b>Department Of<br/>{branch.name.upper()}</b>",
+            f"<b>Department Of<br/>{branch_name.upper()}</b>",
             # add at least 5pt extra leading so department line segments don't collide
-            ParagraphStyle('Dept', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold', textColor=colors.HexColor('#008000'))
+            _GREEN_HEADING_STYLE
         ))
         # slightly larger gap after department so the following block shifts down
         elements.append(Spacer(1, 0.35*inch))
@@ -1547,7 +1890,7 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
 
     elements.append(Paragraph(
         f"<b>SCHEME AND SYLLABUS</b><br/><b>(2023 Admitted Batch)</b><br/><br/><b>Academic Year {year}-{year+1}</b>",
-        ParagraphStyle('SchemeInfo', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+4, alignment=TA_CENTER, fontName='Times-Bold')
+        _SECTION_TITLE_STYLE
     ))
     # small gap so the block breathes before page break
     elements.append(Spacer(1, 1.0*inch))
@@ -1558,58 +1901,42 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     elements.append(Spacer(1, 0.45*inch))
     elements.append(Paragraph(
         "<b>VISION OF THE INSTITUTE</b>",
-        ParagraphStyle('SectionTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+4, alignment=TA_CENTER, fontName='Times-Bold')
+        _SECTION_TITLE_STYLE
     ))
     elements.append(Spacer(1, HEADING_SPACING))
     elements.append(Paragraph(
         "To be an institute of excellence in engineering education and research, producing socially responsible professionals.",
-        ParagraphStyle('Vision', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+4, fontName='Times-Roman')
+        _BULLET_POINT_STYLE
     ))
     elements.append(Spacer(1, PARAGRAPH_SPACING))
 
     elements.append(Paragraph(
         "<b>MISSION OF THE INSTITUTE</b>",
-        ParagraphStyle('SectionTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+4, alignment=TA_CENTER, fontName='Times-Bold')
+        _SECTION_TITLE_STYLE
     ))
     elements.append(Spacer(1, HEADING_SPACING))
-    mission_points = [
-        "Create conducive environment for learning and research",
-        "Establish industry and academia collaborations",
-        "Ensure professional and ethical values in all institutional endeavors"
-    ]
-    for point in mission_points:
-        elements.append(Paragraph(f"• {point}", ParagraphStyle('MissionPoint', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+4, fontName='Times-Roman')))
-        elements.append(Spacer(1, PARAGRAPH_SPACING))
+    elements.extend(Paragraph(f"• {point}", _POINT_STYLE) for point in MISSION_POINTS)
     
     elements.append(Spacer(1, 0.20*inch))
-    if branch:
+    if branch_name:
         elements.append(Paragraph(
-            f"<b>VISION OF THE {branch.name.upper()} DEPARTMENT</b>",
-            ParagraphStyle('DeptTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold')
+            f"<b>VISION OF THE {branch_name.upper()} DEPARTMENT</b>",
+            _HEADING_STYLE
         ))
         elements.append(Spacer(1, HEADING_SPACING))
         elements.append(Paragraph(
             "The department will be a premier centre focusing on knowledge dissemination and generation to address the emerging needs of information technology in diverse fields.",
-            ParagraphStyle('DeptVision', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+4, fontName='Times-Roman')
+            _BULLET_POINT_STYLE
         ))
         # a touch more space before the department mission heading
         elements.append(Spacer(1, PARAGRAPH_SPACING))
 
         elements.append(Paragraph(
-            f"<b>MISSION OF THE {branch.name.upper()} DEPARTMENT</b>",
-            ParagraphStyle('DeptMission', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_CENTER, fontName='Times-Bold')
+            f"<b>MISSION OF THE {branch_name.upper()} DEPARTMENT</b>",
+            _HEADING_STYLE
         ))
         elements.append(Spacer(1, HEADING_SPACING))
-        dept_mission = [
-            "1. To make students competent to contribute towards the development of IT field.",
-            "2. Promote learning and practice of latest tools and technologies among students and prepare them for diverse career options.",
-            "3. Collaborate with industry and institutes of higher learning for Research and Development, innovations and continuing education.",
-            "4. Developing capacity of teachers in terms of their teaching and research abilities.",
-            "5. Develop software applications to solve engineering and societal problems."
-        ]
-        for point in dept_mission:
-            elements.append(Paragraph(point, ParagraphStyle('DeptPoint', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+4, fontName='Times-Roman')))
-            elements.append(Spacer(1, PARAGRAPH_SPACING))
+        elements.extend(Paragraph(point, _POINT_STYLE) for point in DEPT_MISSION_POINTS)
 
     # Remove hard page break so PEOs can flow onto the previous (Vision & Mission) page; add a small spacer
     elements.append(Spacer(1, 0.25*inch))
@@ -1621,26 +1948,17 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     elements.append(Paragraph(
         "<b>PROGRAM EDUCATIONAL OBJECTIVES (PEOs)</b>",
         
-        ParagraphStyle('PEOTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+4, alignment=TA_CENTER, fontName='Times-Bold')
+        _SECTION_TITLE_STYLE
     ))
     elements.append(Spacer(1, HEADING_SPACING))
     
     elements.append(Paragraph(
         "<b>Graduates will:</b>",
-        ParagraphStyle('GraduatesWill', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+2, alignment=TA_LEFT, fontName='Times-Bold')
+        _LEFT_HEADING_STYLE
     ))
     elements.append(Spacer(1, HEADING_SPACING))
     
-    peo_points = [
-        "<b>PEO1:</b> Be successful professionals in IT industry with good design, coding and testing skills, capable of assimilating new information and solve new problems.",
-        "<b>PEO2:</b> Communicate proficiently and collaborate successfully with peers, colleagues and organizations.",
-        "<b>PEO3:</b> Be ethical and responsible members of the computing profession and society.",
-        "<b>PEO4:</b> Acquire necessary skills for research, higher studies, entrepreneurship and continued learning to adopt and create new applications."
-    ]
-    
-    for point in peo_points:
-        elements.append(Paragraph(point, ParagraphStyle('PEOPoint', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+4, fontName='Times-Roman')))
-        elements.append(Spacer(1, PARAGRAPH_SPACING))
+    elements.extend(Paragraph(point, _POINT_STYLE) for point in PEO_POINTS)
 
     elements.append(Spacer(1, PARAGRAPH_SPACING))
     # Start POs on a new page so PEOs remain on the previous page
@@ -1649,67 +1967,38 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     
     elements.append(Paragraph(
         "<b>PROGRAM OUTCOMES (POs)</b>",
-        ParagraphStyle('POTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
+        _PAGE_TITLE_STYLE
     ))
     elements.append(Spacer(1, HEADING_SPACING))
     
-    po_points_page3 = [
-        "<b>1. Engineering knowledge:</b> Apply knowledge of mathematics, natural science, computing, engineering fundamentals and an engineering specialization as specified in WK1 to WK4 respectively to develop to the solution of complex engineering problems.",
-        "<b>2. Problem analysis:</b> Identify, formulate, review research literature, and analyze complex engineering problems reaching substantiated conclusions with consideration for sustainable development. (WK1 to WK4)",
-        "<b>3. Design/Development of solutions:</b> Design creative solutions for complex engineering problems and design/develop systems/components/processes to meet identified needs with consideration for the public health and safety, whole-life cost, net zero carbon, culture, society and environment as required. (WK5)",
-        "<b>4. Conduct investigations of complex problems:</b> Conduct investigations of complex engineering problems using research-based knowledge including design of experiments, modelling, analysis & interpretation of data to provide valid conclusions. (WK8).",
-        "<b>5. Modern tool usage:</b> Create, select and apply appropriate techniques, resources and modern engineering & IT tools, including prediction and modelling recognizing their limitations to solve complex engineering problems. (WK2 and WK6)",
-        "<b>6. The engineer and the world:</b> Analyze and evaluate societal and environmental aspects while solving complex engineering problems for its impact on sustainability with reference to economy, health, safety, legal framework, culture and environment. (WK1, WK5, and WK7)."
-    ]
-    
-    for point in po_points_page3:
-        elements.append(Paragraph(point, ParagraphStyle('POPoint', parent=styles['Normal'], fontSize=SCHEME_BASE_FONT-1, alignment=TA_JUSTIFY, leading=SCHEME_BASE_FONT+1, fontName='Times-Roman')))
-        elements.append(Spacer(1, PARAGRAPH_SPACING))
+    elements.extend(Paragraph(point, _PO_PAGE3_POINT_STYLE) for point in PO_POINTS_PAGE3)
 
 
     # POs continued now flows on the same page as POs above; heading removed
     elements.append(Spacer(1, PARAGRAPH_SPACING))
     
-    po_points_page4 = [
-        "<b>7. Environment and sustainability:</b> Understand the impact of the professional engineering solutions in societal and environmental contexts, and demonstrate the knowledge of, and need for sustainable development.",
-        "<b>8. Ethics:</b> Apply ethical principles and commit to professional ethics, human values, diversity and inclusion; adhere to national & international laws. (WK9)",
-        "<b>9. Individual and collaborative team work:</b> Function effectively as an individual, and as a member or leader in diverse/multi-disciplinary settings.",
-        "<b>10. Communication:</b> Communicate effectively and inclusively within the community and society at large, such as being able to comprehend and write effective reports and design documentation, make effective presentations considering cultural, language, and learning differences.",
-        "<b>11. Project management and finance:</b> Apply knowledge and understanding of engineering management principles and economic decision-making and apply these to one's own work, as a member and leader in a team, and to manage projects and in multidisciplinary environments.",
-        "<b>12. Life-long learning:</b> Recognize the need for, and have the preparation and ability for i) independent and life-long learning ii) adaptability to new and emerging technologies and iii) critical thinking in the broadest context of technological change. (WK8)"
-    ]
-    
-    for point in po_points_page4:
-        elements.append(Paragraph(point, ParagraphStyle('POPoint', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')))
-        elements.append(Spacer(1, PARAGRAPH_SPACING))
+    elements.extend(Paragraph(point, _PO_PAGE4_POINT_STYLE) for point in PO_POINTS_PAGE4)
 
     elements.append(Spacer(1, 0.1*inch))
     
     elements.append(Paragraph(
         "<b>PROGRAM SPECIFIC OUTCOMES (PSOs)</b>",
-        ParagraphStyle('PSOTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
+        _PAGE_TITLE_STYLE
     ))
     elements.append(Spacer(1, HEADING_SPACING))
     
     pso_intro = "Upon graduation, students with a degree B.E. in Information Science & Engineering will be able to:"
-    elements.append(Paragraph(pso_intro, ParagraphStyle('PSOIntro', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')))
+    elements.append(Paragraph(pso_intro, _PO_PAGE4_STYLE))
     elements.append(Spacer(1, PARAGRAPH_SPACING))
     
-    pso_points = [
-        "Design and Develop efficient information systems for organizational needs.",
-        "Ability to adopt software engineering principles and work with various standards of Computing Systems."
-    ]
-    
-    for point in pso_points:
-        elements.append(Paragraph(f"• {point}", ParagraphStyle('PSOPoint', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_JUSTIFY, leading=BODY_FONT_SIZE+2, fontName='Times-Roman')))
-        elements.append(Spacer(1, PARAGRAPH_SPACING))
+    elements.extend(Paragraph(f"• {point}", _PO_PAGE4_POINT_STYLE) for point in PSO_POINTS)
 
     elements.append(PageBreak())
 
     # ===== PAGE 5: SCHEME OF EVALUATION =====
     elements.append(Paragraph(
         "<b>SCHEME OF EVALUATION (THEORY COURSES)</b>",
-        ParagraphStyle('EvalTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
+        _PAGE_TITLE_STYLE
     ))
     elements.append(Spacer(1, HEADING_SPACING))
 
@@ -1726,28 +2015,13 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     ]
     
     theory_table = Table(theory_eval_data, colWidths=[available_width*0.7, available_width*0.3])
-    theory_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), TABLE_HEADER_BG),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), HEADING_FONT_SIZE),
-        ('GRID', (0, 0), (-1, -1), 0.6, colors.black),
-        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT_SIZE),
-        ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), TABLE_ROW_ALTERNATE),
-        ('LEFTPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[0]),
-        ('RIGHTPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[0]),
-        ('TOPPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[1]),
-        ('BOTTOMPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[1]),
-    ]))
+    theory_table.setStyle(_EVAL_TABLE_STYLE)
     elements.append(theory_table)
     elements.append(Spacer(1, PARAGRAPH_SPACING))
 
     elements.append(Paragraph(
         "<b>SCHEME OF EVALUATION (LABORATORY COURSES)</b>",
-        ParagraphStyle('LabEvalTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
+        _PAGE_TITLE_STYLE
     ))
     elements.append(Spacer(1, 0.12*inch))
 
@@ -1760,29 +2034,14 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     ]
     
     lab_table = Table(lab_eval_data, colWidths=[available_width*0.72, available_width*0.28])
-    lab_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), TABLE_HEADER_BG),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), HEADING_FONT_SIZE),
-        ('GRID', (0, 0), (-1, -1), 0.6, colors.black),
-        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT_SIZE),
-        ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), TABLE_ROW_ALTERNATE),
-        ('LEFTPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[0]),
-        ('RIGHTPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[0]),
-        ('TOPPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[1]),
-        ('BOTTOMPADDING', (0,0), (-1,-1), TABLE_CELL_PADDING[1]),
-    ]))
+    lab_table.setStyle(_EVAL_TABLE_STYLE)
     elements.append(lab_table)
     elements.append(Spacer(1, PARAGRAPH_SPACING))
 
 
     elements.append(Paragraph(
         "<b>EXAMINATION DETAILS</b>",
-        ParagraphStyle('ExamTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
+        _PAGE_TITLE_STYLE
     ))
     elements.append(Spacer(1, 0.1*inch))
 
@@ -1793,17 +2052,7 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     ]
     
     exam_table = Table(exam_data, colWidths=[available_width*0.30, available_width*0.30, available_width*0.40])
-    exam_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#D3D3D3")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), HEADING_FONT_SIZE),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT_SIZE),
-        ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
-    ]))
+    exam_table.setStyle(_EXAM_TABLE_STYLE)
     elements.append(exam_table)
 
     elements.append(PageBreak())
@@ -1811,121 +2060,112 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
     # ===== PAGE 6: COURSE TYPES =====
     elements.append(Paragraph(
         "<b>COURSE TYPES</b>",
-        ParagraphStyle('CourseTypesTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Bold')
+        _PAGE_TITLE_STYLE
     ))
     elements.append(Spacer(1, 0.15*inch))
 
-    course_types_data = [
-        ['Basic Science Course', 'BSC'],
-        ['Engineering Science Course', 'ESC'],
-        ['Emerging Technology Course', 'ETC'],
-        ['Programming Language Course', 'PLC'],
-        ['Professional Core Course', 'PCC'],
-        ['Integrated Professional Core Course', 'IPCC'],
-        ['Professional Core Course Laboratory', 'PCCL'],
-        ['Professional Elective Course', 'PEC'],
-        ['Open Elective Course', 'OEC'],
-        ['Project/Mini Project/Internship', 'PI'],
-        ['Humanities and Social Sciences, Management Course', 'HSMC'],
-        ['Ability Enhancement Course', 'AEC'],
-        ['Skill Enhancement Course', 'SEC'],
-        ['Universal Human Value Course', 'UHV'],
-        ['Non-credit Mandatory Course', 'MC'],
-    ]
-
-    ct_table_data = [['Course Type', 'Abbreviation']]
-    ct_table_data.extend(course_types_data)
-    
-    ct_table = Table(ct_table_data, colWidths=[available_width*0.75, available_width*0.25])
-    ct_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), TABLE_HEADER_BG),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), HEADING_FONT_SIZE),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')]),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT_SIZE),
-        ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
-    ]))
+    ct_table = Table(COURSE_TYPES_TABLE_DATA, colWidths=[available_width*0.75, available_width*0.25], repeatRows=1, splitByRow=1)
+    ct_table.setStyle(_COURSE_TYPES_TABLE_STYLE)
     elements.append(ct_table)
     elements.append(PageBreak())
+    return elements
+
+
+# Fingerprint of the static front matter text; part of the shared cache key so a deploy that
+# edits the PO/PSO/mission text never serves pages rendered from the old wording
+_FRONT_MATTER_TEXT_VERSION = hashlib.sha1(repr((
+    MISSION_POINTS, DEPT_MISSION_POINTS, PEO_POINTS, PO_POINTS_PAGE3, PO_POINTS_PAGE4, PSO_POINTS,
+)).encode('utf-8')).hexdigest()[:12]
+SCHEME_FRONT_MATTER_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+@lru_cache(maxsize=16)
+def _scheme_front_matter_pdf(branch_name, year):
+    """
+    Render the front matter pages once per (branch name, year) and return the PDF bytes.
+    The pages depend on nothing else, so a renamed branch simply gets a new cache entry.
+    Rendered bytes are also kept in the Django cache so other worker processes reuse them.
+    """
+    key = "hod:scheme_front_matter:{}:{}:{}".format(
+        _FRONT_MATTER_TEXT_VERSION, hashlib.sha1((branch_name or '').encode('utf-8')).hexdigest()[:12], year
+    )
+    pdf_bytes = cache.get(key)
+    if pdf_bytes is None:
+        buffer = BytesIO()
+        _new_scheme_doc(buffer).build(_scheme_front_matter_elements(branch_name, year),
+                                      canvasmaker=BorderedPageCanvas)
+        pdf_bytes = buffer.getvalue()
+        cache.set(key, pdf_bytes, SCHEME_FRONT_MATTER_CACHE_TIMEOUT)
+    return pdf_bytes
+
+
+# Per-thread scratch buffers reused across scheme builds. They never leave the builder:
+# callers get either bytes (a copy) or the `output` stream they passed in and own.
+_SCRATCH = threading.local()
+
+
+def _scratch_buffer(name):
+    """Return this thread's reusable BytesIO for `name`, emptied and rewound."""
+    buffer = getattr(_SCRATCH, name, None)
+    if buffer is None:
+        buffer = BytesIO()
+        setattr(_SCRATCH, name, buffer)
+    else:
+        buffer.seek(0)
+        buffer.truncate(0)
+    return buffer
+
+
+def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_rows=None, output=None):
+    """
+    Build a complete scheme PDF with:
+    1. Cover page with border
+    2. Vision & Mission page with border
+    3. PEOs & POs page with border
+    4. POs & PSOs page with border
+    5. Scheme of Evaluation page with border
+    6. Course Types page with border
+    7. Scheme table page with border
+
+    Pages 1-6 are constant for a branch/year and are rendered once via
+    `_scheme_front_matter_pdf`; only the scheme table is laid out per call.
+
+    Returns the PDF bytes, or, when a writable `output` stream is given, writes the PDF
+    into it and returns the stream (no intermediate bytes copy).
+    """
+    branch_name = branch.name if branch else None
+    elements = []
 
     # ===== PAGE 7+: SCHEME TABLE =====
     if branch:
         elements.append(Paragraph(
             f"<b>{branch.name.upper()} — SEMESTER {semester} — {year}</b>",
-            ParagraphStyle('SchemeTableTitle', parent=styles['Normal'], fontSize=HEADING_FONT_SIZE, leading=HEADING_FONT_SIZE+4, alignment=TA_CENTER, fontName='Times-Bold', textColor=colors.HexColor('#008000'))
+            _SCHEME_TABLE_TITLE_STYLE
         ))
         # increase gap after branch heading so table doesn't sit too close; looks balanced across pages
         elements.append(Spacer(1, 0.18*inch))
 
         if main_rows:
-            header_style = ParagraphStyle('Header', parent=styles['Normal'], fontSize=11, alignment=TA_CENTER, fontName='Times-Bold', leading=12)
-            data_style = ParagraphStyle('Data', parent=styles['Normal'], fontSize=10, alignment=TA_CENTER, leading=11, fontName='Times-Roman')
-            title_style = ParagraphStyle('Title', parent=styles['Normal'], fontSize=10, alignment=TA_LEFT, leading=11, fontName='Times-Roman')
-
-            table_data = [[
-                Paragraph('Sl. No', header_style),
-                Paragraph('Course<br/>Category', header_style),
-                Paragraph('Course<br/>Code', header_style),
-                Paragraph('Course Title', header_style),
-                Paragraph('L', header_style),
-                Paragraph('T', header_style),
-                Paragraph('P', header_style),
-                Paragraph('Total', header_style),
-                Paragraph('CIE', header_style),
-                Paragraph('SEE', header_style),
-                Paragraph('Total', header_style),
-                Paragraph('Credits', header_style),
-                Paragraph('Assign<br/>Faculty', header_style),
-            ]]
-
-            row_num = 1
-            for row in main_rows:
-                l = int(row.get('l') or 0)
-                t = int(row.get('t') or 0)
-                p = int(row.get('p') or 0)
-                cie = int(row.get('cie') or 0)
-                see = int(row.get('see') or 0)
-                total_hours = l + t + p
-                total_marks = cie + see
-                
-                table_data.append([
-                    Paragraph(str(row_num), data_style),
-                    Paragraph(row.get('category', ''), data_style),
-                    Paragraph(row.get('code', ''), data_style),
+            data_style = _SCHEME_DATA_STYLE
+            title_style = _SCHEME_TITLE_STYLE
+
+            table_data = [[copy.copy(cell) for cell in _SCHEME_HEADER_CELLS]]
+            # short cells are plain strings styled by the TableStyle; only wrappable text is a Paragraph
+            table_data.extend(
+                [
+                    str(row_num), row.get('category', ''), row.get('code', ''),
                     Paragraph(row.get('title', ''), title_style),
-                    Paragraph(str(l), data_style),
-                    Paragraph(str(t), data_style),
-                    Paragraph(str(p), data_style),
-                    Paragraph(str(total_hours), data_style),
-                    Paragraph(str(cie), data_style),
-                    Paragraph(str(see), data_style),
-                    Paragraph(str(total_marks), data_style),
-                    Paragraph(str(row.get('credits', '')), data_style),
+                    str(row['l']), str(row['t']), str(row['p']), str(row['total_hours']),
+                    str(row['cie']), str(row['see']), str(row['total_marks']),
+                    str(row.get('credits', '')),
                     Paragraph(row.get('faculty_name', ''), data_style),
-                ])
-                row_num += 1
+                ]
+                for row_num, row in enumerate(map(_normalize_scheme_row, main_rows), 1)
+            )
 
             col_widths = [0.35*inch, 0.6*inch, 0.65*inch, 1.8*inch, 0.35*inch, 0.35*inch, 0.35*inch, 0.45*inch, 0.35*inch, 0.35*inch, 0.45*inch, 0.45*inch, 0.65*inch]
-            scheme_table = Table(table_data, colWidths=col_widths)
-            scheme_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#D3D3D3")),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')]),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('TOPPADDING', (0, 0), (-1, 0), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-            ]))
+            scheme_table = Table(table_data, colWidths=col_widths, repeatRows=1, splitByRow=1)
+            scheme_table.setStyle(_SCHEME_TABLE_STYLE)
             elements.append(scheme_table)
             elements.append(Spacer(1, 0.15*inch))
 
@@ -1933,88 +2173,117 @@ def _build_complete_scheme_pdf(branch, year, semester, main_rows=None, elective_
         if elective_rows:
             elements.append(Paragraph(
                 "<b>Elective/Enhancement Courses</b>",
-                ParagraphStyle('ElectiveTitle', parent=styles['Normal'], fontSize=9, alignment=TA_CENTER, fontName='Times-Bold')
+                _ELECTIVE_TITLE_STYLE
             ))
             elements.append(Spacer(1, 0.1*inch))
 
-            elective_sections = {}
+            elective_sections = defaultdict(list)
             for row in elective_rows:
-                section = row.get('section', 'ESC')
-                if section not in elective_sections:
-                    elective_sections[section] = []
-                elective_sections[section].append(row)
+                elective_sections[row.get('section', 'ESC')].append(row)
 
-            for section in ['PEC', 'OEC', 'ESC', 'AEC']:
+            for section, section_name in ELECTIVE_SECTION_NAMES.items():
                 if section in elective_sections:
-                    section_name = {
-                        'PEC': 'Professional Elective Course (PEC)',
-                        'OEC': 'Open Elective Course (OEC)',
-                        'ESC': 'Engineering Science Course (ESC)',
-                        'AEC': 'Ability Enhancement Course (AEC)'
-                    }[section]
-                    
+
                     elements.append(Paragraph(
                         f"<b>{section_name}</b>",
-                        ParagraphStyle('ElectiveSection', parent=styles['Normal'], fontSize=SCHEME_BASE_FONT, alignment=TA_LEFT, fontName='Times-Bold')
+                        _ELECTIVE_SECTION_STYLE
                     ))
                     elements.append(Spacer(1, 0.07*inch))
 
-                    elec_header_style = ParagraphStyle('EH', parent=styles['Normal'], fontSize=9, alignment=TA_CENTER, fontName='Times-Bold')
-                    elec_data_style = ParagraphStyle('ED', parent=styles['Normal'], fontSize=9, alignment=TA_LEFT, fontName='Times-Roman')
+                    elec_data_style = _ELECTIVE_DATA_STYLE
 
-                    elec_table_data = [[Paragraph('Course Code', elec_header_style), Paragraph('Course Title', elec_header_style), Paragraph('Assign Faculty', elec_header_style)]]
+                    elec_table_data = [[copy.copy(cell) for cell in _ELECTIVE_HEADER_CELLS]]
                     for course in elective_sections[section]:
                         elec_table_data.append([
-                            Paragraph(course.get('code', ''), elec_data_style),
+                            course.get('code', ''),
                             Paragraph(course.get('title', ''), elec_data_style),
                             Paragraph(course.get('faculty_name', ''), elec_data_style),
                         ])
 
-                    elec_table = Table(elec_table_data, colWidths=[0.9*inch, 3.2*inch, 1.4*inch])
-                    elec_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#D9DBDE")),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F9F9F9')]),
-                        ('FONTSIZE', (0, 0), (-1, -1), 6),
-                        ('FONTNAME', (0, 0), (-1, -1), 'Times-Roman'),
-                    ]))
+                    elec_table = Table(elec_table_data, colWidths=[0.9*inch, 3.2*inch, 1.4*inch], repeatRows=1, splitByRow=1)
+                    elec_table.setStyle(_ELECTIVE_TABLE_STYLE)
                     elements.append(elec_table)
                     elements.append(Spacer(1, 0.1*inch))
 
     elements.append(Spacer(1, 0.12*inch))
     elements.append(Paragraph(
-        f"Generated on {datetime.now().strftime('%d-%m-%Y %H:%M:%S')}",
-        ParagraphStyle('Footer', parent=styles['Normal'], fontSize=BODY_FONT_SIZE, alignment=TA_CENTER, fontName='Times-Italic')
+        f"Generated on {datetime.now():%d-%m-%Y %H:%M:%S}",
+        _SCHEME_FOOTER_STYLE
     ))
 
-    # Build PDF with BorderedPageCanvas
-    doc.build(elements, canvasmaker=BorderedPageCanvas)
-    buffer.seek(0)
-    return buffer.getvalue()
+    try:
+        from PyPDF2 import PdfMerger
+    except ImportError:
+        # No merger available: lay out the front matter together with the scheme table
+        buffer = output if output is not None else _scratch_buffer('merged')
+        _new_scheme_doc(buffer).build(_scheme_front_matter_elements(branch_name, year) + elements,
+                                      canvasmaker=BorderedPageCanvas)
+        return buffer if output is not None else buffer.getvalue()
+
+    # Only the scheme table pages are rendered per request; the front matter comes from the cache
+    table_buffer = _scratch_buffer('table')
+    _new_scheme_doc(table_buffer).build(elements, canvasmaker=BorderedPageCanvas)
+    table_buffer.seek(0)
+
+    merger = PdfMerger()
+    merger.append(BytesIO(_scheme_front_matter_pdf(branch_name, year)))
+    merger.append(table_buffer)
+    buffer = output if output is not None else _scratch_buffer('merged')
+    merger.write(buffer)
+    merger.close()
+    return buffer if output is not None else buffer.getvalue()
+
+# Optional process pool for CPU-bound scheme PDF builds (settings.HOD_PDF_WORKERS; 0 = build in-process).
+# Created lazily per web worker; relies on fork so children inherit the configured Django setup.
+_PDF_POOL = None
+
+
+def _pdf_pool():
+    global _PDF_POOL
+    workers = getattr(settings, 'HOD_PDF_WORKERS', 0)
+    if not workers:
+        return None
+    if _PDF_POOL is None:
+        _PDF_POOL = ProcessPoolExecutor(max_workers=workers)
+    return _PDF_POOL
+
+
+def _build_complete_scheme_pdf_in_worker(branch_name, year, semester, main_rows, elective_rows):
+    """Pool entry point: takes the branch name rather than a model instance, which is all the builder reads."""
+    return _build_complete_scheme_pdf(SimpleNamespace(name=branch_name), year, semester,
+                                      main_rows=main_rows, elective_rows=elective_rows)
+
 
 @login_required
 def create_scheme_quick(request, branch_pk, year, semester):
     """Quick generate scheme - creates and returns PDF without form submission."""
     try:
-        branch = get_object_or_404(apps.get_model('academics', 'Branch'), pk=branch_pk)
+        branch = get_object_or_404(Branch, pk=branch_pk)
     except Exception:
         messages.error(request, "Branch not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     
     try:
         main_rows, elective_rows = _fetch_db_rows_for_scheme(branch, int(year), int(semester))
-        pdf_bytes = _build_complete_scheme_pdf(branch, int(year), int(semester),
-                                               main_rows=main_rows,
-                                               elective_rows=elective_rows)
+        pool = _pdf_pool()
+        if pool is not None:
+            # only plain values cross the process boundary: the branch name and the row dicts
+            buffer = BytesIO(pool.submit(_build_complete_scheme_pdf_in_worker, branch.name, int(year), int(semester),
+                                         main_rows, elective_rows).result())
+        else:
+            buffer = _build_complete_scheme_pdf(branch, int(year), int(semester),
+                                                main_rows=main_rows,
+                                                elective_rows=elective_rows,
+                                                output=BytesIO())
         
-        if not pdf_bytes:
+        if not buffer.getbuffer().nbytes:
             messages.error(request, "Failed to generate PDF.")
             return redirect('hod:dashboard_self', branch_pk=branch_pk)
         
+        # Stream the buffer itself instead of copying it out with getvalue()
+        buffer.seek(0)
         filename = f"Scheme_{branch.name.replace(' ','_')}_{year}_Sem{semester}.pdf"
-        response = HttpResponse(pdf_bytes, content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        return response
+        return FileResponse(buffer, as_attachment=True, filename=filename, content_type='application/pdf')
     except Exception as e:
         logger.exception("Error in create_scheme_quick: %s", e)
         messages.error(request, "Error generating scheme PDF.")
@@ -2027,19 +2296,19 @@ def create_scheme_quick(request, branch_pk, year, semester):
 def faculty_assignments_detail(request, branch_pk):
     """
     Show assigned faculty for a branch, filtered by ?year=&semester=.
-    This view is defensive: SchemeCourse may not have a direct 'branch' field.
-    We attempt to filter via Scheme (scheme__branch / scheme__branch_id / scheme__branch__pk)
-    and attempt several possible year/semester field names. If year/semester were requested
-    but we cannot find scheme rows for them, we return an empty list (so user sees nothing
-    for that selection rather than wrong assignments).
+    SchemeCourse carries branch/year/semester directly, so rows are filtered on those fields
+    without probing alternative lookups. If year/semester were requested but no scheme rows
+    exist for them, the list is empty (so user sees nothing for that selection rather than
+    wrong assignments).
     """
-    # Use models imported at top of file
     try:
         SchemeCourse = apps.get_model('hod', 'SchemeCourse')
         HODAssignment = apps.get_model('hod', 'HODAssignment')
+        CourseAllocation = apps.get_model('hod', 'CourseAllocation')
+        FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
     except LookupError:
         messages.error(request, "Required models not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     
     branch = get_object_or_404(Branch, pk=branch_pk)
 
@@ -2057,24 +2326,14 @@ def faculty_assignments_detail(request, branch_pk):
         semester = None
 
     # find HODAssignment for this branch if present
-    try:
-        HODAssignment = apps.get_model('hod', 'HODAssignment')
-        hod_assignment = HODAssignment.objects.get(branch=branch)
-    except (LookupError, Exception):
-        hod_assignment = None
+    hod_assignment = HODAssignment.objects.filter(branch=branch).first()
 
     # Build scheme_qs - filter by branch, year, and semester (all required for accurate filtering)
     # If year or semester is missing, show message to user instead of showing all/None
     if year is None or semester is None:
         messages.info(request, "Please select both year and semester from the dashboard to view assignments.")
         return redirect('hod:dashboard_self', branch_pk=branch_pk)
-    
-    try:
-        SchemeCourse = apps.get_model('hod', 'SchemeCourse')
-    except LookupError:
-        messages.error(request, "SchemeCourse model not found.")
-        return redirect('hod:dashboard_redirect')
-    
+
     # Filter SchemeCourse by branch, year, and semester (direct fields now available)
     scheme_qs = SchemeCourse.objects.filter(
         branch=branch,
@@ -2084,17 +2343,9 @@ def faculty_assignments_detail(request, branch_pk):
 
     # Collect course codes from scheme rows (these identify the courses for that branch/year/sem)
     # Also get the actual SchemeCourse objects for faculty assignment display (per-scheme assignments)
-    scheme_codes = list(scheme_qs.values_list('course_code', flat=True).distinct())
-    scheme_courses_list = list(scheme_qs.select_related('faculty'))
+    scheme_courses_list = list(scheme_qs)
+    scheme_codes = list(dict.fromkeys(sc.course_code for sc in scheme_courses_list))
 
-    # Get CourseAllocation and FacultyAssignment models (for backward compatibility)
-    try:
-        CourseAllocation = apps.get_model('hod', 'CourseAllocation')
-        FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
-    except LookupError:
-        messages.error(request, "Required models not found.")
-        return redirect('hod:dashboard_redirect')
-    
     # Build assignments list - prioritize SchemeCourse (per-scheme assignments) over CourseAllocation
     assignments = []
     
@@ -2108,12 +2359,10 @@ def faculty_assignments_detail(request, branch_pk):
         course_title = getattr(sc, 'course_title', '') or ''
         if not course_title and hod_assignment:
             try:
-                ca = CourseAllocation.objects.filter(
+                course_title = CourseAllocation.objects.filter(
                     hod_assignment=hod_assignment,
                     course_code=sc.course_code
-                ).first()
-                if ca:
-                    course_title = getattr(ca, 'course_title', '') or ''
+                ).values_list('course_title', flat=True).first() or ''
             except Exception:
                 pass
         
@@ -2146,42 +2395,38 @@ def faculty_assignments_detail(request, branch_pk):
             else:
                 course_alloc_qs = CourseAllocation.objects.none()
 
-        # Prefetch latest faculty assignments for each course allocation
-        fa_prefetch = Prefetch(
-            'facultyassignment_set',
-            queryset=FacultyAssignment.objects.select_related('faculty').order_by('assigned_on'),
-            to_attr='fa_list'
-        )
-        course_alloc_qs = course_alloc_qs.prefetch_related(fa_prefetch)
-
-        for ca in course_alloc_qs:
-            # Skip if already added from SchemeCourse
-            if any(a.get('course_code') == ca.course_code and a.get('from_scheme_course') for a in assignments):
-                continue
-                
-            fa_obj = (getattr(ca, 'fa_list', [])[-1]) if getattr(ca, 'fa_list', []) else None
-            assigned_faculty_name = None
-            assigned_on = None
-            if fa_obj:
-                assigned_on = fa_obj.assigned_on
-                faculty_profile = fa_obj.faculty
-                user = getattr(faculty_profile, 'user', None)
-                if user:
-                    assigned_faculty_name = user.get_full_name() or user.username or getattr(user, 'email', '')
-                else:
-                    assigned_faculty_name = getattr(faculty_profile, 'display_name', None) or str(faculty_profile)
-
-            assignments.append({
-                'course_code': ca.course_code,
-                'course_title': getattr(ca, 'course_title', '') or '',
+        # Annotate only the latest faculty assignment per course allocation (not its whole history)
+        # and read the display fields as plain dicts; no model instances are built for these rows
+        latest_fa = FacultyAssignment.objects.filter(course_allocation=OuterRef('pk')).order_by('-assigned_on', '-pk')
+        course_alloc_rows = course_alloc_qs.annotate(
+            latest_assigned_on=Subquery(latest_fa.values('assigned_on')[:1]),
+            latest_first_name=Subquery(latest_fa.values('faculty__user__first_name')[:1]),
+            latest_last_name=Subquery(latest_fa.values('faculty__user__last_name')[:1]),
+            latest_username=Subquery(latest_fa.values('faculty__user__username')[:1]),
+            latest_email=Subquery(latest_fa.values('faculty__user__email')[:1]),
+        ).values('id', 'course_code', 'course_title', 'credits', 'latest_assigned_on',
+                 'latest_first_name', 'latest_last_name', 'latest_username', 'latest_email')
+
+        # Skip courses already added from SchemeCourse
+        scheme_entry_codes = {a['course_code'] for a in assignments if a.get('from_scheme_course')}
+        assignments.extend(
+            {
+                'course_code': ca['course_code'],
+                'course_title': ca['course_title'] or '',
                 'year': year,  # From query params
                 'semester': semester,  # From query params
-                'credits': getattr(ca, 'credits', None),
-                'assigned_faculty_name': assigned_faculty_name,
-                'assigned_on': assigned_on,
-                'course_allocation_id': ca.id,
+                'credits': ca['credits'],
+                'assigned_faculty_name': (
+                    f"{ca['latest_first_name'] or ''} {ca['latest_last_name'] or ''}".strip()
+                    or ca['latest_username'] or ca['latest_email']
+                ) if ca['latest_assigned_on'] else None,
+                'assigned_on': ca['latest_assigned_on'],
+                'course_allocation_id': ca['id'],
                 'from_scheme_course': False,  # From CourseAllocation
-            })
+            }
+            for ca in course_alloc_rows
+            if ca['course_code'] not in scheme_entry_codes
+        )
 
     # Remove duplicates by course_code (prefer SchemeCourse entries) and sort
     seen_codes = set()
@@ -2205,48 +2450,46 @@ def faculty_assignments_detail(request, branch_pk):
     }
     return render(request, 'hod/faculty_assignments_detail.html', context)
 
+# Columns the single-scheme views read; branch is joined because they redirect or render by branch
+SCHEME_DOCUMENT_DETAIL_FIELDS = (
+    'id', 'branch', 'branch__code', 'branch__name', 'branch_name',
+    'year', 'semester', 'pdf_file', 'title', 'is_deleted',
+    # saving a deferred instance writes only loaded fields; keep auto_now updated_at among them
+    'updated_at',
+)
+
+
+def _scheme_document_qs():
+    """SchemeDocument queryset for the single-scheme views: branch joined, listing columns only."""
+    return SchemeDocument.objects.select_related('branch').only(*SCHEME_DOCUMENT_DETAIL_FIELDS)
+
+
 @login_required
 def manage_schemes(request, branch_pk):
     """Manage all schemes for a branch."""
     try:
         # Get the branch object first
-        Branch = apps.get_model('academics', 'Branch')
         branch = get_object_or_404(Branch, pk=branch_pk)
         
-        # Now get SchemeDocument model
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        
         # Get filter parameters
         year = request.GET.get('year', '').strip()
         semester = request.GET.get('semester', '').strip()
         
-        # Build base queryset
-        active_schemes = SchemeDocument.objects.filter(
-            branch=branch,
-            is_deleted=False
-        )
-        
-        # Apply year filter if provided
-        if year:
-            try:
-                active_schemes = active_schemes.filter(year=int(year))
-            except ValueError:
-                pass
-        
-        # Apply semester filter if provided
-        if semester:
-            try:
-                active_schemes = active_schemes.filter(semester=int(semester))
-            except ValueError:
-                pass
-        
-        active_schemes = active_schemes.order_by('-created_at')
-        
-        # Get deleted schemes (for recycle bin)
-        deleted_schemes = SchemeDocument.objects.filter(
-            branch=branch,
-            is_deleted=True
-        ).order_by('-created_at')
+        year_filter = int(year) if year.isdigit() else None
+        semester_filter = int(semester) if semester.isdigit() else None
+
+        # One query for the branch; split into active (filtered by year/semester) and recycle bin in Python
+        active_schemes = []
+        deleted_schemes = []
+        # the listing links to the file views by pk, so the pdf_file column is not selected here;
+        # created_by is joined because each row shows its author
+        schemes_qs = SchemeDocument.objects.filter(branch=branch).defer('pdf_file').select_related('created_by')
+        for scheme in schemes_qs.order_by('-created_at'):
+            if scheme.is_deleted:
+                deleted_schemes.append(scheme)
+            elif ((year_filter is None or scheme.year == year_filter)
+                  and (semester_filter is None or scheme.semester == semester_filter)):
+                active_schemes.append(scheme)
         
         # Get list of available semesters for filter dropdown
         semesters = [1, 2, 3, 4, 5, 6, 7, 8]
@@ -2262,18 +2505,17 @@ def manage_schemes(request, branch_pk):
     except LookupError as e:
         logger.exception("Model not found: %s", e)
         messages.error(request, "Required models not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error managing schemes: %s", e)
         messages.error(request, f"Failed to load schemes: {e}")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 @login_required
 def view_scheme(request, scheme_pk):
     """View a scheme document."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=scheme_pk)
         
         context = {
             'scheme': scheme,
@@ -2284,45 +2526,38 @@ def view_scheme(request, scheme_pk):
         return render(request, 'hod/view_scheme.html', context)
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error viewing scheme: %s", e)
         messages.error(request, "Failed to load scheme.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 
 @login_required
 def download_scheme(request, scheme_pk):
     """Download scheme PDF."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=scheme_pk)
         
         if not scheme.pdf_file:
             messages.error(request, "PDF file not found.")
             return redirect('hod:manage_schemes', branch_pk=scheme.branch.pk)
         
-        return FileResponse(
-            scheme.pdf_file.open('rb'),
-            content_type='application/pdf',
-            as_attachment=True,
-            filename=scheme.pdf_file.name.split('/')[-1]
-        )
+        return _stored_pdf_response(scheme.pdf_file, scheme.pdf_file.name.split('/')[-1], as_attachment=True)
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error downloading scheme: %s", e)
         messages.error(request, "Failed to download scheme.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 
 @login_required
 def edit_scheme(request, scheme_pk):
     """Edit a scheme document."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=scheme_pk)
         
         branch = scheme.branch
         year = scheme.year
@@ -2335,59 +2570,43 @@ def edit_scheme(request, scheme_pk):
         try:
             SchemeCourse = apps.get_model('hod', 'SchemeCourse')
             
+            # rows are display-only dicts, so read them straight from .values() (faculty name via the join)
+            scheme_courses = SchemeCourse.objects.filter(branch=branch, year=year, semester=semester)
+
             # Get main courses
-            main_courses = SchemeCourse.objects.filter(
-                branch=branch,
-                year=year,
-                semester=semester,
-                is_elective=False
-            ).select_related('faculty')
-            
-            for sc in main_courses:
-                faculty_name = ''
-                if sc.faculty:
-                    faculty_name = sc.faculty.get_full_name() or sc.faculty.username
-                
-                main_rows.append({
-                    'id': sc.id,
-                    'category': getattr(sc, 'category', '') or '',
-                    'code': sc.course_code,
-                    'title': getattr(sc, 'course_title', '') or '',
-                    'l': int(getattr(sc, 'l', 0) or 0),
-                    't': int(getattr(sc, 't', 0) or 0),
-                    'p': int(getattr(sc, 'p', 0) or 0),
-                    'cie': int(getattr(sc, 'cie', 0) or 0),
-                    'see': int(getattr(sc, 'see', 0) or 0),
-                    'credits': str(getattr(sc, 'credits', 0) or 0),
-                    'faculty_id': sc.faculty.id if sc.faculty else None,
-                    'faculty_name': faculty_name,
-                })
-            
+            main_rows = [{
+                'id': r['id'],
+                'category': r['category'] or '',
+                'code': r['course_code'],
+                'title': r['course_title'] or '',
+                'l': r['l'],
+                't': r['t'],
+                'p': r['p'],
+                'cie': r['cie'],
+                'see': r['see'],
+                'credits': str(r['credits'] or 0),
+                'faculty_id': r['faculty_id'],
+                'faculty_name': _scheme_faculty_name(r),
+            } for r in scheme_courses.filter(is_elective=False).values(
+                'id', 'category', 'course_code', 'course_title', 'l', 't', 'p', 'cie', 'see', 'credits',
+                *SCHEME_FACULTY_VALUES
+            )]
+
             # Get elective courses
-            elective_courses = SchemeCourse.objects.filter(
-                branch=branch,
-                year=year,
-                semester=semester,
-                is_elective=True
-            ).select_related('faculty')
-            
-            for sc in elective_courses:
-                faculty_name = ''
-                if sc.faculty:
-                    faculty_name = sc.faculty.get_full_name() or sc.faculty.username
-                
-                elective_rows.append({
-                    'id': sc.id,
-                    'section': getattr(sc, 'category', 'ESC') or 'ESC',
-                    'code': sc.course_code,
-                    'title': getattr(sc, 'course_title', '') or '',
-                    'faculty_id': sc.faculty.id if sc.faculty else None,
-                    'faculty_name': faculty_name,
-                })
+            elective_rows = [{
+                'id': r['id'],
+                'section': r['category'] or 'ESC',
+                'code': r['course_code'],
+                'title': r['course_title'] or '',
+                'faculty_id': r['faculty_id'],
+                'faculty_name': _scheme_faculty_name(r),
+            } for r in scheme_courses.filter(is_elective=True).values(
+                'id', 'category', 'course_code', 'course_title', *SCHEME_FACULTY_VALUES
+            )]
         except LookupError:
             logger.debug("SchemeCourse model not found")
         
-        faculty_list = CustomUser.objects.filter(role='faculty', is_active=True)
+        faculty_list = _active_faculty_list()
         
         context = {
             'scheme': scheme,
@@ -2401,61 +2620,62 @@ def edit_scheme(request, scheme_pk):
         return render(request, 'hod/edit_scheme.html', context)
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error editing scheme: %s", e)
         messages.error(request, "Failed to load scheme for editing.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 
 @login_required
 def trash_scheme(request, scheme_pk):
     """Move scheme to trash (soft delete)."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
-        
-        scheme.is_deleted = True
-        scheme.save()
+        # flip the flag with a single-column UPDATE; only branch/title are needed for the response
+        scheme_qs = SchemeDocument.objects.filter(pk=scheme_pk)
+        scheme = scheme_qs.values('branch_id', 'title').first()
+        if scheme is None:
+            raise Http404("Scheme not found.")
+        scheme_qs.update(is_deleted=True)
         
-        messages.success(request, f"Scheme '{scheme.title}' moved to trash.")
-        return redirect('hod:manage_schemes', branch_pk=scheme.branch.pk)
+        messages.success(request, f"Scheme '{scheme['title']}' moved to trash.")
+        return redirect('hod:manage_schemes', branch_pk=scheme['branch_id'])
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error trashing scheme: %s", e)
         messages.error(request, "Failed to move scheme to trash.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 
 @login_required
 def restore_scheme(request, scheme_pk):
     """Restore a trashed scheme."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
+        # flip the flag with a single-column UPDATE; only branch/title are needed for the response
+        scheme_qs = SchemeDocument.objects.filter(pk=scheme_pk)
+        scheme = scheme_qs.values('branch_id', 'title').first()
+        if scheme is None:
+            raise Http404("Scheme not found.")
+        scheme_qs.update(is_deleted=False)
         
-        scheme.is_deleted = False
-        scheme.save()
-        
-        messages.success(request, f"Scheme '{scheme.title}' restored.")
-        return redirect('hod:manage_schemes', branch_pk=scheme.branch.pk)
+        messages.success(request, f"Scheme '{scheme['title']}' restored.")
+        return redirect('hod:manage_schemes', branch_pk=scheme['branch_id'])
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error restoring scheme: %s", e)
         messages.error(request, "Failed to restore scheme.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 
 @login_required
 def permanent_delete_scheme(request, scheme_pk):
     """Permanently delete a scheme."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=scheme_pk)
         
         branch_pk = scheme.branch.pk
         scheme.delete()
@@ -2464,40 +2684,73 @@ def permanent_delete_scheme(request, scheme_pk):
         return redirect('hod:manage_schemes', branch_pk=branch_pk)
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error permanently deleting scheme: %s", e)
         messages.error(request, "Failed to permanently delete scheme.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
+
+
+# Optional thread pool for regenerate_scheme (settings.HOD_PDF_REGEN_THREADS; 0 = regenerate in the request).
+# Threads rather than processes so the job can use the ORM and file storage directly.
+_REGEN_EXECUTOR = None
+
+
+def _regen_executor():
+    global _REGEN_EXECUTOR
+    workers = getattr(settings, 'HOD_PDF_REGEN_THREADS', 0)
+    if not workers:
+        return None
+    if _REGEN_EXECUTOR is None:
+        _REGEN_EXECUTOR = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scheme-pdf')
+    return _REGEN_EXECUTOR
+
+
+def _regenerate_scheme_pdf(scheme_pk, background=False):
+    """Rebuild a stored scheme PDF from the current scheme rows and save it on the SchemeDocument."""
+    try:
+        scheme = _scheme_document_qs().get(pk=scheme_pk)
+        branch = scheme.branch
+        main_rows, elective_rows = _fetch_db_rows_for_scheme(branch, scheme.year, scheme.semester)
+        pdf_bytes = _build_complete_scheme_pdf(branch, scheme.year, scheme.semester,
+                                               main_rows=main_rows, elective_rows=elective_rows)
+        filename = f"Scheme_{branch.code}_{scheme.year}_Sem{scheme.semester}.pdf"
+        # write only the file columns: a background job must not write back an is_deleted/title
+        # loaded before the build (trash_scheme/restore_scheme may have changed them meanwhile)
+        scheme.pdf_file.save(filename, ContentFile(pdf_bytes), save=False)
+        scheme.save(update_fields=['pdf_file', 'updated_at'])
+    except Exception:
+        if not background:
+            raise
+        logger.exception("Background regeneration failed for scheme %s", scheme_pk)
+    finally:
+        if background:
+            # worker threads are not request-scoped, so release their DB connection explicitly
+            connections.close_all()
 
 
 @login_required
 def regenerate_scheme(request, scheme_id):
     """Regenerate a scheme PDF."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_id)
-        
-        branch = scheme.branch
-        year = scheme.year
-        semester = scheme.semester
-        
-        # Regenerate PDF
-        pdf_bytes = _build_complete_scheme_pdf(branch, year, semester)
-        
-        # Save to scheme
-        filename = f"Scheme_{branch.code}_{year}_Sem{semester}.pdf"
-        scheme.pdf_file.save(filename, ContentFile(pdf_bytes), save=True)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=scheme_id)
         
-        messages.success(request, "Scheme PDF regenerated successfully.")
-        return redirect('hod:manage_schemes', branch_pk=scheme.pk)
+        executor = _regen_executor()
+        if executor is None:
+            _regenerate_scheme_pdf(scheme.pk)
+            messages.success(request, "Scheme PDF regenerated successfully.")
+        else:
+            # build and store the PDF off the request thread, once any surrounding transaction has committed
+            transaction.on_commit(lambda: executor.submit(_regenerate_scheme_pdf, scheme.pk, True))
+            messages.success(request, "Scheme PDF regeneration queued.")
+        return redirect('hod:manage_schemes', branch_pk=scheme.branch_id)
     except LookupError:
         messages.error(request, "Model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error regenerating scheme: %s", e)
         messages.error(request, "Failed to regenerate scheme.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 
 @login_required
@@ -2511,7 +2764,6 @@ def create_combined_syllabus(request, branch_pk):
     schemes = []
     latest_scheme = None
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
         scheme_qs = SchemeDocument.objects.filter(branch=branch, is_deleted=False)
         if year:
             try:
@@ -2523,8 +2775,9 @@ def create_combined_syllabus(request, branch_pk):
                 scheme_qs = scheme_qs.filter(semester=int(semester))
             except ValueError:
                 pass
-        schemes = scheme_qs.order_by('-created_at')
-        latest_scheme = schemes.first() if schemes else None
+        # only the latest scheme is rendered; fetch it alone (LIMIT 1) with just the displayed columns
+        schemes = scheme_qs.only('id', 'title', 'year', 'semester', 'created_at', 'pdf_file').order_by('-created_at')
+        latest_scheme = schemes.first()
     except LookupError:
         pass
     
@@ -2559,7 +2812,12 @@ def create_combined_syllabus(request, branch_pk):
             if approved_only:
                 pdf_qs = pdf_qs.filter(approved=True)
             try:
-                latest_qs = pdf_qs.select_related('course', 'created_by').order_by('course_id', '-created_at')
+                latest_qs = pdf_qs.select_related('course', 'created_by').only(
+                    'id', 'title', 'pdf_file', 'created_at', 'course_id', 'created_by_id',
+                    'course__id', 'course__course_code', 'course__course_title',
+                    'created_by__id', 'created_by__username', 'created_by__email',
+                    'created_by__first_name', 'created_by__last_name',
+                ).order_by('course_id', '-created_at')
                 latest_map = {}
                 for p in latest_qs:
                     cid = getattr(p, 'course_id', None)
@@ -2634,7 +2892,7 @@ def create_combined_syllabus(request, branch_pk):
         dean_courses_qs = CollegeLevelCourse.objects.filter(department="All Branches", is_deleted=False).filter(
             Q(branch__isnull=True) | Q(branch=branch)
         )
-        if semester and hasattr(CollegeLevelCourse, 'semester'):
+        if semester and 'semester' in _COURSE_FIELDS:
             try:
                 dean_courses_qs = dean_courses_qs.filter(semester=int(semester))
             except Exception:
@@ -2644,7 +2902,7 @@ def create_combined_syllabus(request, branch_pk):
                     pass
         # strict year/admission_year filter if available
         for year_field in ['admission_year', 'year', 'academic_year']:
-            if hasattr(CollegeLevelCourse, year_field) and year not in (None, '', 0):
+            if year_field in _COURSE_FIELDS and year not in (None, '', 0):
                 try:
                     dean_courses_qs = dean_courses_qs.filter(**{year_field: int(year)})
                 except Exception:
@@ -2723,9 +2981,6 @@ def generate_combined_syllabus(request, branch_pk):
             messages.error(request, "PyPDF2 library required for PDF merging. Install with: pip install PyPDF2")
             return redirect('hod:create_combined_syllabus', branch_pk=branch_pk)
 
-        # Always ensure BytesIO is available for output buffering and placeholders
-        from io import BytesIO
-
         # Prefer to use academics' syllabus PDF generator if available
         try:
             from academics.views import generate_syllabus_pdf_buffer
@@ -2733,6 +2988,8 @@ def generate_combined_syllabus(request, branch_pk):
             generate_syllabus_pdf_buffer = None
         
         # Merge PDFs using PyPDF2.PdfMerger (preserves POST order)
+        # Stored PDFs are opened through their storage and kept open until the merger has written
+        open_files = ExitStack()
         try:
             merger = PdfMerger()
 
@@ -2741,7 +2998,6 @@ def generate_combined_syllabus(request, branch_pk):
 
             # Add latest HOD scheme PDF first (mandatory if present)
             try:
-                SchemeDocument = apps.get_model('hod', 'SchemeDocument')
                 scheme_qs = SchemeDocument.objects.filter(branch=branch, is_deleted=False).order_by('-created_at')
                 if year:
                     try:
@@ -2754,11 +3010,13 @@ def generate_combined_syllabus(request, branch_pk):
                     except Exception:
                         pass
                 scheme = scheme_qs.first()
-                if scheme and getattr(scheme, 'pdf_file', None) and os.path.exists(scheme.pdf_file.path):
-                    path = scheme.pdf_file.path
+                if scheme and getattr(scheme, 'pdf_file', None):
+                    path = scheme.pdf_file.name
                     if path not in appended_paths:
-                        merger.append(path)
-                        appended_paths.add(path)
+                        handle = _open_stored_pdf(scheme.pdf_file, open_files)
+                        if handle:
+                            merger.append(handle)
+                            appended_paths.add(path)
             except LookupError:
                 scheme = None
             except Exception as e:
@@ -2775,13 +3033,13 @@ def generate_combined_syllabus(request, branch_pk):
                     department="All Branches",
                     is_deleted=False
                 ).filter(Q(branch__isnull=True) | Q(branch=branch)).order_by('course_code')
-                if semester and hasattr(CollegeLevelCourse, 'semester'):
+                if semester and 'semester' in _COURSE_FIELDS:
                     try:
                         dean_courses_qs = dean_courses_qs.filter(semester=semester)
                     except Exception:
                         pass
                 for year_field in ['admission_year', 'year', 'academic_year']:
-                    if hasattr(CollegeLevelCourse, year_field) and year not in (None, '', 0):
+                    if year_field in _COURSE_FIELDS and year not in (None, '', 0):
                         try:
                             dean_courses_qs = dean_courses_qs.filter(**{year_field: int(year)})
                         except Exception:
@@ -2794,21 +3052,19 @@ def generate_combined_syllabus(request, branch_pk):
                 for course in dean_courses_qs:
                     try:
                         pdf_field = getattr(course, 'syllabus_pdf', None)
-                        # If a dean course has an attached PDF file that exists on disk, append it
-                        if pdf_field and hasattr(pdf_field, 'path') and os.path.exists(pdf_field.path):
-                            path = pdf_field.path
+                        # If a dean course has an attached PDF file that exists in storage, append it
+                        if pdf_field and pdf_field.storage.exists(pdf_field.name):
+                            path = pdf_field.name
                             if path in appended_paths:
                                 continue
                             try:
-                                merger.append(path)
+                                merger.append(_open_stored_pdf(pdf_field, open_files))
                                 appended_paths.add(path)
                             except Exception as e:
                                 logger.exception("Error adding dean course PDF (id=%s): %s", course.pk, e)
                                 messages.warning(request, f"Could not add dean course PDF for {course.course_code}: {e}")
                                 # fallback placeholder for unreadable file
                                 try:
-                                    from io import BytesIO
-                                    from reportlab.pdfgen import canvas
                                     tmp = BytesIO()
                                     c = canvas.Canvas(tmp)
                                     c.drawString(50, 800, f"Placeholder: unreadable dean course file (id={course.pk})")
@@ -2843,8 +3099,6 @@ def generate_combined_syllabus(request, branch_pk):
                             if not generated:
                                 # Fallback: append a small placeholder indicating the course
                                 try:
-                                    from io import BytesIO
-                                    from reportlab.pdfgen import canvas
                                     tmp = BytesIO()
                                     c = canvas.Canvas(tmp)
                                     c.drawString(50, 800, f"Placeholder: no dean course PDF for {getattr(course, 'course_code', 'unknown')} - {getattr(course, 'course_title', '')}")
@@ -2867,6 +3121,8 @@ def generate_combined_syllabus(request, branch_pk):
 
             # Add selected latest faculty PDFs (one per course) — allowed only for HOD users
             latest_ids = request.POST.getlist('latest_submissions')
+            # {pk: submission} already loaded while choosing the default selection below, if any
+            latest_subs = None
 
             # If nothing was explicitly selected, default to including the latest per-course PDFs (HOD only)
             if not latest_ids and FacultySyllabusPDF and getattr(request.user, 'hod_assignment', None):
@@ -2935,6 +3191,7 @@ def generate_combined_syllabus(request, branch_pk):
                         if cid and cid not in latest_map:
                             latest_map[cid] = p
                     latest_ids = [str(latest_map[cid].pk) for cid in sorted(latest_map.keys())]
+                    latest_subs = {p.pk: p for p in latest_map.values()}
                 except Exception:
                     latest_ids = []
 
@@ -2942,36 +3199,61 @@ def generate_combined_syllabus(request, branch_pk):
                 if not getattr(request.user, 'hod_assignment', None):
                     messages.warning(request, "Only HOD users can include faculty-generated PDFs in the combined syllabus.")
                 else:
+                    # fetch every selected submission in one query, then walk them in the submitted order;
+                    # approved_only is applied in that same query rather than re-checked per id
+                    # (the default selection reuses the submissions it was chosen from, without a second query)
+                    if latest_subs is not None:
+                        subs = latest_subs
+                    else:
+                        subs_qs = FacultySyllabusPDF.objects.only('id', 'pdf_file')
+                        if request.POST.get('approved_only'):
+                            subs_qs = subs_qs.filter(approved=True)
+                        subs = subs_qs.in_bulk([int(lid) for lid in latest_ids if str(lid).isdigit()])
+                    # open the selected files in order, then parse them (concurrently when a reader pool
+                    # is configured) and append the parsed readers in that same order
+                    sources = []
                     for lid in latest_ids:
                         try:
-                            sub = FacultySyllabusPDF.objects.get(pk=lid)
-                            if sub.pdf_file and os.path.exists(sub.pdf_file.path):
-                                path = sub.pdf_file.path
+                            sub = subs.get(int(lid)) if str(lid).isdigit() else None
+                            if sub is None:
+                                raise FacultySyllabusPDF.DoesNotExist(f"No faculty PDF with id {lid}")
+                            if sub.pdf_file and sub.pdf_file.storage.exists(sub.pdf_file.name):
+                                path = sub.pdf_file.name
                                 if path not in appended_paths:
+                                    # a file that fails to open keeps its place and gets the placeholder below
                                     try:
-                                        merger.append(path)
-                                        appended_paths.add(path)
-                                    except Exception as e:
-                                        logger.exception("Error adding latest faculty PDF (id=%s): %s", lid, e)
-                                        messages.warning(request, f"Could not add one latest faculty PDF: {e}")
-                                        try:
-                                            from io import BytesIO
-                                            from reportlab.pdfgen import canvas
-                                            tmp = BytesIO()
-                                            c = canvas.Canvas(tmp)
-                                            c.drawString(50, 800, f"Placeholder: unreadable faculty PDF (id={lid})")
-                                            c.showPage()
-                                            c.save()
-                                            tmp.seek(0)
-                                            merger.append(tmp)
-                                            appended_paths.add(path)
-                                            logger.warning("Appended placeholder PDF for unreadable faculty file: %s", path)
-                                        except Exception:
-                                            logger.exception("Failed to append placeholder PDF for faculty PDF id %s", lid)
+                                        handle = _open_stored_pdf(sub.pdf_file, open_files)
+                                    except Exception as open_error:
+                                        handle = open_error
+                                    sources.append((lid, path, handle))
+                                    appended_paths.add(path)
                         except Exception as e:
                             logger.exception("Error adding latest faculty PDF (id=%s): %s", lid, e)
                             messages.warning(request, f"Could not add one latest faculty PDF: {e}")
 
+                    executor = _pdf_read_executor()
+                    handles = [handle for _, _, handle in sources]
+                    readers = executor.map(_read_source_pdf, handles) if executor else map(_read_source_pdf, handles)
+                    for (lid, path, _), reader in zip(sources, readers):
+                        try:
+                            if isinstance(reader, Exception):
+                                raise reader
+                            merger.append(reader)
+                        except Exception as e:
+                            logger.exception("Error adding latest faculty PDF (id=%s): %s", lid, e)
+                            messages.warning(request, f"Could not add one latest faculty PDF: {e}")
+                            try:
+                                tmp = BytesIO()
+                                c = canvas.Canvas(tmp)
+                                c.drawString(50, 800, f"Placeholder: unreadable faculty PDF (id={lid})")
+                                c.showPage()
+                                c.save()
+                                tmp.seek(0)
+                                merger.append(tmp)
+                                logger.warning("Appended placeholder PDF for unreadable faculty file: %s", path)
+                            except Exception:
+                                logger.exception("Failed to append placeholder PDF for faculty PDF id %s", lid)
+
             # --- FALLBACK: If a textual `Syllabus` exists for a course (even when no saved FacultySyllabusPDF), generate and include it ---
             try:
                 Syllabus = apps.get_model('academics', 'Syllabus')
@@ -3042,26 +3324,19 @@ def generate_combined_syllabus(request, branch_pk):
             # Create output buffer
             # Ensure we actually appended something
             if not appended_paths:
+                open_files.close()
                 messages.error(request, "No PDFs were available to merge for the selected filters/selections.")
                 return redirect('hod:create_combined_syllabus', branch_pk=branch_pk)
 
-            # Create output buffer
-            output_buffer = BytesIO()
-            merger.write(output_buffer)
+            # Spool the merged PDF to a temporary file instead of an in-memory buffer; both the stored
+            # copy and the response stream from it, so the whole document is never held as bytes
+            output_file = tempfile.TemporaryFile(suffix='.pdf')
+            merger.write(output_file)
             merger.close()
-            output_buffer.seek(0)
-
-            # Return merged PDF as FileResponse
-            response = FileResponse(
-                output_buffer,
-                content_type='application/pdf',
-                filename='Combined_Syllabus.pdf'
-            )
-            response['Content-Disposition'] = 'attachment; filename="Combined_Syllabus.pdf"'
+            open_files.close()
 
             # Save a copy of the combined PDF as a CombinedSyllabus record for future viewing
             try:
-                from django.core.files.base import ContentFile
                 CombinedSyllabus = apps.get_model('hod', 'CombinedSyllabus')
                 if CombinedSyllabus:
                     cs_name = f"Combined_Syllabus_{getattr(branch, 'code', 'branch')}_{year}_Sem{semester}.pdf"
@@ -3073,8 +3348,8 @@ def generate_combined_syllabus(request, branch_pk):
                             year=year,
                             semester=semester
                         )
-                        # write the buffer bytes to the FileField
-                        cs.file.save(cs_name, ContentFile(output_buffer.getvalue()))
+                        # copy the spooled file into the FileField chunk by chunk
+                        cs.file.save(cs_name, File(output_file))
                         cs.save()
                     except Exception as e:
                         logger.exception("Failed to save CombinedSyllabus record: %s", e)
@@ -3082,9 +3357,19 @@ def generate_combined_syllabus(request, branch_pk):
                 # non-fatal: continue returning the response even if saving fails
                 logger.exception("Error while attempting to save CombinedSyllabus file.")
 
+            # Return merged PDF as FileResponse; it closes (and so removes) the temporary file once sent
+            output_file.seek(0)
+            response = FileResponse(
+                output_file,
+                content_type='application/pdf',
+                filename='Combined_Syllabus.pdf'
+            )
+            response['Content-Disposition'] = 'attachment; filename="Combined_Syllabus.pdf"'
+            response.block_size = STORED_PDF_BLOCK_SIZE
             return response
             
         except Exception as e:
+            open_files.close()
             logger.exception("Error merging PDFs: %s", e)
             messages.error(request, f"Failed to merge PDFs: {e}")
             return redirect('hod:create_combined_syllabus', branch_pk=branch_pk)
@@ -3134,39 +3419,36 @@ def remove_assignment(request, assignment_id):
 def activity_history(request):
     """View activity history."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        activities = SchemeDocument.objects.all().order_by('-created_at')[:100]
+        # created_at is indexed, so ORDER BY ... LIMIT reads the index instead of sorting the table;
+        # pdf_file is left out since downloads go through download_scheme_pdf by id
+        activities = SchemeDocument.objects.only(
+            'id', 'title', 'created_at', 'branch', 'branch_name', 'year', 'semester', 'is_deleted'
+        ).select_related('branch').order_by('-created_at')[:100]
         context = {'activities': activities}
         return render(request, 'hod/activity_history.html', context)
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error fetching activity history: %s", e)
         messages.error(request, "Failed to load activity history.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
 
 
 @login_required
 def download_scheme_pdf(request, activity_id):
     """Download scheme PDF from activity history."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=activity_id)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=activity_id)
         
         if not scheme.pdf_file:
             messages.error(request, "PDF file not found.")
             return redirect('hod:activity_history')
         
-        return FileResponse(
-            scheme.pdf_file.open('rb'),
-            content_type='application/pdf',
-            as_attachment=True,
-            filename=f"Scheme_{scheme.year}_{scheme.semester}.pdf"
-        )
+        return _stored_pdf_response(scheme.pdf_file, f"Scheme_{scheme.year}_{scheme.semester}.pdf", as_attachment=True)
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error downloading scheme PDF: %s", e)
         messages.error(request, "Failed to download PDF.")
@@ -3175,22 +3457,17 @@ def download_scheme_pdf(request, activity_id):
 def view_scheme(request, scheme_pk):
     """View a scheme document."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=scheme_pk)
         
         if not scheme.pdf_file:
             messages.error(request, "PDF file not found for this scheme.")
             return redirect('hod:manage_schemes', branch_pk=scheme.branch.pk)
         
         # Return PDF directly in browser
-        return FileResponse(
-            scheme.pdf_file.open('rb'),
-            content_type='application/pdf',
-            filename=scheme.pdf_file.name.split('/')[-1]
-        )
+        return _stored_pdf_response(scheme.pdf_file, scheme.pdf_file.name.split('/')[-1])
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error viewing scheme: %s", e)
         messages.error(request, f"Failed to load scheme: {str(e)}")
@@ -3201,8 +3478,7 @@ def view_scheme(request, scheme_pk):
 def edit_scheme(request, scheme_pk):
     """Edit a scheme document - redirect to create_scheme form."""
     try:
-        SchemeDocument = apps.get_model('hod', 'SchemeDocument')
-        scheme = get_object_or_404(SchemeDocument, pk=scheme_pk)
+        scheme = get_object_or_404(_scheme_document_qs(), pk=scheme_pk)
         
         branch = scheme.branch
         year = scheme.year
@@ -3213,7 +3489,7 @@ def edit_scheme(request, scheme_pk):
         return redirect('hod:create_scheme', branch_pk=branch.pk, year=year, semester=semester)
     except LookupError:
         messages.error(request, "SchemeDocument model not found.")
-        return redirect('hod:dashboard_redirect')
+        return redirect(_dashboard_redirect_url())
     except Exception as e:
         logger.exception("Error editing scheme: %s", e)
         messages.error(request, f"Failed to edit scheme: {str(e)}")
@@ -3224,94 +3500,103 @@ def save_scheme_courses(request, branch_pk, year, semester):
     """Save scheme courses from form submission."""
     if request.method == 'POST':
         try:
-            Branch = apps.get_model('academics', 'Branch')
             branch = get_object_or_404(Branch, pk=branch_pk)
             
             SchemeCourse = apps.get_model('hod', 'SchemeCourse')
-            
-            # SAFELY delete existing SchemeCourse rows and related CourseAllocation/FacultyAssignment for this HOD
-            try:
-                CourseAllocation = apps.get_model('hod', 'CourseAllocation')
-                FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
-                HODAssignment = apps.get_model('hod', 'HODAssignment')
-
-                old_qs = SchemeCourse.objects.filter(branch=branch, year=year, semester=semester)
-                old_codes = list(old_qs.values_list('course_code', flat=True))
-
-                # delete SchemeCourse rows
-                old_qs.delete()
-
-                # if we have a hod record, delete CourseAllocation & FacultyAssignment for that hod and those codes
-                hod_obj = getattr(request.user, 'hod_assignment', None)
-                if hod_obj and old_codes:
-                    # delete faculty assignments referencing allocations for this hod
-                    allocations = CourseAllocation.objects.filter(hod_assignment=hod_obj, course_code__in=old_codes)
-                    if allocations.exists():
-                        FacultyAssignment.objects.filter(course_allocation__in=allocations).delete()
-                        allocations.delete()
-            except Exception:
-                logger.exception("Error while cleaning up old scheme rows and allocations in save_scheme_courses")
-            
-            # Save main courses from form
-            main_row_count = int(request.POST.get('main_row_count', 0))
-            for i in range(main_row_count):
-                course_code = request.POST.get(f'main_code_{i}', '').strip()
-                if not course_code:
-                    continue
-                
-                course_title = request.POST.get(f'main_title_{i}', '')
-                faculty_id = request.POST.get(f'main_faculty_{i}', None)
-                
-                faculty = None
-                if faculty_id:
-                    try:
-                        faculty = CustomUser.objects.get(id=faculty_id, role='faculty')
-                    except CustomUser.DoesNotExist:
-                        pass
-                
-                SchemeCourse.objects.create(
-                    branch=branch,
-                    year=year,
-                    semester=semester,
-                    course_code=course_code,
-                    course_title=course_title,
-                    faculty=faculty,
-                    is_elective=False,
-                    l=int(request.POST.get(f'main_l_{i}', 0) or 0),
-                    t=int(request.POST.get(f'main_t_{i}', 0) or 0),
-                    p=int(request.POST.get(f'main_p_{i}', 0) or 0),
-                    cie=int(request.POST.get(f'main_cie_{i}', 0) or 0),
-                    see=int(request.POST.get(f'main_see_{i}', 0) or 0),
-                    credits=float(request.POST.get(f'main_credits_{i}', 0) or 0),
-                )
-            
-            # Save elective courses
-            elective_row_count = int(request.POST.get('elective_row_count', 0))
-            for i in range(elective_row_count):
-                course_code = request.POST.get(f'elective_code_{i}', '').strip()
-                if not course_code:
-                    continue
-                
-                course_title = request.POST.get(f'elective_title_{i}', '')
-                faculty_id = request.POST.get(f'elective_faculty_{i}', None)
-                
-                faculty = None
-                if faculty_id:
-                    try:
-                        faculty = CustomUser.objects.get(id=faculty_id, role='faculty')
-                    except CustomUser.DoesNotExist:
-                        pass
-                
-                SchemeCourse.objects.create(
-                    branch=branch,
-                    year=year,
-                    semester=semester,
-                    course_code=course_code,
-                    course_title=course_title,
-                    faculty=faculty,
-                    is_elective=True,
-                    category='ESC',
+
+            # cleanup and the new rows commit together; a failed insert leaves the old scheme in place
+            with transaction.atomic():
+                # SAFELY delete existing SchemeCourse rows and related CourseAllocation/FacultyAssignment for this HOD
+                try:
+                    # savepoint so a failed cleanup can be logged without breaking the outer transaction
+                    with transaction.atomic():
+                        CourseAllocation = apps.get_model('hod', 'CourseAllocation')
+                        FacultyAssignment = apps.get_model('hod', 'FacultyAssignment')
+                        HODAssignment = apps.get_model('hod', 'HODAssignment')
+
+                        old_qs = SchemeCourse.objects.filter(branch=branch, year=year, semester=semester)
+                        old_codes = list(old_qs.values_list('course_code', flat=True))
+
+                        # delete SchemeCourse rows
+                        old_qs.delete()
+
+                        # if we have a hod record, delete CourseAllocation & FacultyAssignment for that hod and those codes
+                        hod_obj = getattr(request.user, 'hod_assignment', None)
+                        if hod_obj and old_codes:
+                            # delete faculty assignments referencing allocations for this hod, filtering through
+                            # the join directly; deleting an empty selection is a no-op, so no exists() probe first
+                            FacultyAssignment.objects.filter(
+                                course_allocation__hod_assignment=hod_obj, course_allocation__course_code__in=old_codes
+                            ).delete()
+                            CourseAllocation.objects.filter(hod_assignment=hod_obj, course_code__in=old_codes).delete()
+                except Exception:
+                    logger.exception("Error while cleaning up old scheme rows and allocations in save_scheme_courses")
+
+                main_row_count = int(request.POST.get('main_row_count', 0))
+                elective_row_count = int(request.POST.get('elective_row_count', 0))
+
+                # resolve every referenced faculty user with one IN query instead of a lookup per row
+                faculty_ids = (
+                    {request.POST.get(f'main_faculty_{i}') for i in range(main_row_count)}
+                    | {request.POST.get(f'elective_faculty_{i}') for i in range(elective_row_count)}
                 )
+                faculty_map = CustomUser.objects.filter(
+                    id__in=[int(fid) for fid in faculty_ids if fid and fid.isdigit()], role='faculty'
+                ).in_bulk()
+
+                # Collect main course rows from form
+                main_objs = []
+                for i in range(main_row_count):
+                    course_code = request.POST.get(f'main_code_{i}', '').strip()
+                    if not course_code:
+                        continue
+
+                    course_title = request.POST.get(f'main_title_{i}', '')
+                    faculty_id = request.POST.get(f'main_faculty_{i}', None)
+
+                    faculty = faculty_map.get(int(faculty_id)) if faculty_id and faculty_id.isdigit() else None
+
+                    main_objs.append(SchemeCourse(
+                        branch=branch,
+                        year=year,
+                        semester=semester,
+                        course_code=course_code,
+                        course_title=course_title,
+                        faculty=faculty,
+                        is_elective=False,
+                        l=int(request.POST.get(f'main_l_{i}', 0) or 0),
+                        t=int(request.POST.get(f'main_t_{i}', 0) or 0),
+                        p=int(request.POST.get(f'main_p_{i}', 0) or 0),
+                        cie=int(request.POST.get(f'main_cie_{i}', 0) or 0),
+                        see=int(request.POST.get(f'main_see_{i}', 0) or 0),
+                        credits=float(request.POST.get(f'main_credits_{i}', 0) or 0),
+                    ))
+
+                # Collect elective course rows
+                elective_objs = []
+                for i in range(elective_row_count):
+                    course_code = request.POST.get(f'elective_code_{i}', '').strip()
+                    if not course_code:
+                        continue
+
+                    course_title = request.POST.get(f'elective_title_{i}', '')
+                    faculty_id = request.POST.get(f'elective_faculty_{i}', None)
+
+                    faculty = faculty_map.get(int(faculty_id)) if faculty_id and faculty_id.isdigit() else None
+
+                    elective_objs.append(SchemeCourse(
+                        branch=branch,
+                        year=year,
+                        semester=semester,
+                        course_code=course_code,
+                        course_title=course_title,
+                        faculty=faculty,
+                        is_elective=True,
+                        category='ESC',
+                    ))
+
+                # one INSERT batch instead of a round-trip per row
+                SchemeCourse.objects.bulk_create(main_objs + elective_objs, batch_size=500)
             
             messages.success(request, "Scheme courses saved successfully!")
             logger.info(f"Saved scheme courses for {branch.name} Y{year} S{semester}")
@@ -3330,6 +3615,85 @@ def save_scheme_courses(request, branch_pk, year, semester):
     return redirect('hod:create_scheme', branch_pk=branch_pk, year=year, semester=semester)
 
 
+def _sync_hod_allocations(hod_assignment, pending_allocs, pending_faculty):
+    """
+    Write the CourseAllocation / FacultyAssignment rows collected by create_scheme in bulk.
+    `pending_allocs` maps course code -> (unsaved CourseAllocation, refresh_hours): main rows update
+    hours/credits of an existing allocation, elective rows leave an existing one untouched.
+    `pending_faculty` maps course code -> Faculty profile to assign to that allocation.
+    Returns (assignments created, assignments updated).
+    """
+    # course_code is unique across HODs; codes allocated to another HOD are skipped rather than failing the batch
+    taken = set(CourseAllocation.objects.filter(course_code__in=list(pending_allocs))
+                .exclude(hod_assignment=hod_assignment).values_list('course_code', flat=True))
+    if taken:
+        logger.warning("Course codes already allocated to another HOD, skipped: %s", sorted(taken))
+    refresh = [alloc for code, (alloc, refresh_hours) in pending_allocs.items() if refresh_hours and code not in taken]
+    keep = [alloc for code, (alloc, refresh_hours) in pending_allocs.items() if not refresh_hours and code not in taken]
+
+    with transaction.atomic():
+        if refresh:
+            CourseAllocation.objects.bulk_create(
+                refresh,
+                update_conflicts=True,
+                unique_fields=['hod_assignment', 'course_code'],
+                update_fields=['teaching_hours_L', 'teaching_hours_T', 'teaching_hours_P', 'credits'],
+            )
+        if keep:
+            CourseAllocation.objects.bulk_create(keep, ignore_conflicts=True)
+
+        if not pending_faculty:
+            return 0, 0
+        alloc_by_code = CourseAllocation.objects.filter(
+            hod_assignment=hod_assignment, course_code__in=list(pending_faculty)
+        ).in_bulk(field_name='course_code')
+
+        # the latest assignment per allocation is the one shown everywhere, so that is the one updated
+        existing = {}
+        for fa in FacultyAssignment.objects.filter(course_allocation__in=alloc_by_code.values()).order_by('assigned_on', 'pk'):
+            existing[fa.course_allocation_id] = fa
+
+        now = timezone.now()
+        to_update, to_create = [], []
+        for code, faculty_profile in pending_faculty.items():
+            alloc = alloc_by_code.get(code)
+            if alloc is None:
+                continue
+            fa = existing.get(alloc.pk)
+            if fa is None:
+                to_create.append(FacultyAssignment(course_allocation=alloc, faculty=faculty_profile, assigned_on=now))
+            else:
+                fa.faculty = faculty_profile
+                fa.assigned_on = now
+                to_update.append(fa)
+        if to_update:
+            FacultyAssignment.objects.bulk_update(to_update, ['faculty', 'assigned_on'])
+        if to_create:
+            FacultyAssignment.objects.bulk_create(to_create)
+    return len(to_create), len(to_update)
+
+
+def _save_scheme_electives(pending_electives):
+    """
+    Upsert the elective SchemeCourse rows collected by create_scheme (course code -> unsaved row)
+    in bulk. Rows with a chosen faculty also overwrite `faculty`; the others leave it untouched.
+    """
+    SchemeCourse = apps.get_model('hod', 'SchemeCourse')
+    fields = ['course_title', 'category', 'is_elective', 'updated_at']
+    with_faculty = [sc for sc in pending_electives.values() if sc.faculty_id]
+    without_faculty = [sc for sc in pending_electives.values() if not sc.faculty_id]
+    with transaction.atomic():
+        for rows, update_fields in ((with_faculty, fields + ['faculty']), (without_faculty, fields)):
+            if rows:
+                SchemeCourse.objects.bulk_create(
+                    rows,
+                    batch_size=500,
+                    update_conflicts=True,
+                    unique_fields=['branch', 'year', 'semester', 'course_code'],
+                    update_fields=update_fields,
+                )
+
+
 @login_required
 def create_scheme(request, branch_pk, year, semester):
     """
@@ -3338,7 +3702,7 @@ def create_scheme(request, branch_pk, year, semester):
     are created/updated for the HOD (linked via HODAssignment).
     """
     branch = get_object_or_404(Branch, pk=branch_pk)
-    faculty_list = CustomUser.objects.filter(role='faculty', is_active=True)
+    faculty_list = _active_faculty_list()
 
     # Build Dean course list (display only) - Include courses assigned by Dean for admission_year & sem in create scheme and in PDF
     # Use CollegeLevelCourse (imported as Course) which represents dean-assigned courses
@@ -3352,7 +3716,7 @@ def create_scheme(request, branch_pk, year, semester):
                 branch__isnull=True,
             )
             # Filter by semester if model has semester field
-            if hasattr(Course, 'semester'):
+            if 'semester' in _COURSE_FIELDS:
                 try:
                     dean_qs = dean_qs.filter(semester=int(semester))
                 except (ValueError, TypeError):
@@ -3363,7 +3727,7 @@ def create_scheme(request, branch_pk, year, semester):
             # Filter by admission_year if model supports it (STRICT match when year provided)
             from django.db.models import Q
             for year_field in ['admission_year', 'year', 'academic_year']:
-                if hasattr(Course, year_field) and year not in (None, '', 0):
+                if year_field in _COURSE_FIELDS and year not in (None, '', 0):
                     # Include courses that explicitly match the requested year OR have no year set (backwards compatibility)
                     try:
                         int_year = int(year)
@@ -3381,38 +3745,10 @@ def create_scheme(request, branch_pk, year, semester):
             logger.exception("Error fetching dean courses: %s", e)
             dean_qs = Course.objects.none()
 
-        logger.info("Dean queryset size for create_scheme: %d", dean_qs.count())
-        for c in dean_qs:
-            try:
-                f_id = None
-                if hasattr(c, 'faculty_id') and getattr(c, 'faculty_id') not in (None, ''):
-                    try:
-                        f_id = int(getattr(c, 'faculty_id'))
-                    except Exception:
-                        f_obj = getattr(c, 'faculty', None)
-                        f_id = int(getattr(f_obj, 'id')) if f_obj else None
-                dean_courses.append({
-                    'id': getattr(c, 'id', None),
-                    'category': getattr(c, 'course_category', '') or '',
-                    'course_code': getattr(c, 'course_code', '') or '',
-                    'course_title': getattr(c, 'course_title', '') or '',
-                    'l': int(getattr(c, 'teaching_hours_L', 0) or 0),
-                    't': int(getattr(c, 'teaching_hours_T', 0) or 0),
-                    'p': int(getattr(c, 'teaching_hours_P', 0) or 0),
-                    'total_hours': (int(getattr(c, 'teaching_hours_L', 0) or 0)
-                                    + int(getattr(c, 'teaching_hours_T', 0) or 0)
-                                    + int(getattr(c, 'teaching_hours_P', 0) or 0)),
-                    'cie': int(getattr(c, 'cie_marks', 0) or 0),
-                    'see': int(getattr(c, 'see_marks', 0) or 0),
-                    'total_marks': (int(getattr(c, 'cie_marks', 0) or 0)
-                                    + int(getattr(c, 'see_marks', 0) or 0)),
-                    'credits': getattr(c, 'credits', 0) or 0,
-                    'faculty_id': f_id,
-                    'faculty_username': getattr(getattr(c, 'faculty', None), 'username', '') if hasattr(c, 'faculty') else '',
-                })
-            except Exception:
-                # skip problematic dean course rows; don't break form rendering
-                logger.exception("Error preparing dean course data for display (course id=%s).", getattr(c, 'id', None))
+        # plain dicts straight from .values(), with the totals computed by the database
+        dean_rows_qs = dean_qs.annotate(**DEAN_COURSE_TOTALS).values(*DEAN_COURSE_VALUES, *DEAN_COURSE_TOTALS)
+        dean_courses = [_dean_course_display_row(d) for d in dean_rows_qs.iterator(chunk_size=DEAN_ROWS_CHUNK_SIZE)]
+        logger.info("Dean courses for create_scheme: %d", len(dean_courses))
 
     # POST: user clicked Save Scheme / Save & Download
     if request.method == 'POST':
@@ -3421,144 +3757,63 @@ def create_scheme(request, branch_pk, year, semester):
             dashboard_url = reverse('hod:dashboard_self', args=[branch_pk])
             return redirect(f"{dashboard_url}?year={year}&semester={semester}")
 
-        # clear any previous messages
-        list(messages.get_messages(request))
+        # clear any previous messages: marking the storage used drops them on save without
+        # loading and iterating them (messages added below are still kept)
+        messages.get_messages(request).used = True
 
         created_count = 0
-        hod_assignment = getattr(request.user, 'hod_assignment', None)
-
-        # MAIN rows loop: index 1..N with form names like code_new_1, title_new_1, etc.
-        i = 1
-        while True:
-            code = (request.POST.get(f'code_new_{i}', '') or '').strip()
-            title = (request.POST.get(f'title_new_{i}', '') or '').strip()
-            if not code and not title:
-                break
-
-            # numeric fields (safe parsing)
-            l = request.POST.get(f'l_new_{i}') or 0
-            t = request.POST.get(f't_new_{i}') or 0
-            p = request.POST.get(f'p_new_{i}') or 0
-            try:
-                total_hours = int(request.POST.get(f'total_hours_new_{i}') or (int(l or 0) + int(t or 0) + int(p or 0)))
-            except Exception:
-                total_hours = int((int(l or 0) + int(t or 0) + int(p or 0)))
-            cie = request.POST.get(f'cie_new_{i}') or 0
-            see = request.POST.get(f'see_new_{i}') or 0
-            try:
-                total_marks = int(request.POST.get(f'total_marks_new_{i}') or (int(cie or 0) + int(see or 0)))
-            except Exception:
-                total_marks = int((int(cie or 0) + int(see or 0)))
-            credits = request.POST.get(f'credits_new_{i}') or 0
-            faculty_id = request.POST.get(f'faculty_new_{i}') or None
-            category = request.POST.get(f'category_new_{i}') or None
-
-            try:
-                # Get SchemeCourse model (may be imported dynamically)
-                SchemeCourse = apps.get_model('hod', 'SchemeCourse')
-                with transaction.atomic():
-                    # Use update_or_create to avoid duplicates and ensure all rows are persisted
-                    sc, created = SchemeCourse.objects.update_or_create(
-                        branch=branch,
-                        year=int(year),
-                        semester=int(semester),
-                        course_code=code,
-                        defaults={
-                            'course_title': title or '',
-                            'l': int(l or 0),
-                            't': int(t or 0),
-                            'p': int(p or 0),
-                            'total_hours': int(total_hours or 0),
-                            'cie': int(cie or 0),
-                            'see': int(see or 0),
-                            'total_marks': int(total_marks or 0),
-                            'credits': Decimal(str(credits)) if credits else Decimal('0.0'),
-                            'category': category or '',
-                            'is_elective': False,
-                        }
-                    )
-
-                    # Ensure CourseAllocation exists for this HOD
-                    course_alloc = None
-                    if hod_assignment:
-                        course_alloc, ca_created = CourseAllocation.objects.get_or_create(
-                            hod_assignment=hod_assignment,
-                            course_code=code,
-                            defaults={
-                                'course_title': title or '',
-                                'course_category': category or '',
-                                'teaching_hours_L': int(l or 0),
-                                'teaching_hours_T': int(t or 0),
-                                'teaching_hours_P': int(p or 0),
-                                'credits': float(credits or 0),
-                            }
-                        )
-                        if not ca_created:
-                            # update basic hours/credits if they changed
-                            changed = False
-                            if hasattr(course_alloc, 'teaching_hours_L') and course_alloc.teaching_hours_L != int(l or 0):
-                                course_alloc.teaching_hours_L = int(l or 0); changed = True
-                            if hasattr(course_alloc, 'teaching_hours_T') and course_alloc.teaching_hours_T != int(t or 0):
-                                course_alloc.teaching_hours_T = int(t or 0); changed = True
-                            if hasattr(course_alloc, 'teaching_hours_P') and course_alloc.teaching_hours_P != int(p or 0):
-                                course_alloc.teaching_hours_P = int(p or 0); changed = True
-                            if hasattr(course_alloc, 'credits') and float(course_alloc.credits or 0) != float(credits or 0):
-                                course_alloc.credits = float(credits or 0); changed = True
-                            if changed:
-                                course_alloc.save()
-
-                    # If faculty chosen, link sc.faculty (if available) and create/update FacultyAssignment
-                    if faculty_id:
-                        try:
-                            faculty_user = CustomUser.objects.get(id=int(faculty_id))
-                            faculty_profile, _ = Faculty.objects.get_or_create(
-                                user=faculty_user,
-                                defaults={'department': getattr(hod_assignment.branch, 'name', '') if hod_assignment else ''}
-                            )
-                            # attach to scheme row if model supports it
-                            try:
-                                # If SchemeCourse has a faculty FK field
-                                if hasattr(sc, 'faculty'):
-                                    sc.faculty = faculty_user
-                                    sc.save(update_fields=['faculty'])
-                            except Exception:
-                                # ignore if scheme model doesn't accept faculty in same way
-                                pass
-
-                            # create or update FacultyAssignment linked to CourseAllocation (if course_alloc exists)
-                            if course_alloc:
-                                fa, fa_created = FacultyAssignment.objects.update_or_create(
-                                    course_allocation=course_alloc,
-                                    defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
-                                )
-                                logger.info("FacultyAssignment %s for code=%s alloc=%s", 'created' if fa_created else 'updated', code, getattr(course_alloc, 'pk', None))
-
-                        except CustomUser.DoesNotExist:
-                            logger.warning("Faculty user not found (id=%s) while saving scheme.", faculty_id)
-
-                    created_count += 1
-            except Exception as e:
-                # log but continue to next row - transaction ensures partial row not saved
-                logger.exception("Failed to save scheme row #%s (code=%s): %s", i, code, e)
-            i += 1
-
-        # Elective sections (pec, oec, esc, aec) — same logic, fewer numeric fields
-        # Handle both regular and additional elective rows
-        for section in ['pec', 'oec', 'esc', 'aec']:
-            # Process regular elective rows
-            j = 1
-            while True:
-                code = (request.POST.get(f'{section}_code_{j}', '') or '').strip()
-                title = (request.POST.get(f'{section}_title_{j}', '') or '').strip()
+        hod_assignment = _request_hod_assignment(request)
+        # course code -> (unsaved CourseAllocation, refresh_hours) and course code -> faculty user
+        pending_allocs = {}
+        pending_faculty = {}
+        # course code -> unsaved elective SchemeCourse, upserted in bulk after the loops
+        pending_electives = {}
+        # every faculty picked on the form, loaded once instead of per row; Faculty profiles are only
+        # created (in one batch, below) for the users of rows that were actually saved
+        posted_faculty = _posted_faculty_users(request.POST)
+        # faculty users of saved main rows (these get a profile even without an HOD assignment)
+        main_row_faculty = {}
+
+        # one transaction for the whole save; the per-row atomic blocks below become savepoints,
+        # so a failing row is still rolled back on its own without committing after every row
+        with transaction.atomic():
+            # MAIN rows: form names like code_new_1, title_new_1, etc.; one scan of the POST keys
+            # yields the submitted indices, so gaps left by removed rows don't end the loop early
+            main_indices, elective_indices = _posted_row_indices(request.POST)
+            has_submitted_rows = False
+            pg = request.POST.get
+            for i in main_indices:
+                # field names share the row suffix; format it once per row rather than once per field
+                suffix = f'_new_{i}'
+                code = (pg('code' + suffix, '') or '').strip()
+                title = (pg('title' + suffix, '') or '').strip()
                 if not code and not title:
-                    break
-                faculty_id = request.POST.get(f'{section}_faculty_{j}') or None
+                    continue
+                has_submitted_rows = True
+
+                # numeric fields (safe parsing)
+                l = pg('l' + suffix) or 0
+                t = pg('t' + suffix) or 0
+                p = pg('p' + suffix) or 0
+                try:
+                    total_hours = int(pg('total_hours' + suffix) or (int(l or 0) + int(t or 0) + int(p or 0)))
+                except Exception:
+                    total_hours = int((int(l or 0) + int(t or 0) + int(p or 0)))
+                cie = pg('cie' + suffix) or 0
+                see = pg('see' + suffix) or 0
+                try:
+                    total_marks = int(pg('total_marks' + suffix) or (int(cie or 0) + int(see or 0)))
+                except Exception:
+                    total_marks = int((int(cie or 0) + int(see or 0)))
+                credits = pg('credits' + suffix) or 0
+                faculty_id = pg('faculty' + suffix) or None
+                category = pg('category' + suffix) or None
 
                 try:
                     # Get SchemeCourse model (may be imported dynamically)
                     SchemeCourse = apps.get_model('hod', 'SchemeCourse')
                     with transaction.atomic():
-                        # Use update_or_create to avoid duplicates and ensure all elective rows are persisted
+                        # Use update_or_create to avoid duplicates and ensure all rows are persisted
                         sc, created = SchemeCourse.objects.update_or_create(
                             branch=branch,
                             year=int(year),
@@ -3566,142 +3821,190 @@ def create_scheme(request, branch_pk, year, semester):
                             course_code=code,
                             defaults={
                                 'course_title': title or '',
-                                'category': section.upper(),
-                                'is_elective': True,
+                                'l': int(l or 0),
+                                't': int(t or 0),
+                                'p': int(p or 0),
+                                'total_hours': int(total_hours or 0),
+                                'cie': int(cie or 0),
+                                'see': int(see or 0),
+                                'total_marks': int(total_marks or 0),
+                                'credits': Decimal(str(credits)) if credits else Decimal('0.0'),
+                                'category': category or '',
+                                'is_elective': False,
                             }
                         )
 
-                        course_alloc = None
+                        # CourseAllocation for this HOD is written in bulk once all rows are parsed;
+                        # main rows refresh hours/credits on an existing allocation
                         if hod_assignment:
-                            course_alloc, ca_created = CourseAllocation.objects.get_or_create(
+                            pending_allocs[code] = (CourseAllocation(
                                 hod_assignment=hod_assignment,
                                 course_code=code,
-                                defaults={
-                                    'course_title': title or '',
-                                    'course_category': section.upper(),
-                                    'teaching_hours_L': 0,
-                                    'teaching_hours_T': 0,
-                                    'teaching_hours_P': 0,
-                                    'credits': 0
-                                }
-                            )
-
+                                course_title=title or '',
+                                course_category=category or '',
+                                teaching_hours_L=int(l or 0),
+                                teaching_hours_T=int(t or 0),
+                                teaching_hours_P=int(p or 0),
+                                credits=float(credits or 0),
+                            ), True)
+
+                        # If faculty chosen, link sc.faculty (if available) and create/update FacultyAssignment
                         if faculty_id:
                             try:
-                                faculty_user = CustomUser.objects.get(id=int(faculty_id))
-                                faculty_profile, _ = Faculty.objects.get_or_create(
-                                    user=faculty_user,
-                                    defaults={'department': getattr(hod_assignment.branch, 'name', '') if hod_assignment else ''}
-                                )
-                                if hasattr(sc, 'faculty'):
-                                    sc.faculty = faculty_user
-                                    sc.save(update_fields=['faculty'])
-                                if course_alloc:
-                                    FacultyAssignment.objects.update_or_create(
-                                        course_allocation=course_alloc,
-                                        defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
-                                    )
-                            except CustomUser.DoesNotExist:
-                                logger.warning("Faculty user id=%s not found for elective %s.", faculty_id, code)
+                                faculty_user = posted_faculty[int(faculty_id)]
+                                main_row_faculty[faculty_user.pk] = faculty_user
+                                # attach to scheme row if model supports it
+                                try:
+                                    # If SchemeCourse has a faculty FK field
+                                    if 'faculty' in _SCHEME_COURSE_FIELDS:
+                                        sc.faculty = faculty_user
+                                        sc.save(update_fields=['faculty'])
+                                except Exception:
+                                    # ignore if scheme model doesn't accept faculty in same way
+                                    pass
+
+                                # FacultyAssignment for the HOD's CourseAllocation is written in bulk after the loops
+                                if hod_assignment:
+                                    pending_faculty[code] = faculty_user
+
+                            except KeyError:
+                                logger.warning("Faculty user not found (id=%s) while saving scheme.", faculty_id)
 
                         created_count += 1
                 except Exception as e:
-                    logger.exception("Failed to save elective %s row %s: %s", section, j, e)
-                j += 1
-            
-            # Process additional elective rows (additional_pec_code_1, etc.)
-            j_add = 1
-            while True:
-                code = (request.POST.get(f'additional_{section}_code_{j_add}', '') or '').strip()
-                title = (request.POST.get(f'additional_{section}_title_{j_add}', '') or '').strip()
-                if not code and not title:
-                    break
-                faculty_id = request.POST.get(f'additional_{section}_faculty_{j_add}') or None
+                    # log but continue to next row - transaction ensures partial row not saved
+                    logger.exception("Failed to save scheme row #%s (code=%s): %s", i, code, e)
 
-                try:
-                    SchemeCourse = apps.get_model('hod', 'SchemeCourse')
-                    with transaction.atomic():
-                        sc, created = SchemeCourse.objects.update_or_create(
+            # Elective sections (pec, oec, esc, aec) — same logic, fewer numeric fields
+            # Handle both regular and additional elective rows
+            for section in ['pec', 'oec', 'esc', 'aec']:
+                # Process regular elective rows
+                for j in elective_indices.get(section, ()):
+                    code = (request.POST.get(f'{section}_code_{j}', '') or '').strip()
+                    title = (request.POST.get(f'{section}_title_{j}', '') or '').strip()
+                    if not code and not title:
+                        continue
+                    has_submitted_rows = True
+                    faculty_id = request.POST.get(f'{section}_faculty_{j}') or None
+
+                    try:
+                        SchemeCourse = apps.get_model('hod', 'SchemeCourse')
+                        faculty_user = None
+                        if faculty_id:
+                            faculty_user = posted_faculty.get(int(faculty_id))
+                            if faculty_user is None:
+                                logger.warning("Faculty user id=%s not found for elective %s.", faculty_id, code)
+                        # upserted with the other elective rows by _save_scheme_electives
+                        pending_electives[code] = SchemeCourse(
                             branch=branch,
                             year=int(year),
                             semester=int(semester),
                             course_code=code,
-                            defaults={
-                                'course_title': title or '',
-                                'category': section.upper(),
-                                'is_elective': True,
-                            }
+                            course_title=title or '',
+                            category=section.upper(),
+                            is_elective=True,
+                            faculty=faculty_user,
                         )
 
-                        course_alloc = None
+                        # elective allocations are only created, never refreshed (see _sync_hod_allocations)
                         if hod_assignment:
-                            course_alloc, ca_created = CourseAllocation.objects.get_or_create(
+                            pending_allocs[code] = (CourseAllocation(
                                 hod_assignment=hod_assignment,
                                 course_code=code,
-                                defaults={
-                                    'course_title': title or '',
-                                    'course_category': section.upper(),
-                                    'teaching_hours_L': 0,
-                                    'teaching_hours_T': 0,
-                                    'teaching_hours_P': 0,
-                                    'credits': 0
-                                }
-                            )
+                                course_title=title or '',
+                                course_category=section.upper(),
+                                teaching_hours_L=0,
+                                teaching_hours_T=0,
+                                teaching_hours_P=0,
+                                credits=0,
+                            ), False)
+                            if faculty_user is not None:
+                                pending_faculty[code] = faculty_user
+                    except Exception as e:
+                        logger.exception("Failed to save elective %s row %s: %s", section, j, e)
+            
+                # Process additional elective rows (additional_pec_code_1, etc.)
+                for j_add in elective_indices.get(f'additional_{section}', ()):
+                    code = (request.POST.get(f'additional_{section}_code_{j_add}', '') or '').strip()
+                    title = (request.POST.get(f'additional_{section}_title_{j_add}', '') or '').strip()
+                    if not code and not title:
+                        continue
+                    faculty_id = request.POST.get(f'additional_{section}_faculty_{j_add}') or None
 
+                    try:
+                        SchemeCourse = apps.get_model('hod', 'SchemeCourse')
+                        faculty_user = None
                         if faculty_id:
-                            try:
-                                faculty_user = CustomUser.objects.get(id=int(faculty_id))
-                                faculty_profile, _ = Faculty.objects.get_or_create(
-                                    user=faculty_user,
-                                    defaults={'department': getattr(hod_assignment.branch, 'name', '') if hod_assignment else ''}
-                                )
-                                if hasattr(sc, 'faculty'):
-                                    sc.faculty = faculty_user
-                                    sc.save(update_fields=['faculty'])
-                                if course_alloc:
-                                    FacultyAssignment.objects.update_or_create(
-                                        course_allocation=course_alloc,
-                                        defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
-                                    )
-                            except CustomUser.DoesNotExist:
+                            faculty_user = posted_faculty.get(int(faculty_id))
+                            if faculty_user is None:
                                 logger.warning("Faculty user id=%s not found for additional elective %s.", faculty_id, code)
+                        # upserted with the other elective rows by _save_scheme_electives
+                        pending_electives[code] = SchemeCourse(
+                            branch=branch,
+                            year=int(year),
+                            semester=int(semester),
+                            course_code=code,
+                            course_title=title or '',
+                            category=section.upper(),
+                            is_elective=True,
+                            faculty=faculty_user,
+                        )
 
-                        created_count += 1
+                        # elective allocations are only created, never refreshed (see _sync_hod_allocations)
+                        if hod_assignment:
+                            pending_allocs[code] = (CourseAllocation(
+                                hod_assignment=hod_assignment,
+                                course_code=code,
+                                course_title=title or '',
+                                course_category=section.upper(),
+                                teaching_hours_L=0,
+                                teaching_hours_T=0,
+                                teaching_hours_P=0,
+                                credits=0,
+                            ), False)
+                            if faculty_user is not None:
+                                pending_faculty[code] = faculty_user
+                    except Exception as e:
+                        logger.exception("Failed to save additional elective %s row %s: %s", section, j_add, e)
+
+            if pending_electives:
+                try:
+                    _save_scheme_electives(pending_electives)
+                    created_count += len(pending_electives)
                 except Exception as e:
-                    logger.exception("Failed to save additional elective %s row %s: %s", section, j_add, e)
-                j_add += 1
+                    logger.exception("Failed to save elective rows for branch=%s: %s", branch_pk, e)
+                    # no allocations for elective rows that were not saved
+                    for code in pending_electives:
+                        if code in pending_allocs and not pending_allocs[code][1]:
+                            del pending_allocs[code]
+                            pending_faculty.pop(code, None)
+
+            # Faculty profiles for the saved rows only, created in this same transaction
+            profile_users = {**main_row_faculty, **{u.pk: u for u in pending_faculty.values()}}
+            try:
+                with transaction.atomic():
+                    profiles = _faculty_profiles(
+                        list(profile_users.values()),
+                        getattr(hod_assignment.branch, 'name', '') if hod_assignment else '')
+            except Exception as e:
+                logger.exception("Failed to create faculty profiles for branch=%s: %s", branch_pk, e)
+                profiles = {}
+            pending_faculty = {code: profiles[u.pk] for code, u in pending_faculty.items() if u.pk in profiles}
+
+            fa_created_n = fa_updated_n = 0
+            if hod_assignment and pending_allocs:
+                try:
+                    fa_created_n, fa_updated_n = _sync_hod_allocations(hod_assignment, pending_allocs, pending_faculty)
+                except Exception as e:
+                    logger.exception("Failed to save course allocations for %s: %s", hod_assignment, e)
+
+        # one summary line per save instead of a log record per row
+        logger.info("Saved %d scheme rows (FA created=%d updated=%d) for branch=%s y=%s s=%s",
+                    created_count, fa_created_n, fa_updated_n, branch_pk, year, semester)
 
         # messages & redirect
         # Only show "No rows were created" if we actually tried to process rows but none were valid
-        # Check if any rows were submitted (not just dean courses)
-        has_submitted_rows = False
-        # Check main rows
-        i_check = 1
-        while True:
-            code = (request.POST.get(f'code_new_{i_check}', '') or '').strip()
-            title = (request.POST.get(f'title_new_{i_check}', '') or '').strip()
-            if code or title:
-                has_submitted_rows = True
-                break
-            i_check += 1
-            if i_check > 100:  # safety limit
-                break
-        # Check elective rows
-        if not has_submitted_rows:
-            for section in ['pec', 'oec', 'esc', 'aec']:
-                j_check = 1
-                while True:
-                    code = (request.POST.get(f'{section}_code_{j_check}', '') or '').strip()
-                    title = (request.POST.get(f'{section}_title_{j_check}', '') or '').strip()
-                    if code or title:
-                        has_submitted_rows = True
-                        break
-                    j_check += 1
-                    if j_check > 10:  # safety limit
-                        break
-                if has_submitted_rows:
-                    break
-        
+        # (has_submitted_rows is set while looping over the main and regular elective rows above)
         if created_count > 0:
             messages.success(request, f"Scheme saved successfully! ({created_count} rows created). CourseAllocation/FacultyAssignment should be created for HOD.")
         elif has_submitted_rows:
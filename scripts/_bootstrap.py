@@ -0,0 +1,20 @@
+"""
+Shared setup for the standalone scripts in this directory: puts the project root on sys.path,
+points DJANGO_SETTINGS_MODULE at the project's settings and calls django.setup().
+
+Scripts run as `python scripts/<name>.py` find this module next to them; import it before
+any model imports:
+    from _bootstrap import PROJECT_ROOT
+"""
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'syllabus_maker.settings')
+
+import django
+django.setup()
@@ -9,17 +9,35 @@ Warning: this will create database records; inspect output before running live.
 """
 from hod.models import FacultySyllabusPDF
 from django.apps import apps
+from django.db import transaction
 import os
 
 CollegeLevelCourse = apps.get_model('academics', 'CollegeLevelCourse')
 SchemeCourse = apps.get_model('hod', 'SchemeCourse')
 
+# SchemeCourse rows keyed by upper-cased code, built once instead of an iexact lookup per PDF;
+# plain dicts from values() rather than model instances
+sc_by_code = {}
+for sc in (SchemeCourse.objects
+           .values('id', 'course_code', 'course_title', 'category', 'l', 't', 'p', 'cie', 'see', 'credits',
+                   'course_id', 'course__course_code')
+           .order_by('pk').iterator(chunk_size=5000)):
+    sc_by_code.setdefault(sc['course_code'].upper(), sc)
+
+PERFORM_CHANGES = False
+
 candidates = FacultySyllabusPDF.objects.filter(course__isnull=True)
-print('Found', candidates.count(), 'faculty PDFs with null course.')
+found = 0  # counted while streaming instead of a separate COUNT(*) query
 created = 0
 attached = 0
 skipped = 0
-for p in candidates.order_by('-created_at'):
+to_update = []
+# Single pass over the candidates: PDFs whose scheme course already points to a CollegeLevelCourse
+# are attached; the others are collected with the course to create for them
+new_courses = {}  # upper-cased code -> (unsaved CollegeLevelCourse, SchemeCourse)
+attach = []  # (pdf, upper-cased code) for PDFs whose course would be created
+for p in candidates.only('id', 'title', 'pdf_file', 'course_id').order_by('-created_at').iterator(chunk_size=2000):
+    found += 1
     code = None
     if p.title and isinstance(p.title, str):
         parts = p.title.split('_')
@@ -34,72 +52,61 @@ for p in candidates.order_by('-created_at'):
         print('Skipping PDF', p.pk, 'no code found')
         skipped += 1
         continue
-    sc = SchemeCourse.objects.filter(course_code__iexact=code).first()
+    sc = sc_by_code.get(code.upper())
     if not sc:
         print('No SchemeCourse for code', code, 'skipping PDF', p.pk)
         skipped += 1
         continue
     # If the scheme course already points to a CollegeLevelCourse, use it
-    if getattr(sc, 'course', None):
-        p.course = sc.course
-        p.save()
+    if sc['course_id']:
+        p.course_id = sc['course_id']
+        to_update.append(p)
         attached += 1
-        print('Attached PDF', p.pk, 'to existing CollegeLevelCourse', sc.course.course_code)
+        print('Attached PDF', p.pk, 'to existing CollegeLevelCourse', sc['course__course_code'])
         continue
-    # Otherwise, create a new CollegeLevelCourse from scheme data
-    print('Would create CollegeLevelCourse for scheme', sc.pk, 'code', code, 'title', sc.course_title)
-    # The script by default does DRY RUN; to perform changes set PERFORM_CHANGES = True
+    # Otherwise a new CollegeLevelCourse is created from scheme data, one per code
+    if code.upper() not in new_courses:
+        print('Would create CollegeLevelCourse for scheme', sc['id'], 'code', code, 'title', sc['course_title'])
+        new_courses[code.upper()] = (CollegeLevelCourse(
+            course_code=code,
+            course_title=sc['course_title'] or code,
+            course_category=sc['category'] or 'Main',
+            teaching_hours_L=sc['l'] or 0,
+            teaching_hours_T=sc['t'] or 0,
+            teaching_hours_P=sc['p'] or 0,
+            cie_marks=sc['cie'] or 50,
+            see_marks=sc['see'] or 50,
+            credits=sc['credits'] or 0,
+            department='All Branches',
+        ), sc)
+    attach.append((p, code.upper()))
 
-PERFORM_CHANGES = False
-if PERFORM_CHANGES:
-    for p in candidates.order_by('-created_at'):
-        code = None
-        if p.title and isinstance(p.title, str):
-            parts = p.title.split('_')
-            if parts:
-                code = parts[0]
-        if not code and getattr(p, 'pdf_file', None):
-            fname = getattr(p.pdf_file, 'name', '') or ''
-            fname_parts = os.path.basename(fname).split('_')
-            if fname_parts:
-                code = fname_parts[0]
-        if not code:
-            continue
-        sc = SchemeCourse.objects.filter(course_code__iexact=code).first()
-        if not sc:
-            continue
-        if getattr(sc, 'course', None):
-            p.course = sc.course
-            p.save()
-            attached += 1
-            continue
-        # Create course
-        try:
-            new_course = CollegeLevelCourse.objects.create(
-                course_code=code,
-                course_title=sc.course_title or code,
-                course_category=getattr(sc, 'category', '') or 'Main',
-                teaching_hours_L=getattr(sc, 'l', 0) or 0,
-                teaching_hours_T=getattr(sc, 't', 0) or 0,
-                teaching_hours_P=getattr(sc, 'p', 0) or 0,
-                cie_marks=getattr(sc, 'cie', 50) or 50,
-                see_marks=getattr(sc, 'see', 50) or 50,
-                credits=getattr(sc, 'credits', 0) or 0,
-                department='All Branches',
-            )
-            sc.course = new_course
-            sc.save()
-            created += 1
-            # Attach PDFs that match this code
-            for p2 in FacultySyllabusPDF.objects.filter(course__isnull=True):
-                if p2.title and p2.title.startswith(code):
-                    p2.course = new_course
-                    p2.save()
-                    attached += 1
-            print('Created CollegeLevelCourse', new_course.course_code, 'and attached PDFs')
-        except Exception as e:
-            print('Failed to create course for', code, e)
+# The script by default does DRY RUN for course creation; to perform changes set PERFORM_CHANGES = True.
+# Attaching to existing courses always happens, in batched UPDATEs instead of a full save() per PDF.
+try:
+    with transaction.atomic():
+        if PERFORM_CHANGES and new_courses:
+            # Courses are saved one by one so the post_save receivers in academics/signals.py (Subject
+            # propagation, adding the course to every Scheme) still run; scheme rows and PDFs are then
+            # linked with batched UPDATEs
+            for new_course, _ in new_courses.values():
+                new_course.save()
+                print('Created CollegeLevelCourse', new_course.course_code)
+            SchemeCourse.objects.bulk_update(
+                [SchemeCourse(pk=sc['id'], course=new_course) for new_course, sc in new_courses.values()],
+                ['course'], batch_size=500)
+            for p, key in attach:
+                p.course = new_courses[key][0]
+                to_update.append(p)
+            created += len(new_courses)
+            attached += len(attach)
+        FacultySyllabusPDF.objects.bulk_update(to_update, ['course'], batch_size=500)
+except Exception as e:
+    # the transaction rolled back, so nothing was created or attached
+    created = attached = 0
+    print('Failed to save changes', e)
 
 print('\nDRY RUN complete')
+print('Found', found, 'faculty PDFs with null course.')
 print('Created:', created, 'Attached:', attached, 'Skipped:', skipped)
 print('To perform changes, set PERFORM_CHANGES = True in this script and run it again (careful!).')
@@ -12,11 +12,22 @@ import os
 CollegeLevelCourse = apps.get_model('academics', 'CollegeLevelCourse')
 SchemeCourse = apps.get_model('hod', 'SchemeCourse')
 
+# Resolve codes from in-memory maps built once, instead of two lookups per PDF (codes match case-insensitively)
+clc_by_code = {}
+for c in CollegeLevelCourse.objects.only('id', 'course_code').order_by('pk').iterator(chunk_size=5000):
+    clc_by_code.setdefault(c.course_code.upper(), c)
+sc_course_by_code = {}
+for sc in (SchemeCourse.objects.filter(course__isnull=False).select_related('course')
+           .only('id', 'course_code', 'course__id', 'course__course_code').order_by('pk').iterator(chunk_size=5000)):
+    sc_course_by_code.setdefault(sc.course_code.upper(), sc.course)
+
 candidates = FacultySyllabusPDF.objects.filter(course__isnull=True)
-print('Found', candidates.count(), 'faculty PDFs with null course.')
+found = 0  # counted while streaming instead of a separate COUNT(*) query
 fixed = 0
 unresolved = []
-for p in candidates.order_by('-created_at'):
+to_update = []
+for p in candidates.only('id', 'title', 'pdf_file', 'course_id').order_by('-created_at').iterator(chunk_size=2000):
+    found += 1
     code = None
     if p.title and isinstance(p.title, str):
         parts = p.title.split('_')
@@ -31,24 +42,28 @@ for p in candidates.order_by('-created_at'):
         unresolved.append((p.pk, None))
         continue
     # Try CollegeLevelCourse
-    course = CollegeLevelCourse.objects.filter(course_code__iexact=code).first()
+    course = clc_by_code.get(code.upper())
     if course:
         p.course = course
-        p.save()
+        to_update.append(p)
         fixed += 1
         print('Assigned CollegeLevelCourse for PDF', p.pk, '->', course.course_code)
         continue
     # Try SchemeCourse (if it points to a CollegeLevelCourse)
-    sc = SchemeCourse.objects.filter(course_code__iexact=code).first()
-    if sc and getattr(sc, 'course', None):
-        p.course = sc.course
-        p.save()
+    course = sc_course_by_code.get(code.upper())
+    if course:
+        p.course = course
+        to_update.append(p)
         fixed += 1
-        print('Assigned SchemeCourse.course for PDF', p.pk, '->', sc.course.course_code)
+        print('Assigned SchemeCourse.course for PDF', p.pk, '->', course.course_code)
         continue
     unresolved.append((p.pk, code))
 
+# write every resolved course in batched UPDATEs instead of a full save() per PDF
+FacultySyllabusPDF.objects.bulk_update(to_update, ['course'], batch_size=500)
+
 print('\nSummary:')
+print('  Found:', found, 'faculty PDFs with null course')
 print('  Fixed:', fixed)
 print('  Unresolved:', len(unresolved))
 if unresolved:
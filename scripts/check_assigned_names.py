@@ -10,15 +10,20 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'syllabus_maker.settings')
 import django
 django.setup()
 
+from django.db.models import Prefetch
+
 from academics.models import Branch
 from hod.models import CourseAllocation, FacultyAssignment
 
 branch = Branch.objects.get(pk=10)
 print('Branch:', branch)
-cas = CourseAllocation.objects.filter(hod_assignment__branch=branch)
+# newest assignment first, with faculty and user joined, prefetched for every course in one query
+latest_fa = FacultyAssignment.objects.select_related('faculty__user').order_by('-assigned_on')
+cas = CourseAllocation.objects.filter(hod_assignment__branch=branch).prefetch_related(
+    Prefetch('facultyassignment_set', queryset=latest_fa, to_attr='_fas'))
 for ca in cas:
     print('Course:', ca.course_code)
-    fa = FacultyAssignment.objects.filter(course_allocation=ca).order_by('-assigned_on').first()
+    fa = ca._fas[0] if ca._fas else None
     if not fa:
         print('  No assignment')
         continue
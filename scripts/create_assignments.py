@@ -29,48 +29,81 @@ SEMESTER = '3'
 branch = Branch.objects.get(pk=BRANCH_PK)
 print('Branch:', branch)
 
-hod_qs = HODAssignment.objects.filter(branch=branch)
-if not hod_qs.exists():
+hod_assignment = HODAssignment.objects.filter(branch=branch).select_related('hod_user').first()
+if hod_assignment is None:
     print('No HODAssignment found for branch', branch)
     raise SystemExit(1)
 
-hod_assignment = hod_qs.first()
 print('Using HODAssignment for', hod_assignment.hod_user)
 
-# Look for SchemeCourse rows either linked via scheme__branch or direct branch field
-sc_qs = SchemeCourse.objects.filter(branch=branch, year=YEAR, semester=SEMESTER)
-if not sc_qs.exists():
-    sc_qs = SchemeCourse.objects.filter(scheme__branch=branch, year=YEAR, semester=SEMESTER)
+# Look for SchemeCourse rows either linked via scheme__branch or direct branch field; each filter is
+# evaluated once into a list, which serves as the emptiness check, the count and the rows to process
+sc_rows = list(SchemeCourse.objects.filter(branch=branch, year=YEAR, semester=SEMESTER).select_related('faculty'))
+if not sc_rows:
+    sc_rows = list(SchemeCourse.objects.filter(scheme__branch=branch, year=YEAR, semester=SEMESTER).select_related('faculty'))
 
-print('Found SchemeCourse rows:', sc_qs.count())
+print('Found SchemeCourse rows:', len(sc_rows))
 created_alloc = 0
 created_fa = 0
 updated_fa = 0
 
-for sc in sc_qs:
-    code = sc.course_code
-    title = getattr(sc, 'course_title', '') or ''
-    defaults = {'course_title': title, 'course_category': getattr(sc, 'category', '') or ''}
-    ca, ca_created = CourseAllocation.objects.get_or_create(hod_assignment=hod_assignment, course_code=code, defaults=defaults)
-    if ca_created:
+# Collect the allocation and faculty per course code; the first row defines an allocation (as with
+# get_or_create) and the last row with a faculty wins (as with update_or_create)
+sc_by_code = {}
+assigned_users = {}
+for sc in sc_rows:
+    sc_by_code.setdefault(sc.course_code, sc)
+    if sc.faculty_id:
+        assigned_users[sc.course_code] = sc.faculty
+
+# CourseAllocations: one lookup of the HOD's existing codes, one batched INSERT for the rest
+existing_codes = set(CourseAllocation.objects.filter(hod_assignment=hod_assignment).values_list('course_code', flat=True))
+to_create = [
+    CourseAllocation(hod_assignment=hod_assignment, course_code=code,
+                     course_title=sc.course_title or '', course_category=sc.category or '')
+    for code, sc in sc_by_code.items() if code not in existing_codes
+]
+# course_code is unique across HODs, so codes already allocated elsewhere are skipped, not fatal
+CourseAllocation.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+allocs = CourseAllocation.objects.filter(hod_assignment=hod_assignment, course_code__in=list(sc_by_code)).in_bulk(field_name='course_code')
+for code in sc_by_code:
+    if code not in allocs:
+        print('Skipped CourseAllocation (code allocated to another HOD):', code)
+    elif code in existing_codes:
+        print('Existing CourseAllocation:', code, 'pk', allocs[code].pk)
+    else:
         created_alloc += 1
-        print('Created CourseAllocation:', code, 'pk', ca.pk)
+        print('Created CourseAllocation:', code, 'pk', allocs[code].pk)
+
+# Faculty profiles: create the missing ones in one batch
+assigned = {code: user for code, user in assigned_users.items() if code in allocs}
+user_ids = {user.pk for user in assigned.values()}
+profiles = {f.user_id: f for f in Faculty.objects.filter(user_id__in=user_ids)}
+Faculty.objects.bulk_create([Faculty(user=user) for user in assigned.values() if user.pk not in profiles],
+                            batch_size=500, ignore_conflicts=True)
+profiles = {f.user_id: f for f in Faculty.objects.filter(user_id__in=user_ids)}
+
+# FacultyAssignments: the latest assignment of an allocation is updated, otherwise one is created
+existing_fa = {}
+for fa in FacultyAssignment.objects.filter(course_allocation__in=[allocs[code] for code in assigned]).order_by('assigned_on', 'pk'):
+    existing_fa[fa.course_allocation_id] = fa
+
+now = timezone.now()
+fa_to_create, fa_to_update = [], []
+for code, user in assigned.items():
+    faculty_profile = profiles[user.pk]
+    fa = existing_fa.get(allocs[code].pk)
+    if fa is None:
+        fa_to_create.append(FacultyAssignment(course_allocation=allocs[code], faculty=faculty_profile, assigned_on=now))
+        print('Created FacultyAssignment for', code, '->', faculty_profile)
     else:
-        print('Existing CourseAllocation:', code, 'pk', ca.pk)
-
-    # Create/update FacultyAssignment if SchemeCourse has faculty set
-    if getattr(sc, 'faculty', None):
-        user = sc.faculty
-        faculty_profile, _ = Faculty.objects.get_or_create(user=user)
-        fa, fa_created = FacultyAssignment.objects.update_or_create(
-            course_allocation=ca,
-            defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
-        )
-        if fa_created:
-            created_fa += 1
-            print('Created FacultyAssignment for', code, '->', faculty_profile)
-        else:
-            updated_fa += 1
-            print('Updated FacultyAssignment for', code, '->', faculty_profile)
+        fa.faculty = faculty_profile
+        fa.assigned_on = now
+        fa_to_update.append(fa)
+        print('Updated FacultyAssignment for', code, '->', faculty_profile)
+FacultyAssignment.objects.bulk_create(fa_to_create, batch_size=500)
+FacultyAssignment.objects.bulk_update(fa_to_update, ['faculty', 'assigned_on'], batch_size=500)
+created_fa = len(fa_to_create)
+updated_fa = len(fa_to_update)
 
 print('Summary: CourseAllocations created:', created_alloc, 'FacultyAssignments created:', created_fa, 'updated:', updated_fa)
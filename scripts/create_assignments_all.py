@@ -1,7 +1,8 @@
 """
 Create CourseAllocation and FacultyAssignment entries for all existing SchemeCourse rows.
 
-This is non-destructive: it uses get_or_create and update_or_create. It links allocations
+This is non-destructive: it only creates missing rows and re-points existing assignments, in
+batched queries rather than per-row get_or_create/update_or_create. It links allocations
 to the HODAssignment for the course's branch when available; if no HODAssignment exists
 for a branch the script will skip allocations for that branch and report them.
 
@@ -24,50 +25,75 @@ from hod.models import HODAssignment, CourseAllocation, FacultyAssignment, Schem
 from django.utils import timezone
 
 skipped_branches = set()
-created_alloc = 0
-created_fa = 0
-updated_fa = 0
 
-sc_qs = SchemeCourse.objects.all()
-print('Processing', sc_qs.count(), 'SchemeCourse rows')
+sc_rows = list(SchemeCourse.objects.select_related('faculty', 'scheme'))
+print('Processing', len(sc_rows), 'SchemeCourse rows')
 
-for sc in sc_qs:
-    # determine branch: prefer sc.branch else sc.scheme.branch
-    branch = getattr(sc, 'branch', None)
-    if not branch:
-        scheme = getattr(sc, 'scheme', None)
-        branch = getattr(scheme, 'branch', None) if scheme else None
+# Phase 1: resolve every branch's HODAssignment with one query instead of a lookup per row
+hod_by_branch = {h.branch_id: h for h in HODAssignment.objects.all()}
 
-    if not branch:
+# allocation key (hod pk, course code) -> (hod, SchemeCourse defining it); the first row wins, as with
+# get_or_create. assigned_users holds the faculty per key; the last row wins, as with update_or_create.
+sc_by_key = {}
+assigned_users = {}
+for sc in sc_rows:
+    # determine branch: prefer sc.branch else sc.scheme.branch
+    branch_id = sc.branch_id or (sc.scheme.branch_id if sc.scheme_id else None)
+    if not branch_id:
         # can't allocate without branch information
         continue
 
-    # find HODAssignment for branch
-    hod_qs = HODAssignment.objects.filter(branch=branch)
-    if not hod_qs.exists():
-        skipped_branches.add(branch.pk)
+    hod = hod_by_branch.get(branch_id)
+    if hod is None:
+        skipped_branches.add(branch_id)
         continue
-    hod = hod_qs.first()
+    sc_by_key.setdefault((hod.pk, sc.course_code), (hod, sc))
+    if sc.faculty_id:
+        assigned_users[(hod.pk, sc.course_code)] = sc.faculty
+
+# Phase 2: create the missing CourseAllocations in batches
+hod_ids = {hod_pk for hod_pk, _ in sc_by_key}
+existing_keys = set(CourseAllocation.objects.filter(hod_assignment_id__in=hod_ids)
+                    .values_list('hod_assignment_id', 'course_code'))
+to_create = [
+    CourseAllocation(hod_assignment=hod, course_code=sc.course_code,
+                     course_title=sc.course_title or '', course_category=sc.category or '')
+    for key, (hod, sc) in sc_by_key.items() if key not in existing_keys
+]
+# course_code is unique across HODs, so codes already allocated elsewhere are skipped, not fatal
+CourseAllocation.objects.bulk_create(to_create, batch_size=1000, ignore_conflicts=True)
+allocs = {(ca.hod_assignment_id, ca.course_code): ca
+          for ca in CourseAllocation.objects.filter(hod_assignment_id__in=hod_ids).only('id', 'hod_assignment_id', 'course_code')}
+created_alloc = len(set(allocs) - existing_keys)
+
+# Phase 3: create/update FacultyAssignment for rows that have a faculty set
+assigned = {key: user for key, user in assigned_users.items() if key in allocs}
+user_ids = {user.pk for user in assigned.values()}
+profiles = {f.user_id: f for f in Faculty.objects.filter(user_id__in=user_ids)}
+missing_users = {user.pk: user for user in assigned.values() if user.pk not in profiles}
+Faculty.objects.bulk_create([Faculty(user=user) for user in missing_users.values()], batch_size=1000, ignore_conflicts=True)
+profiles = {f.user_id: f for f in Faculty.objects.filter(user_id__in=user_ids)}
 
-    code = sc.course_code
-    title = getattr(sc, 'course_title', '') or ''
-    defaults = {'course_title': title, 'course_category': getattr(sc, 'category', '') or ''}
-    ca, ca_created = CourseAllocation.objects.get_or_create(hod_assignment=hod, course_code=code, defaults=defaults)
-    if ca_created:
-        created_alloc += 1
+# update_or_create semantics: the latest assignment of an allocation is updated, otherwise one is created
+existing_fa = {}
+for fa in FacultyAssignment.objects.filter(course_allocation_id__in=[allocs[key].pk for key in assigned]).order_by('assigned_on', 'pk'):
+    existing_fa[fa.course_allocation_id] = fa
 
-    # Create/update FacultyAssignment if SchemeCourse has faculty set
-    if getattr(sc, 'faculty', None):
-        user = sc.faculty
-        faculty_profile, _ = Faculty.objects.get_or_create(user=user)
-        fa, fa_created = FacultyAssignment.objects.update_or_create(
-            course_allocation=ca,
-            defaults={'faculty': faculty_profile, 'assigned_on': timezone.now()}
-        )
-        if fa_created:
-            created_fa += 1
-        else:
-            updated_fa += 1
+now = timezone.now()
+fa_to_create, fa_to_update = [], []
+for key, user in assigned.items():
+    ca = allocs[key]
+    fa = existing_fa.get(ca.pk)
+    if fa is None:
+        fa_to_create.append(FacultyAssignment(course_allocation=ca, faculty=profiles[user.pk], assigned_on=now))
+    else:
+        fa.faculty = profiles[user.pk]
+        fa.assigned_on = now
+        fa_to_update.append(fa)
+FacultyAssignment.objects.bulk_create(fa_to_create, batch_size=1000)
+FacultyAssignment.objects.bulk_update(fa_to_update, ['faculty', 'assigned_on'], batch_size=1000)
+created_fa = len(fa_to_create)
+updated_fa = len(fa_to_update)
 
 print('Done. allocations created:', created_alloc, 'faculty assignments created:', created_fa, 'updated:', updated_fa)
 if skipped_branches:
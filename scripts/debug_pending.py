@@ -6,6 +6,9 @@ from django.utils import timezone
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'syllabus_maker.settings')
 django.setup()
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, NullIf
 from academics.models import Branch, CollegeLevelCourse
 from hod.models import FacultySyllabusPDF
 
@@ -28,34 +31,27 @@ pending_qs = FacultySyllabusPDF.objects.filter(branch=branch, approved=False, re
 for p in pending_qs.order_by('-created_at'):
     print('order by -created_at:', p.pk, p.created_at)
 
-all_pending = list(pending_qs.select_related('created_by', 'course', 'branch').order_by('-created_at'))
-print('all_pending initial list pks:', [p.pk for p in all_pending])
-
-# sort_key emulation
-
-def sort_key(submission):
-    try:
-        sub_year = int(submission.year) if submission.year else 0
-        sub_sem = int(submission.semester) if submission.semester else 0
-    except Exception:
-        sub_year = 0
-        sub_sem = 0
-    return (sub_year, sub_sem)
-
-all_pending.sort(key=sort_key)
-print('all_pending after sort key pks:', [p.pk for p in all_pending])
-
-latest_per_course = {}
-for submission in all_pending:
-    cid = submission.course_id
-    if not cid:
-        continue
-    existing = latest_per_course.get(cid)
-    try:
-        if not existing or (hasattr(submission, 'created_at') and hasattr(existing, 'created_at') and submission.created_at > existing.created_at):
-            latest_per_course[cid] = submission
-    except Exception:
-        latest_per_course[cid] = submission
+# sort_key emulation, done by the database: year/semester are cast to integers (blank -> 0)
+# and ordered ahead of -created_at instead of re-sorting the fetched list in Python
+all_pending = list(
+    pending_qs.select_related('created_by', 'course', 'branch')
+    .annotate(
+        _yr=Coalesce(Cast(NullIf('year', Value('')), IntegerField()), 0),
+        _sem=Coalesce(Cast(NullIf('semester', Value('')), IntegerField()), 0),
+    )
+    .order_by('_yr', '_sem', '-created_at')
+)
+print('all_pending sorted pks:', [p.pk for p in all_pending])
+
+# newest pending submission per course, picked by the database: DISTINCT ON where supported,
+# otherwise a correlated subquery for the newest pk of each course
+with_course = pending_qs.filter(course__isnull=False)
+if connection.features.can_distinct_on_fields:
+    latest_qs = with_course.order_by('course_id', '-created_at').distinct('course_id')
+else:
+    newest = with_course.filter(course_id=OuterRef('course_id')).order_by('-created_at', '-pk').values('pk')[:1]
+    latest_qs = with_course.filter(pk=Subquery(newest))
+latest_per_course = {submission.course_id: submission for submission in latest_qs}
 
 print('latest_per_course pks:', {k: v.pk for k, v in latest_per_course.items()})
 
@@ -5,146 +5,228 @@ Run with project virtualenv Python: .\syllabusmaker\Scripts\python.exe scripts\i
 """
 import os
 import re
-import sys
-from pathlib import Path
+from datetime import datetime
 
-# Ensure DJANGO_SETTINGS_MODULE points to the project's settings
-# Ensure project root is on sys.path so Django settings can be imported when
-# this script is run from the `scripts/` directory.
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+# project root on sys.path, settings module and django.setup()
+from _bootstrap import PROJECT_ROOT
 
-# Ensure DJANGO_SETTINGS_MODULE points to the project's settings
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'syllabus_maker.settings')
-
-import django
-django.setup()
+try:
+    # optional: matches every course code against a filename in a single pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from django.conf import settings
 from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
 from hod.models import FacultySyllabusPDF
 from academics.models import CollegeLevelCourse, Branch
 
-MEDIA_ROOT = getattr(settings, 'MEDIA_ROOT', os.path.join(Path(__file__).resolve().parents[1], 'media'))
+MEDIA_ROOT = getattr(settings, 'MEDIA_ROOT', os.path.join(PROJECT_ROOT, 'media'))
 SOURCEDIRS = [os.path.join(MEDIA_ROOT, 'syllabus_pdfs')]
 
+# Filename heuristics, compiled once rather than looked up in the re cache per file
+_RE_YEAR4 = re.compile(r"20\d{2}")
+_RE_YEAR2 = re.compile(r'^(\d{2})')
+_RE_SEM = re.compile(r'[sS]em(?:ester)?[_ -]?([0-9])')
+_RE_S = re.compile(r'_S([0-9])')
+# letters next to digits, as in course codes like 23IS503 or 23NYP
+_RE_HAS_CODE_PREFIX = re.compile(r'(?i)[A-Z]{1,4}\d|\d{2}[A-Z]')
+
+# two-digit years up to next year are read as 20yy
+cur_yy = datetime.now().year % 100
+
+# subdirectories never holding importable PDFs; hidden directories are skipped too
+_SKIP_DIRS = {'__pycache__', 'thumbnails'}
+
+
+def iter_pdfs(directory):
+    """Yield (path, name, lower-cased name) for every PDF under directory.
+
+    os.scandir's entries carry the file type from the directory listing, so unlike os.walk no
+    extra stat is needed per entry. Unreadable directories are skipped, as os.walk does, and
+    hidden or _SKIP_DIRS subdirectories are not descended into.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS:
+                yield from iter_pdfs(entry.path)
+        else:
+            name_lower = entry.name.lower()
+            if name_lower.endswith('.pdf') and entry.is_file():
+                yield entry.path, entry.name, name_lower
+
+# Candidate course codes, loaded once for the whole walk (longest-first to avoid partial matches)
+course_qs = CollegeLevelCourse.objects.filter(is_deleted=False) if hasattr(CollegeLevelCourse, 'is_deleted') else CollegeLevelCourse.objects.all()
+courses = list(course_qs.select_related('branch').only('pk', 'course_code', 'semester', 'branch'))
+codes_sorted = sorted((c.course_code for c in courses if c.course_code), key=len, reverse=True)
+# lower-cased once here rather than per (file, code) pair in the scan
+codes_lower = [code.lower() for code in codes_sorted]
+# A filename can only contain a code if it contains what the code itself matches, so when every code
+# matches _RE_HAS_CODE_PREFIX, filenames without a match skip the code search altogether
+codes_need_prefix = all(_RE_HAS_CODE_PREFIX.search(code_lc) for code_lc in codes_lower)
+code_to_course = {}
+for c in courses:
+    if c.course_code:
+        code_to_course.setdefault(c.course_code.lower(), c)
+
+# With pyahocorasick installed, one automaton over all codes replaces the per-code substring scan.
+# Each code stores (length, -rank) so the longest code wins and ties go to the earlier code, as in the scan.
+code_automaton = None
+if ahocorasick is not None and codes_sorted:
+    code_automaton = ahocorasick.Automaton()
+    for rank, (code, code_lc) in enumerate(zip(codes_sorted, codes_lower)):
+        if code_lc not in code_automaton:
+            code_automaton.add_word(code_lc, (len(code), -rank, code_lc))
+    code_automaton.make_automaton()
+
 created = 0
 skipped = 0
 errors = 0
 candidates = 0
+update_existing = os.environ.get('UPDATE_EXISTING') == '1'
 
+# First pass: collect the PDFs on disk (paths relative to MEDIA_ROOT)
+found = []
 for sourcedir in SOURCEDIRS:
     if not os.path.isdir(sourcedir):
         print(f"Source dir not found, skipping: {sourcedir}")
         continue
 
-    for root, dirs, files in os.walk(sourcedir):
-        for fname in files:
-            if not fname.lower().endswith('.pdf'):
-                continue
-            candidates += 1
-            abs_path = os.path.join(root, fname)
-            # relative path under MEDIA_ROOT
-            rel_path = os.path.relpath(abs_path, MEDIA_ROOT).replace('\\', '/')
-
-            # Skip if already exists (check by file name)
-            qs = FacultySyllabusPDF.objects.filter(pdf_file=rel_path)
-            update_existing = os.environ.get('UPDATE_EXISTING') == '1'
-            if qs.exists() and not update_existing:
-                skipped += 1
-                continue
-
-            # Heuristics to infer course, branch, year and semester from filename
-            year = None
-            semester = None
-            matched_course = None
-
-            # Prefer 4-digit year like 2025
-            m_year = re.search(r"20\d{2}", fname)
-            if m_year:
-                year = m_year.group(0)
-            else:
-                # Try two-digit year at start (e.g. '23NYP' -> 2023/2025 ambiguous)
-                m2 = re.match(r'^(\d{2})', fname)
-                if m2:
-                    yy = int(m2.group(1))
-                    # map to 2000s; if yy <= current year % 100 + 1 assume 2000+yy
-                    from datetime import datetime
-                    cur_yy = datetime.now().year % 100
-                    century = 2000 if yy <= cur_yy + 1 else 1900
-                    year = str(century + yy)
-
-            # semester: look for 'sem' or '_S' tokens
-            m_sem = re.search(r'[sS]em(?:ester)?[_ -]?([0-9])', fname)
-            if not m_sem:
-                m_sem = re.search(r'_S([0-9])', fname)
-            if m_sem:
-                semester = m_sem.group(1)
-
-            # Attempt to match a CollegeLevelCourse code inside filename
-            # Build a list of candidate course codes (longest-first to avoid partial matches)
-            course_qs = CollegeLevelCourse.objects.filter(is_deleted=False) if hasattr(CollegeLevelCourse, 'is_deleted') else CollegeLevelCourse.objects.all()
-            codes = [c.course_code for c in course_qs]
-            codes_sorted = sorted(codes, key=lambda s: -len(s))
-            fname_lower = fname.lower()
-            for code in codes_sorted:
-                if not code:
-                    continue
-                if code.lower() in fname_lower:
-                    try:
-                        matched_course = course_qs.get(course_code=code)
-                        break
-                    except Exception:
-                        matched_course = None
-                        continue
-
-            # If course found, set branch & semester from it when available
-            branch_obj = None
-            if matched_course:
-                branch_obj = matched_course.branch if getattr(matched_course, 'branch', None) else None
-                if hasattr(matched_course, 'semester') and matched_course.semester:
-                    semester = str(matched_course.semester)
-
-            try:
-                if qs.exists():
-                    instance = qs.first()
-                    # update missing metadata if any
-                    changed = False
-                    if (not instance.year or instance.year.strip() == '') and year:
-                        instance.year = year
-                        changed = True
-                    if (not instance.semester or instance.semester.strip() == '') and semester:
-                        instance.semester = semester
-                        changed = True
-                    if (not instance.branch) and branch_obj:
-                        instance.branch = branch_obj
-                        changed = True
-                    if (not instance.course) and matched_course:
-                        instance.course = matched_course
-                        changed = True
-                    if changed:
-                        instance.save()
-                        print(f"Updated metadata for existing: {rel_path} -> pk={instance.pk} (year={instance.year} sem={instance.semester})")
-                        created += 1
-                    else:
-                        skipped += 1
-                else:
-                    # create empty instance first
-                    instance = FacultySyllabusPDF.objects.create(
-                        year=year or '',
-                        semester=semester or '',
-                        branch=branch_obj,
-                        course=matched_course,
-                    )
-                    # assign existing file (do NOT re-upload; set name directly)
-                    instance.pdf_file.name = rel_path
-                    instance.save()
-                    created += 1
-                    print(f"Imported: {rel_path} -> pk={instance.pk} (year={year} sem={semester} course={getattr(matched_course,'course_code',None)})")
-            except Exception as e:
-                errors += 1
-                print(f"ERROR importing {rel_path}: {e}")
+    for abs_path, fname, fname_lower in iter_pdfs(sourcedir):
+        candidates += 1
+        # relative path under MEDIA_ROOT
+        rel_path = os.path.relpath(abs_path, MEDIA_ROOT).replace('\\', '/')
+        found.append((rel_path, fname, fname_lower))
+
+# Rows already recorded for those files (checked by file name), fetched in batches instead of
+# an exists()/first() pair per file; the lowest pk wins when a file was recorded twice
+existing = {}
+rel_paths = [rel_path for rel_path, _, _ in found]
+for i in range(0, len(rel_paths), 500):
+    for row in (FacultySyllabusPDF.objects.filter(pdf_file__in=rel_paths[i:i + 500])
+                .values('pk', 'pdf_file', 'year', 'semester', 'branch_id', 'course_id').order_by('pk')):
+        existing.setdefault(row['pdf_file'], row)
+
+to_create = []
+to_update = []
+now = timezone.now()
+for rel_path, fname, fname_lower in found:
+    row = existing.get(rel_path)
+    if row and not update_existing:
+        skipped += 1
+        continue
+
+    # Heuristics to infer course, branch, year and semester from filename
+    year = None
+    semester = None
+    matched_course = None
+
+    # Prefer 4-digit year like 2025
+    m_year = _RE_YEAR4.search(fname)
+    if m_year:
+        year = m_year.group(0)
+    else:
+        # Try two-digit year at start (e.g. '23NYP' -> 2023/2025 ambiguous)
+        m2 = _RE_YEAR2.match(fname)
+        if m2:
+            yy = int(m2.group(1))
+            # map to 2000s; if yy <= current year % 100 + 1 assume 2000+yy
+            century = 2000 if yy <= cur_yy + 1 else 1900
+            year = str(century + yy)
+
+    # semester: look for 'sem' or '_S' tokens
+    m_sem = _RE_SEM.search(fname)
+    if not m_sem:
+        m_sem = _RE_S.search(fname)
+    if m_sem:
+        semester = m_sem.group(1)
+
+    # Attempt to match a CollegeLevelCourse code inside filename
+    may_have_code = not codes_need_prefix or _RE_HAS_CODE_PREFIX.search(fname_lower)
+    if may_have_code and code_automaton is not None:
+        hits = [value for _, value in code_automaton.iter(fname_lower)]
+        if hits:
+            matched_course = code_to_course[max(hits)[2]]
+    elif may_have_code:
+        for code_lc in codes_lower:
+            if code_lc in fname_lower:
+                matched_course = code_to_course[code_lc]
+                break
+
+    # If course found, set branch & semester from it when available
+    branch_obj = None
+    if matched_course:
+        branch_obj = matched_course.branch if getattr(matched_course, 'branch', None) else None
+        if hasattr(matched_course, 'semester') and matched_course.semester:
+            semester = str(matched_course.semester)
+
+    if row:
+        # update missing metadata if any; written with one bulk_update after the loop
+        instance = FacultySyllabusPDF(pk=row['pk'], year=row['year'], semester=row['semester'],
+                                      branch_id=row['branch_id'], course_id=row['course_id'], updated_at=now)
+        changed = False
+        if (not instance.year or instance.year.strip() == '') and year:
+            instance.year = year
+            changed = True
+        if (not instance.semester or instance.semester.strip() == '') and semester:
+            instance.semester = semester
+            changed = True
+        if (not instance.branch_id) and branch_obj:
+            instance.branch = branch_obj
+            changed = True
+        if (not instance.course_id) and matched_course:
+            instance.course = matched_course
+            changed = True
+        if changed:
+            to_update.append(instance)
+            print(f"Updated metadata for existing: {rel_path} -> pk={instance.pk} (year={instance.year} sem={instance.semester})")
+        else:
+            skipped += 1
+        continue
+
+    # new row with the existing file assigned by name (do NOT re-upload); inserted with bulk_create below
+    instance = FacultySyllabusPDF(
+        year=year or '',
+        semester=semester or '',
+        branch=branch_obj,
+        course=matched_course,
+    )
+    instance.pdf_file.name = rel_path
+    to_create.append(instance)
+
+# All writes commit together in one transaction; each batch of 500 runs in its own savepoint so a
+# failing batch is rolled back and counted as errors without undoing the others
+with transaction.atomic():
+    for i in range(0, len(to_create), 500):
+        batch = to_create[i:i + 500]
+        try:
+            with transaction.atomic():
+                FacultySyllabusPDF.objects.bulk_create(batch)
+        except Exception as e:
+            errors += len(batch)
+            print(f"ERROR importing {len(batch)} new files: {e}")
+            continue
+        created += len(batch)
+        for instance in batch:
+            print(f"Imported: {instance.pdf_file.name} -> pk={instance.pk} (year={instance.year} sem={instance.semester} course={getattr(instance.course,'course_code',None)})")
+
+    for i in range(0, len(to_update), 500):
+        batch = to_update[i:i + 500]
+        try:
+            with transaction.atomic():
+                FacultySyllabusPDF.objects.bulk_update(batch, ['year', 'semester', 'branch', 'course', 'updated_at'])
+        except Exception as e:
+            errors += len(batch)
+            print(f"ERROR updating metadata of {len(batch)} existing files: {e}")
+            continue
+        created += len(batch)
 
 print("\nSummary:")
 print(f"  Candidates scanned: {candidates}")
@@ -3,14 +3,10 @@ Inspect CourseAllocation and FacultyAssignment rows for a given branch/year/seme
 Adjust BRANCH_PK YEAR SEMESTER constants below.
 Run with project virtualenv Python.
 """
-from pathlib import Path
-import os
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in os.sys.path:
-    os.sys.path.insert(0, str(PROJECT_ROOT))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'syllabus_maker.settings')
-import django
-django.setup()
+# project root on sys.path, settings module and django.setup()
+import _bootstrap  # noqa: F401
+
+from django.db.models import Prefetch
 
 from academics.models import Branch
 from hod.models import CourseAllocation, FacultyAssignment
@@ -22,15 +18,18 @@ SEMESTER = '3'
 branch = Branch.objects.get(pk=BRANCH_PK)
 print('Branch:', branch)
 
-# list course allocations for HODAssignment branch
-cas = CourseAllocation.objects.filter(hod_assignment__branch=branch)
-print('Total CourseAllocation for branch:', cas.count())
+# list course allocations for HODAssignment branch, with every allocation's assignments (newest first,
+# faculty and user joined) prefetched in one query instead of a count and a query per allocation
+latest_fa = FacultyAssignment.objects.select_related('faculty__user').order_by('-assigned_on')
+cas = list(CourseAllocation.objects.filter(hod_assignment__branch=branch).prefetch_related(
+    Prefetch('facultyassignment_set', queryset=latest_fa, to_attr='_fas')))
+print('Total CourseAllocation for branch:', len(cas))
 
 for ca in cas:
     print('---')
     print('CourseAllocation id:', ca.pk, 'code:', ca.course_code, 'title:', ca.course_title)
-    fas = FacultyAssignment.objects.filter(course_allocation=ca).order_by('-assigned_on')
-    print(' FacultyAssignment count:', fas.count())
+    fas = ca._fas
+    print(' FacultyAssignment count:', len(fas))
     for fa in fas:
         print('  FA id:', fa.pk, 'assigned_on:', fa.assigned_on, 'faculty (type):', type(fa.faculty), str(fa.faculty))
         # Try to print linked user if exists
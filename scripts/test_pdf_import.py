@@ -1,17 +1,11 @@
-import os
+import importlib
+import importlib.util
 import sys
 import traceback
 
-# Ensure project root is on path
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'syllabus_maker.settings')
-
 try:
-    import django
-    django.setup()
+    # project root on sys.path, settings module and django.setup()
+    import _bootstrap  # noqa: F401
 except Exception as e:
     print('DJANGO_SETUP_FAILED:', e)
     traceback.print_exc()
@@ -49,42 +43,27 @@ except Exception as e:
 s = None
 if Syllabus:
     try:
-        s = Syllabus.objects.first()
+        # the instance is passed to the generator, which reads its course and the course's branch
+        s = Syllabus.objects.select_related('course__branch').first()
         print('Syllabus instance:', bool(s))
     except Exception as e:
         print('QUERY_FAILED for Syllabus:', e)
         traceback.print_exc()
 
-# attempt to call whichever function we found
+# attempt to call whichever function we found; modules without a spec are skipped instead of
+# being imported just to fail
+CANDIDATE_MODULES = ['hod.pdf_generator', 'hod.views', 'academics.views', 'facultymodule.views']
 candidates = []
-try:
-    from hod.pdf_generator import generate_syllabus_pdf_buffer as gen1
-    candidates.append(('hod.pdf_generator', gen1))
-except Exception:
-    pass
-
-try:
-    from hod import views as hod_views_2
-    if hasattr(hod_views_2, 'generate_syllabus_pdf_buffer'):
-        candidates.append(('hod.views', hod_views_2.generate_syllabus_pdf_buffer))
-except Exception:
-    pass
-
-try:
-    from academics import views as acad_views
-    if hasattr(acad_views, 'generate_syllabus_pdf_buffer'):
-        candidates.append(('academics.views', acad_views.generate_syllabus_pdf_buffer))
-except Exception:
-    pass
-
-# also check this module path if present on sys.path
-try:
-    import importlib
-    mod = importlib.import_module('facultymodule.views')
-    if hasattr(mod, 'generate_syllabus_pdf_buffer'):
-        candidates.append(('facultymodule.views', mod.generate_syllabus_pdf_buffer))
-except Exception:
-    pass
+for dotted in CANDIDATE_MODULES:
+    if importlib.util.find_spec(dotted) is None:
+        continue
+    try:
+        mod = importlib.import_module(dotted)
+    except Exception:
+        continue
+    fn = getattr(mod, 'generate_syllabus_pdf_buffer', None)
+    if fn:
+        candidates.append((dotted, fn))
 
 if not candidates:
     print('NO_GENERATOR_CANDIDATES_FOUND')
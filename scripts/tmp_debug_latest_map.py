@@ -1,9 +1,13 @@
 from hod.models import FacultySyllabusPDF
 from academics.models import Branch
 from django.db.models import Q
+from django.db.models.functions import Lower
 from django.apps import apps
 import os
 
+CollegeLevelCourse = apps.get_model('academics', 'CollegeLevelCourse')
+SchemeCourse = apps.get_model('hod', 'SchemeCourse')
+
 branch = Branch.objects.get(pk=10)
 year = '2023'
 semester = '3'
@@ -14,42 +18,66 @@ if year:
 if semester:
     pdf_qs = pdf_qs.filter(Q(semester=str(semester)) | Q(semester__isnull=True) | Q(semester=''))
 print('pdf_qs count:', pdf_qs.count())
-latest_qs = pdf_qs.select_related('course', 'created_by').order_by('course_id', '-created_at')
+# only the columns read below, as named tuples: pdf_file comes back as the stored name rather than
+# a FieldFile, and course and created_by are never dereferenced, so no joins
+latest_qs = pdf_qs.order_by('course_id', '-created_at').values_list('pk', 'title', 'pdf_file', 'course_id', named=True)
 latest_map = {}
-for p in latest_qs:
-    cid = getattr(p, 'course_id', None)
-    if not cid:
-        code = None
-        if p.title and isinstance(p.title, str):
-            parts = p.title.split('_')
-            if parts:
-                code = parts[0]
-        if not code and getattr(p, 'pdf_file', None):
-            fname = getattr(p.pdf_file, 'name', '') or ''
-            fname_parts = os.path.basename(fname).split('_')
-            if fname_parts:
-                code = fname_parts[0]
-        if code:
-            try:
-                CollegeLevelCourse = apps.get_model('academics', 'CollegeLevelCourse')
-                resolved = CollegeLevelCourse.objects.filter(course_code__iexact=code).first()
-                if resolved:
-                    cid = f"course_{resolved.pk}"
-                    setattr(p, '_resolved_course', resolved)
-                else:
-                    try:
-                        SchemeCourse = apps.get_model('hod', 'SchemeCourse')
-                        sc = SchemeCourse.objects.filter(branch=branch, year=year, semester=semester, course_code__iexact=code).first()
-                        if sc:
-                            cid = f"scheme_{sc.pk}"
-                            setattr(p, '_resolved_course', sc)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+
+# First pass: the code of every PDF without a course, from its title or else its filename
+rows = list(latest_qs)
+codes = {}
+for p in rows:
+    if p.course_id:
+        continue
+    code = None
+    if p.title and isinstance(p.title, str):
+        parts = p.title.split('_')
+        if parts:
+            code = parts[0]
+    if not code and p.pdf_file:
+        fname_parts = os.path.basename(p.pdf_file).split('_')
+        if fname_parts:
+            code = fname_parts[0]
+    if code:
+        codes[p.pk] = code
+
+# Resolve all codes with one query per model instead of two per PDF (codes match case-insensitively;
+# the first row per code wins, as with .first())
+needed_codes = {code.lower() for code in codes.values()}
+college_map = {}
+scheme_map = {}
+if needed_codes:
+    try:
+        for c in (CollegeLevelCourse.objects.only('pk', 'course_code', 'course_title')
+                  .annotate(code_lc=Lower('course_code')).filter(code_lc__in=needed_codes)):
+            college_map.setdefault(c.code_lc, c)
+    except Exception:
+        pass
+    try:
+        for sc in (SchemeCourse.objects.filter(branch=branch, year=year, semester=semester)
+                   .annotate(code_lc=Lower('course_code')).filter(code_lc__in=needed_codes).order_by('pk')):
+            scheme_map.setdefault(sc.code_lc, sc)
+    except Exception:
+        pass
+
+# Second pass: map each course to its latest PDF
+resolved_course = {}
+for p in rows:
+    cid = p.course_id
+    code = codes.get(p.pk)
+    if not cid and code:
+        resolved = college_map.get(code.lower())
+        if resolved:
+            cid = f"course_{resolved.pk}"
+            resolved_course[p.pk] = resolved
+        else:
+            sc = scheme_map.get(code.lower())
+            if sc:
+                cid = f"scheme_{sc.pk}"
+                resolved_course[p.pk] = sc
     if cid and cid not in latest_map:
         latest_map[cid] = p
 
 print('mapped keys count', len(latest_map))
 for k, v in latest_map.items():
-    print('key:', k, 'pdf pk:', v.pk, 'title:', v.title, 'course_id:', getattr(v, 'course_id', None), 'resolved:', getattr(v, '_resolved_course', None))
+    print('key:', k, 'pdf pk:', v.pk, 'title:', v.title, 'course_id:', v.course_id, 'resolved:', resolved_course.get(v.pk))
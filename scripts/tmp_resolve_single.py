@@ -2,23 +2,25 @@ from hod.models import FacultySyllabusPDF
 from academics.models import Branch
 from django.apps import apps
 import os
+CollegeLevelCourse = apps.get_model('academics','CollegeLevelCourse')
+SchemeCourse = apps.get_model('hod','SchemeCourse')
 branch = Branch.objects.get(pk=10)
-for p in FacultySyllabusPDF.objects.filter(branch=branch).order_by('-created_at'):
+# the prefix is filtered in SQL and the rows streamed in chunks as named tuples (pdf_file is the stored
+# name, not a FieldFile); the Python check stays because startswith is case-insensitive on SQLite
+for p in (FacultySyllabusPDF.objects.filter(branch=branch, title__startswith='23IS503').order_by('-created_at')
+          .values_list('pk', 'title', 'pdf_file', named=True).iterator(chunk_size=500)):
     if p.title and p.title.startswith('23IS503'):
         code = None
         if p.title and isinstance(p.title, str):
             parts = p.title.split('_')
             if parts:
                 code = parts[0]
-        if not code and getattr(p,'pdf_file',None):
-            fname = getattr(p.pdf_file,'name','') or ''
-            fname_parts = os.path.basename(fname).split('_')
+        if not code and p.pdf_file:
+            fname_parts = os.path.basename(p.pdf_file).split('_')
             if fname_parts:
                 code = fname_parts[0]
         print('PDF', p.pk, 'title', p.title, 'code', code)
-        CollegeLevelCourse = apps.get_model('academics','CollegeLevelCourse')
-        resolved = CollegeLevelCourse.objects.filter(course_code__iexact=code).first()
+        resolved = CollegeLevelCourse.objects.filter(course_code__iexact=code).only('pk').first()
         print('  college resolved:', bool(resolved), getattr(resolved,'pk',None))
-        SchemeCourse = apps.get_model('hod','SchemeCourse')
-        sc = SchemeCourse.objects.filter(branch=branch, year='2023', semester='3', course_code__iexact=code).first()
+        sc = SchemeCourse.objects.filter(branch=branch, year='2023', semester='3', course_code__iexact=code).only('pk').first()
         print('  scheme resolved:', bool(sc), getattr(sc,'pk',None))
@@ -166,4 +166,13 @@ AUTHENTICATION_BACKENDS = [
 ]
 AUTH_USER_MODEL = 'users.CustomUser'   # your custom user model
 LOGIN_URL = 'users:login'              # used by @login_required
-LOGIN_REDIRECT_URL = 'home'            # after login redirect
\ No newline at end of file
+LOGIN_REDIRECT_URL = 'home'            # after login redirect
+
+# Number of worker processes used to build scheme PDFs in hod.create_scheme_quick (0 = build in the request thread)
+HOD_PDF_WORKERS = int(os.environ.get('HOD_PDF_WORKERS', '0'))
+
+# Threads used to regenerate stored scheme PDFs in the background in hod.regenerate_scheme (0 = regenerate in the request)
+HOD_PDF_REGEN_THREADS = int(os.environ.get('HOD_PDF_REGEN_THREADS', '0'))
+
+# Threads used to parse the faculty PDFs merged by hod.generate_combined_syllabus (0 = parse them in turn)
+HOD_PDF_READ_THREADS = int(os.environ.get('HOD_PDF_READ_THREADS', '0'))